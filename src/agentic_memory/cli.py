@@ -37,7 +37,7 @@ import os
 import sys
 import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 import neo4j
 
@@ -52,7 +52,6 @@ from agentic_memory.ingestion.typescript_call_analyzer import (
     TypeScriptCallAnalyzer,
     TypeScriptCallAnalyzerError,
 )
-from agentic_memory.ingestion.watcher import start_continuous_watch
 from agentic_memory.product.state import ProductStateStore
 from agentic_memory.config import (
     CONFIG_DIR_NAME,
@@ -69,6 +68,19 @@ from agentic_memory.trace.service import TraceExecutionService
 PRIMARY_CLI_NAME = "agent-memory"
 
 
+def start_continuous_watch(**kwargs: Any) -> None:
+    """Run the repository watcher.
+
+    The watcher pulls in ``watchdog`` and its observer backends, which only
+    ``watch`` needs, so the import is deferred until the command actually runs.
+    """
+    from agentic_memory.ingestion.watcher import (  # noqa: PLC0415
+        start_continuous_watch as _start_continuous_watch,
+    )
+
+    _start_continuous_watch(**kwargs)
+
+
 def _configure_stdio_for_utf8() -> None:
     """Force UTF-8 stdio when the runtime supports stream reconfiguration.
 
@@ -95,6 +107,9 @@ def _command_example(*parts: str) -> str:
     return " ".join([PRIMARY_CLI_NAME, *parts]).strip()
 
 
+_RULE = "━" * 63
+
+
 def print_banner():
     """Print the Agentic Memory banner."""
     print(r"""
@@ -113,6 +128,26 @@ def print_banner():
     """)
 
 
+def _show_decorations(args: Any = None) -> bool:
+    """Return whether banners and rule lines should be printed.
+
+    Decorative output is only useful on an interactive terminal; when stdout is
+    piped (CI, agents) or ``--quiet`` is set it is skipped entirely.
+    """
+    if getattr(args, "quiet", False):
+        return False
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+
+def _print_section(title: str, args: Any = None, *, lead: str = "\n") -> None:
+    """Print a wizard step heading, framed by rule lines on a terminal."""
+    if _show_decorations(args):
+        print(f"{lead}{_RULE}\n{title}\n{_RULE}\n")
+    else:
+        print(f"{lead}{title}\n")
+
+
 def _load_repo_env(repo_root: Optional[Path], env_file_arg: Optional[str] = None) -> None:
     """Load Agentic Memory runtime env vars from an explicit or namespaced file.
 
@@ -339,8 +374,13 @@ def _build_code_graph_builder(
     ignore_dirs: Optional[set[str]] = None,
     ignore_files: Optional[set[str]] = None,
     ignore_patterns: Optional[set[str]] = None,
+    query_only: bool = False,
 ) -> KnowledgeGraphBuilder:
-    """Create a code-domain graph builder using repo-aware embedding config."""
+    """Create a code-domain graph builder using repo-aware embedding config.
+
+    Pass ``query_only=True`` from commands that only read the graph so the
+    builder skips ingestion-side setup such as tree-sitter parsers.
+    """
     neo4j_cfg = config.get_neo4j_config()
     return KnowledgeGraphBuilder(
         uri=neo4j_cfg["uri"],
@@ -352,6 +392,7 @@ def _build_code_graph_builder(
         ignore_dirs=ignore_dirs,
         ignore_files=ignore_files,
         ignore_patterns=ignore_patterns,
+        query_only=query_only,
     )
 
 
@@ -409,6 +450,42 @@ def _prompt_defaulted_value(prompt: str, default: str) -> str:
     return input(f"{prompt} (default: {default}): ").strip() or default
 
 
+def _init_from_json(config: Config, source: str) -> None:
+    """Save a config supplied as JSON instead of running the interactive wizard.
+
+    ``source`` is a file path, or ``-`` to read the whole blob from stdin in one
+    go. Used for scripted onboarding where answering prompts is impractical.
+    """
+    try:
+        if source == "-":
+            payload = json.load(sys.stdin)
+        else:
+            payload = json.loads(Path(source).expanduser().read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ Could not read config JSON from {source}: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not isinstance(payload, dict):
+        print(f"❌ Config JSON from {source} must be an object", file=sys.stderr)
+        sys.exit(1)
+    for section, default in DEFAULT_CONFIG.items():
+        if not isinstance(default, dict) or section not in payload:
+            continue
+        if payload[section] is None:
+            # ``null`` means "use the defaults" for that section.
+            del payload[section]
+        elif not isinstance(payload[section], dict):
+            print(
+                f"❌ Config JSON from {source}: '{section}' must be an object or null",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+    config.save(payload)
+    config.ensure_graphignore(payload.get("indexing", {}).get("ignore_dirs"))
+    print(f"✅ Configuration saved to: {config.config_file}")
+    print(f"✅ Ignore patterns saved to: {config.graphignore_file}")
+
+
 def cmd_init(args):
     """Initialize Agentic Memory in the current repository.
 
@@ -430,6 +507,11 @@ def cmd_init(args):
         )
         return
 
+    from_json = getattr(args, "from_json", None)
+    if from_json:
+        _init_from_json(config, from_json)
+        return
+
     if config.has_legacy_config():
         print("⚠️  Found a legacy CodeMemory config for this repository.")
         print(f"    Legacy config: {config.legacy_config_file}")
@@ -447,15 +529,14 @@ def cmd_init(args):
 
         print("\n➡️  Creating a new .agentic-memory config and leaving .codememory untouched.")
 
-    print_banner()
+    if _show_decorations(args):
+        print_banner()
     print(f"🚀 Initializing Agentic Memory in: {repo_root}\n")
 
     # ============================================================
     # Step 1: Neo4j Configuration
     # ============================================================
-    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    print("Step 1: Neo4j Database Configuration")
-    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+    _print_section("Step 1: Neo4j Database Configuration", args, lead="")
 
     print("Agentic Memory requires Neo4j 5.23+ with vector search support.")
     print("\nOptions:")
@@ -525,9 +606,7 @@ def cmd_init(args):
     # ============================================================
     # Step 2: Code Embedding Provider
     # ============================================================
-    print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    print("Step 2: Code Embedding Provider")
-    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+    _print_section("Step 2: Code Embedding Provider", args)
 
     print("By default, Agentic Memory uses Gemini for code embeddings.")
     print(
@@ -644,29 +723,28 @@ def cmd_init(args):
     # ============================================================
     # Step 3: Indexing Options
     # ============================================================
-    print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    print("Step 3: Indexing Options")
-    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+    _print_section("Step 3: Indexing Options", args)
 
     print("Supported file extensions (default: .py, .js, .ts, .tsx, .jsx)")
     extensions_input = input(
         "   Enter extensions (comma-separated, or press Enter for defaults): "
     ).strip()
+    indexing_config = DEFAULT_CONFIG["indexing"].copy()
     if extensions_input:
-        indexing_config = DEFAULT_CONFIG["indexing"].copy()
-        indexing_config["extensions"] = [
-            e.strip() if e.strip().startswith(".") else f".{e.strip()}"
-            for e in extensions_input.split(",")
-        ]
-    else:
-        indexing_config = DEFAULT_CONFIG["indexing"].copy()
+        # One pass: strip, force a single leading dot, lowercase, and dedupe.
+        # Sorting keeps the saved list canonical regardless of input order.
+        extensions = {
+            "." + ext.lstrip(".").lower()
+            for ext in (part.strip() for part in extensions_input.split(","))
+            if ext.strip(".")
+        }
+        if extensions:
+            indexing_config["extensions"] = sorted(extensions)
 
     # ============================================================
     # Step 4: Save Config
     # ============================================================
-    print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    print("Step 4: Save Configuration")
-    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+    _print_section("Step 4: Save Configuration", args)
 
     final_config = {
         "neo4j": neo4j_config,
@@ -698,12 +776,11 @@ def cmd_init(args):
     # ============================================================
     # Step 5: Test Connection & Initial Index
     # ============================================================
-    print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    print("Step 5: Test Connection & Initial Index")
-    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+    _print_section("Step 5: Test Connection & Initial Index", args)
 
     do_index = input("Run initial indexing now? [Y/n]: ").strip().lower()
     if do_index != "n":
+        builder = None
         try:
             indexing_cfg = config.get_indexing_config()
             ignore_dirs = set(indexing_cfg.get("ignore_dirs", []))
@@ -724,19 +801,9 @@ def cmd_init(args):
             builder.setup_database()
             print("✅ Neo4j connection successful!\n")
 
-            builder.close()
-
+            # Index with the same builder (and driver) the connection test used.
             print("📂 Starting initial indexing...")
-            builder = _build_code_graph_builder(
-                repo_root=repo_root,
-                config=config,
-                ignore_dirs=ignore_dirs,
-                ignore_files=ignore_files,
-                ignore_patterns=graphignore_patterns,
-            )
-
             metrics = builder.run_pipeline(repo_root, supported_extensions=extensions)
-            builder.close()
 
             print(f"\n✅ Indexing complete!")
             print(f"   Processed {metrics['embedding_calls']} entities")
@@ -746,13 +813,19 @@ def cmd_init(args):
             print(f"\n❌ Error during indexing: {e}")
             print(f"   Your config has been saved. You can index later with:")
             print(f"   {_command_example('index')}")
+        finally:
+            if builder is not None:
+                builder.close()
 
     # ============================================================
     # Done!
     # ============================================================
-    print("\n" + "━" * 67)
-    print("✅ Agentic Memory initialized successfully!")
-    print("━" * 67)
+    if _show_decorations(args):
+        print("\n" + "━" * 67)
+        print("✅ Agentic Memory initialized successfully!")
+        print("━" * 67)
+    else:
+        print("\n✅ Agentic Memory initialized successfully!")
     print(f"\nConfig file: {config.config_file}")
     print(f"\nNext steps:")
     print(f"  • {_command_example('status')}    - Show repository status")
@@ -777,87 +850,44 @@ def cmd_status(args):
     """
     repo_root, config = _resolve_repo_and_config(args, require_initialized=True)
 
-    if not _is_json_mode(args):
+    if not _is_json_mode(args) and not getattr(args, "quiet", False):
         print(f"📊 Agentic Memory Status")
-        print(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        if _show_decorations(args):
+            print(_RULE)
         print(f"Repository: {repo_root}")
         print(f"Config:     {config.config_file}")
 
     # Try to connect and get stats
     builder = None
     try:
-        builder = _build_code_graph_builder(repo_root=repo_root, config=config)
-
-        with builder.driver.session() as session:
-            scoped = not getattr(args, "global_status", False)
-            status_scope = "repository" if scoped else "global"
-
-            if scoped:
-                repo_id = str(repo_root)
-                files = session.run(
-                    "MATCH (f:File {repo_id: $repo_id}) RETURN count(f) as count",
-                    repo_id=repo_id,
-                ).single()["count"]
-                functions = session.run(
-                    "MATCH (fn:Function {repo_id: $repo_id}) RETURN count(fn) as count",
-                    repo_id=repo_id,
-                ).single()["count"]
-                classes = session.run(
-                    "MATCH (c:Class {repo_id: $repo_id}) RETURN count(c) as count",
-                    repo_id=repo_id,
-                ).single()["count"]
-                chunks = session.run(
-                    "MATCH (ch:Chunk {repo_id: $repo_id}) RETURN count(ch) as count",
-                    repo_id=repo_id,
-                ).single()["count"]
-                last_update = session.run(
-                    """
-                    MATCH (f:File {repo_id: $repo_id})
-                    RETURN max(f.last_updated) as last_updated
-                    """,
-                    repo_id=repo_id,
-                ).single()["last_updated"]
-            else:
-                files = session.run("MATCH (f:File) RETURN count(f) as count").single()["count"]
-                functions = session.run("MATCH (fn:Function) RETURN count(fn) as count").single()[
-                    "count"
-                ]
-                classes = session.run("MATCH (c:Class) RETURN count(c) as count").single()["count"]
-                chunks = session.run("MATCH (ch:Chunk) RETURN count(ch) as count").single()["count"]
-                last_update = session.run(
-                    """
-                    MATCH (f:File)
-                    RETURN max(f.last_updated) as last_updated
-                    """
-                ).single()["last_updated"]
-
-            stats = {
-                "scope": status_scope,
-                "files": files,
-                "functions": functions,
-                "classes": classes,
-                "chunks": chunks,
-                "last_sync": last_update,
-            }
-            if _emit_success(
-                args,
-                data={
-                    "repository": str(repo_root),
-                    "config": str(config.config_file),
-                    "stats": stats,
-                },
-                metrics={},
-            ):
-                return
+        builder = _build_code_graph_builder(repo_root=repo_root, config=config, query_only=True)
+
+        scoped = not getattr(args, "global_status", False)
+        status_scope = "repository" if scoped else "global"
+        if scoped:
+            counts = builder.get_index_stats(repo_id=str(repo_root))
+        else:
+            counts = builder.get_index_stats(global_scope=True)
+        stats = {"scope": status_scope, **counts}
+        if _emit_success(
+            args,
+            data={
+                "repository": str(repo_root),
+                "config": str(config.config_file),
+                "stats": stats,
+            },
+            metrics={},
+        ):
+            return
 
-            print(f"\n📈 Graph Statistics:")
-            print(f"   Scope:     {status_scope}")
-            print(f"   Files:     {files:,}")
-            print(f"   Functions: {functions:,}")
-            print(f"   Classes:   {classes:,}")
-            print(f"   Chunks:    {chunks:,}")
-            if last_update:
-                print(f"   Last sync: {last_update}")
+        print(f"\n📈 Graph Statistics:")
+        print(f"   Scope:     {status_scope}")
+        print(f"   Files:     {counts['files']:,}")
+        print(f"   Functions: {counts['functions']:,}")
+        print(f"   Classes:   {counts['classes']:,}")
+        print(f"   Chunks:    {counts['chunks']:,}")
+        if counts["last_sync"]:
+            print(f"   Last sync: {counts['last_sync']}")
 
     except (neo4j.exceptions.DatabaseError, neo4j.exceptions.ServiceUnavailable) as e:
         _exit_with_error(
@@ -883,6 +913,9 @@ def cmd_index(args):
     `--full` is the repo-scoped rebuild path for cases where the source files
     are unchanged but the derived corpus must be regenerated anyway, such as an
     embedding-model or embedding-format change.
+
+    `--bulk` rebuilds the code vector index once after Pass 2 instead of
+    updating it per chunk, which pays off on large first-time or full indexes.
     """
     repo_root, config = _resolve_repo_and_config(args, require_initialized=True)
 
@@ -905,11 +938,16 @@ def cmd_index(args):
         ignore_patterns=graphignore_patterns,
     )
 
+    pipeline_kwargs: dict[str, Any] = {}
+    if getattr(args, "bulk", False):
+        pipeline_kwargs["bulk_load"] = True
+
     try:
         metrics = builder.run_pipeline(
             repo_root,
             supported_extensions=extensions,
             full_reindex=getattr(args, "full", False),
+            **pipeline_kwargs,
         )
         if _emit_success(
             args,
@@ -1051,7 +1089,7 @@ def cmd_search(args):
             ],
         )
 
-    builder = _build_code_graph_builder(repo_root=repo_root, config=config)
+    builder = _build_code_graph_builder(repo_root=repo_root, config=config, query_only=True)
 
     try:
         results = builder.semantic_search(args.query, limit=args.limit)
@@ -1126,8 +1164,7 @@ def cmd_debug_ts_calls(args):
 
     parser = CodeParser()
     analyzer = TypeScriptCallAnalyzer()
-    code = full_path.read_text(encoding="utf8", errors="ignore")
-    parsed = parser.parse_file(code, extension)
+    parsed = parser.parse_file(full_path.read_bytes(), extension)
     request = {
         "path": rel_path,
         "functions": [
@@ -1254,8 +1291,7 @@ def cmd_debug_py_calls(args):
 
     parser = CodeParser()
     analyzer = PythonCallAnalyzer()
-    code = full_path.read_text(encoding="utf8", errors="ignore")
-    parsed = parser.parse_file(code, ".py")
+    parsed = parser.parse_file(full_path.read_bytes(), ".py")
     request = {
         "path": rel_path,
         "functions": [
@@ -1360,7 +1396,7 @@ def cmd_call_status(args):
 
     builder = None
     try:
-        builder = _build_code_graph_builder(repo_root=repo_root, config=config)
+        builder = _build_code_graph_builder(repo_root=repo_root, config=config, query_only=True)
         diagnostics = builder.get_call_diagnostics(repo_id=str(repo_root))
 
         if _emit_success(
@@ -1378,7 +1414,8 @@ def cmd_call_status(args):
             return
 
         print("📞 Call Graph Status")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        if _show_decorations(args):
+            print(_RULE)
         print(f"Repository: {repo_root}")
         print(f"Repo ID:    {diagnostics['repo_id']}")
         print()
@@ -1497,7 +1534,7 @@ def cmd_deps(args):
     """Show direct dependency relationships for a file."""
     repo_root, config = _resolve_repo_and_config(args, require_initialized=True)
 
-    builder = _build_code_graph_builder(repo_root=repo_root, config=config)
+    builder = _build_code_graph_builder(repo_root=repo_root, config=config, query_only=True)
 
     try:
         deps = builder.get_file_dependencies(args.path)
@@ -1549,7 +1586,7 @@ def cmd_impact(args):
     """Show transitive impact analysis for a file."""
     repo_root, config = _resolve_repo_and_config(args, require_initialized=True)
 
-    builder = _build_code_graph_builder(repo_root=repo_root, config=config)
+    builder = _build_code_graph_builder(repo_root=repo_root, config=config, query_only=True)
 
     try:
         result = builder.identify_impact(args.path, max_depth=args.max_depth)
@@ -1911,7 +1948,9 @@ def cmd_openclaw_setup(args: argparse.Namespace) -> None:
             },
         },
     }
-    config_path.write_text(f"{json.dumps(openclaw_config, indent=2)}\n", encoding="utf-8")
+    with config_path.open("w", encoding="utf-8") as config_file:
+        json.dump(openclaw_config, config_file, indent=2)
+        config_file.write("\n")
 
     memory_integration = store.upsert_integration(
         surface="openclaw_memory",
@@ -2404,6 +2443,24 @@ def cmd_chat_init(args: argparse.Namespace) -> None:
         conn.driver.close()
 
 
+def _read_jsonl_turns(lines: Iterable[str], location: str) -> list[Any]:
+    """Decode one chat turn per non-blank JSONL line, exiting on the first bad line."""
+    turns_raw = []
+    for line_num, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            turns_raw.append(json.loads(line))
+        except json.JSONDecodeError as e:
+            print(
+                f"chat-ingest: Invalid JSON on {location} {line_num}: {e}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+    return turns_raw
+
+
 def cmd_chat_ingest(args: argparse.Namespace) -> None:
     """Ingest conversation turns from a JSONL/JSON file or stdin.
 
@@ -2461,47 +2518,27 @@ def cmd_chat_ingest(args: argparse.Namespace) -> None:
     if source_path and source_path != "-":
         try:
             with open(source_path, encoding="utf-8") as f:
-                raw = f.read().strip()
+                # Peek at the first non-blank character to tell a JSON array
+                # from JSONL, then decode straight from the handle instead of
+                # holding the whole file (and its split lines) in memory.
+                first_char = f.read(1)
+                while first_char and first_char.isspace():
+                    first_char = f.read(1)
+                f.seek(0)
+                if first_char == "[":
+                    try:
+                        turns_raw = json.load(f)
+                    except json.JSONDecodeError as e:
+                        print(f"chat-ingest: Invalid JSON: {e}", file=sys.stderr)
+                        sys.exit(1)
+                else:
+                    turns_raw = _read_jsonl_turns(f, "line")
         except OSError as e:
             print(f"chat-ingest: Cannot open {source_path}: {e}", file=sys.stderr)
             sys.exit(1)
-
-        # Detect JSON array vs JSONL
-        if raw.startswith("["):
-            try:
-                turns_raw = json.loads(raw)
-            except json.JSONDecodeError as e:
-                print(f"chat-ingest: Invalid JSON: {e}", file=sys.stderr)
-                sys.exit(1)
-        else:
-            turns_raw = []
-            for line_num, line in enumerate(raw.splitlines(), start=1):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    turns_raw.append(json.loads(line))
-                except json.JSONDecodeError as e:
-                    print(
-                        f"chat-ingest: Invalid JSON on line {line_num}: {e}",
-                        file=sys.stderr,
-                    )
-                    sys.exit(1)
     else:
         # Stdin JSONL
-        turns_raw = []
-        for line_num, line in enumerate(sys.stdin, start=1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                turns_raw.append(json.loads(line))
-            except json.JSONDecodeError as e:
-                print(
-                    f"chat-ingest: Invalid JSON on stdin line {line_num}: {e}",
-                    file=sys.stderr,
-                )
-                sys.exit(1)
+        turns_raw = _read_jsonl_turns(sys.stdin, "stdin line")
 
     if not turns_raw:
         print("chat-ingest: No turns found in input.")
@@ -2937,9 +2974,20 @@ For more information, visit: https://github.com/jarmen423/agentic-memory
     init_parser = subparsers.add_parser(
         "init", help="Initialize Agentic Memory in current repository (interactive wizard)"
     )
+    init_parser.add_argument(
+        "--quiet", "-q", action="store_true", help="Skip the banner and section rules"
+    )
+    init_parser.add_argument(
+        "--from-json",
+        metavar="PATH",
+        help="Skip the wizard and save this JSON config file ('-' reads stdin)",
+    )
 
     # Command: status
     status_parser = subparsers.add_parser("status", help="Show repository status and statistics")
+    status_parser.add_argument(
+        "--quiet", "-q", action="store_true", help="Print only the graph statistics"
+    )
     status_parser.add_argument(
         "--global",
         dest="global_status",
@@ -2963,6 +3011,15 @@ For more information, visit: https://github.com/jarmen423/agentic-memory
             "re-embedded even if unchanged"
         ),
     )
+    index_parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help=(
+            "Drop the code vector index during chunk ingestion and rebuild it once "
+            "afterwards (faster for large first-time or --full indexes; semantic "
+            "search is unavailable while it runs)"
+        ),
+    )
     index_parser.add_argument(
         "--json",
         action="store_true",
@@ -37,10 +37,16 @@ See Also:
 import os
 import json
 import copy
+import functools
 import logging
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 CONFIG_DIR_NAME = ".agentic-memory"
@@ -145,6 +151,40 @@ DEFAULT_CONFIG = {
     },
 }
 
+# Serialized once so fresh default dicts come from ``json.loads``, which is
+# several times cheaper than ``copy.deepcopy`` on this all-JSON structure.
+_DEFAULT_CONFIG_JSON = json.dumps(DEFAULT_CONFIG)
+
+
+def _default_config() -> Dict[str, Any]:
+    """Return a fresh, independently mutable copy of :data:`DEFAULT_CONFIG`."""
+    config: Dict[str, Any] = json.loads(_DEFAULT_CONFIG_JSON)
+    return config
+
+
+def _loads_config(data: bytes) -> Dict[str, Any]:
+    """Decode ``config.json`` bytes, using ``orjson`` when it is installed."""
+    config: Dict[str, Any] = orjson.loads(data) if orjson is not None else json.loads(data)
+    return config
+
+
+def _dumps_config(payload: Dict[str, Any]) -> bytes:
+    """Encode a config payload as indented JSON, using ``orjson`` when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf8")
+
+
+@functools.lru_cache(maxsize=32)
+def _read_config_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse ``config.json`` once per ``(path, mtime, size)``.
+
+    Every ``Config`` getter goes through :meth:`Config.load`, so one command can
+    read the same file many times. Keying on the stat result means an edited
+    file is re-read on the next call. Callers must not mutate the result.
+    """
+    return _loads_config(Path(path).read_bytes())
+
 
 class Config:
     """Per-repository view of ``config.json``, graphignore, and env fallbacks.
@@ -178,18 +218,21 @@ class Config:
         self.legacy_config_file = self.legacy_config_dir / "config.json"
         self.graphignore_file = self.config_dir / ".graphignore"
         self.legacy_graphignore_file = self.legacy_config_dir / ".graphignore"
+        # Serialized merged config for the file state in ``_loaded_key`` (path, mtime, size).
+        self._loaded_json: Optional[str] = None
+        self._loaded_key: Optional[tuple[str, int, int]] = None
 
     def exists(self) -> bool:
         """Check if config exists for this repo."""
-        return self.config_file.exists() or self.legacy_config_file.exists()
+        return self.config_file.is_file() or self.legacy_config_file.is_file()
 
     def has_primary_config(self) -> bool:
         """Return whether the repo already has the new ``.agentic-memory`` config."""
-        return self.config_file.exists()
+        return self.config_file.is_file()
 
     def has_legacy_config(self) -> bool:
         """Return whether the repo still only has the legacy ``.codememory`` config."""
-        return self.legacy_config_file.exists()
+        return self.legacy_config_file.is_file()
 
     def active_config_file(self) -> Path:
         """Return the config file path this repo currently loads from.
@@ -212,14 +255,21 @@ class Config:
             RuntimeError: If JSON is invalid or the file cannot be read.
         """
         if not self.exists():
-            return copy.deepcopy(DEFAULT_CONFIG)
+            return _default_config()
 
         try:
-            source = self.config_file if self.config_file.exists() else self.legacy_config_file
-            with open(source, "r") as f:
-                config = json.load(f)
+            source = self.config_file if self.config_file.is_file() else self.legacy_config_file
+            stat = source.stat()
+            key = (str(source), stat.st_mtime_ns, stat.st_size)
+            if self._loaded_json is None or self._loaded_key != key:
+                config = _read_config_file(*key)
                 # Merge with defaults to handle missing keys
-                return self._merge_defaults(config)
+                self._loaded_json = json.dumps(self._merge_defaults(config))
+                self._loaded_key = key
+            # Callers such as save_git_config mutate the result, so hand out a
+            # copy and keep the merged config (and the cached parse) pristine.
+            config_copy: Dict[str, Any] = json.loads(self._loaded_json)
+            return config_copy
         except (json.JSONDecodeError, IOError) as e:
             raise RuntimeError(f"Failed to load config from {source}: {e}")
 
@@ -244,12 +294,15 @@ class Config:
         if payload.get("nemotron", {}).get("api_key") == "":
             payload["nemotron"]["api_key"] = None
 
-        with open(self.config_file, "w") as f:
-            json.dump(payload, f, indent=2)
+        self.config_file.write_bytes(_dumps_config(payload))
+
+        stat = self.config_file.stat()
+        self._loaded_json = json.dumps(self._merge_defaults(payload))
+        self._loaded_key = (str(self.config_file), stat.st_mtime_ns, stat.st_size)
 
     def ensure_graphignore(self, ignore_dirs: Optional[list[str]] = None) -> None:
         """Create .graphignore with sensible defaults if it does not exist."""
-        if self.graphignore_file.exists() or self.legacy_graphignore_file.exists():
+        if self.graphignore_file.is_file() or self.legacy_graphignore_file.is_file():
             return
 
         ignore_dirs = ignore_dirs or self.load().get("indexing", {}).get("ignore_dirs", [])
@@ -279,10 +332,10 @@ class Config:
         """Load non-empty, non-comment patterns from .graphignore."""
         graphignore_path = (
             self.graphignore_file
-            if self.graphignore_file.exists()
+            if self.graphignore_file.is_file()
             else self.legacy_graphignore_file
         )
-        if not graphignore_path.exists():
+        if not graphignore_path.is_file():
             return []
         patterns: list[str] = []
         with open(graphignore_path, "r") as f:
@@ -295,7 +348,7 @@ class Config:
 
     def _merge_defaults(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Merge user config with defaults."""
-        return self._deep_merge_dicts(copy.deepcopy(DEFAULT_CONFIG), config)
+        return self._deep_merge_dicts(_default_config(), config)
 
     def _deep_merge_dicts(self, base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
         """Recursively merge nested dictionaries."""
@@ -439,7 +492,7 @@ class Config:
         """Merge and persist git graph configuration."""
         config = self.load()
         merged_git = self._deep_merge_dicts(
-            copy.deepcopy(DEFAULT_CONFIG["git"]),
+            _default_config()["git"],
             config.get("git", {}),
         )
         config["git"] = self._deep_merge_dicts(merged_git, git_config)
@@ -549,27 +602,26 @@ def find_repo_root(start_path: Path = None) -> Optional[Path]:
         Resolved :class:`~pathlib.Path` to the chosen root. If no marker directory
         is found, returns ``start_path.resolve()`` (always a concrete path).
     """
-    start_path = start_path or Path.cwd()
-    current = start_path.resolve()
-
-    # Prefer the renamed Agentic Memory config root, but continue honoring the
-    # legacy CodeMemory folder so older repos still resolve correctly.
-    while current != current.parent:
-        if (current / CONFIG_DIR_NAME).exists():
+    start = (start_path or Path.cwd()).resolve()
+
+    # One upward walk: a config dir anywhere above wins over a nearer ``.git``,
+    # so remember the first git root and keep climbing. Prefer the renamed
+    # Agentic Memory config root, but continue honoring the legacy CodeMemory
+    # folder so older repos still resolve correctly.
+    git_root: Optional[Path] = None
+    for current in (start, *start.parents):
+        if current == current.parent:
+            break
+        if (current / CONFIG_DIR_NAME).is_dir():
             return current
-        if (current / LEGACY_CONFIG_DIR_NAME).exists():
-            return current
-        current = current.parent
-
-    # Not found, check if current dir is a git repo
-    current = start_path.resolve()
-    while current != current.parent:
-        if (current / ".git").exists():
+        if (current / LEGACY_CONFIG_DIR_NAME).is_dir():
             return current
-        current = current.parent
+        # ``.git`` is a file in worktrees and submodules, so only test existence.
+        if git_root is None and (current / ".git").exists():
+            git_root = current
 
-    # Fallback to current directory
-    return start_path.resolve()
+    # Fall back to the nearest git repo, then the starting directory
+    return git_root or start
 
 
 def load_config_for_current_dir() -> Optional[Config]:
@@ -587,7 +639,7 @@ def load_config_for_current_dir() -> Optional[Config]:
     config_dir = repo_root / CONFIG_DIR_NAME
     legacy_dir = repo_root / LEGACY_CONFIG_DIR_NAME
 
-    if not config_dir.exists() and not legacy_dir.exists():
+    if not config_dir.is_dir() and not legacy_dir.is_dir():
         return None
 
     return Config(repo_root)
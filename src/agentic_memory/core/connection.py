@@ -37,8 +37,10 @@ Note:
     2048d) can reconcile index dimensionality without hand-written DDL.
 """
 
+import atexit
 import logging
 import os
+import threading
 from contextlib import contextmanager
 from typing import Any, Generator
 
@@ -46,6 +48,11 @@ import neo4j
 
 logger = logging.getLogger(__name__)
 
+# Process-wide managers handed out by ConnectionManager.shared(), keyed by
+# (uri, user, password). Closed once at interpreter exit.
+_SHARED_MANAGERS: dict[tuple[str, str, str], "ConnectionManager"] = {}
+_SHARED_LOCK = threading.Lock()
+
 
 class ConnectionManager:
     """Manages a single synchronous Neo4j driver and memory-layer graph DDL.
@@ -100,8 +107,35 @@ class ConnectionManager:
             connection_timeout=self.pool_settings["connection_timeout"],
             max_transaction_retry_time=self.pool_settings["max_transaction_retry_time"],
         )
+        self._shared = False
         logger.debug("Neo4j driver created for %s", uri)
 
+    @classmethod
+    def shared(cls, uri: str, user: str, password: str) -> "ConnectionManager":
+        """Return the process-wide manager for these credentials, creating it once.
+
+        Long-lived processes (MCP server, API) build several pipelines per
+        repository against the same database; sharing one driver avoids a
+        fresh DNS lookup and TLS handshake per pipeline. :meth:`close` is a
+        no-op on shared managers — their drivers are closed at interpreter exit.
+
+        Args:
+            uri: Bolt URI.
+            user: Database username.
+            password: Database password.
+
+        Returns:
+            The cached :class:`ConnectionManager` for ``(uri, user, password)``.
+        """
+        key = (uri, user, password)
+        with _SHARED_LOCK:
+            conn = _SHARED_MANAGERS.get(key)
+            if conn is None:
+                conn = cls(uri, user, password)
+                conn._shared = True
+                _SHARED_MANAGERS[key] = conn
+            return conn
+
     @contextmanager
     def session(self) -> Generator[neo4j.Session, None, None]:
         """Provide a Neo4j session scoped to the surrounding ``with`` block.
@@ -349,7 +383,11 @@ class ConnectionManager:
 
         Idempotent with respect to driver shutdown semantics: after this call,
         :meth:`session` must not be used unless a new driver is constructed.
+        Managers obtained from :meth:`shared` stay open until interpreter exit.
         """
+        if getattr(self, "_shared", False):
+            logger.debug("Skipping close of shared Neo4j driver.")
+            return
         self.driver.close()
         logger.debug("Neo4j driver closed.")
 
@@ -378,3 +416,16 @@ class ConnectionManager:
         user = os.getenv("NEO4J_USER") or os.getenv("NEO4J_USERNAME") or neo4j_cfg["user"]
         password = os.getenv("NEO4J_PASSWORD", neo4j_cfg["password"])
         return cls(uri, user, password)
+
+
+@atexit.register
+def _close_shared_managers() -> None:
+    """Close every driver handed out by :meth:`ConnectionManager.shared`."""
+    with _SHARED_LOCK:
+        managers = list(_SHARED_MANAGERS.values())
+        _SHARED_MANAGERS.clear()
+    for conn in managers:
+        try:
+            conn.driver.close()
+        except Exception:
+            logger.debug("Shared Neo4j driver close failed.", exc_info=True)
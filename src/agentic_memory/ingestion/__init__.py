@@ -9,14 +9,30 @@ primary code-graph pipeline lives in :mod:`agentic_memory.ingestion.graph` and
 :mod:`agentic_memory.ingestion.watcher`.
 """
 
-from agentic_memory.ingestion.git_graph import (
-    GitGraphIngestor,
-    parse_name_status_output,
-    parse_numstat_output,
-)
+import importlib
+from typing import Any
+
+# Resolved on first attribute access (PEP 562), so importing a sibling module
+# such as ``agentic_memory.ingestion.parser`` (as parse worker processes do)
+# does not also load the git helpers and the Neo4j driver.
+_LAZY_EXPORTS = {
+    "GitGraphIngestor": "agentic_memory.ingestion.git_graph",
+    "parse_name_status_output": "agentic_memory.ingestion.git_graph",
+    "parse_numstat_output": "agentic_memory.ingestion.git_graph",
+}
 
 __all__ = [
     "GitGraphIngestor",
     "parse_name_status_output",
     "parse_numstat_output",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name from its defining module on first use."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 _FIELD_SEP = "\x1f"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GitFileChange:
     """A file touched in a commit with basic diff stats."""
 
@@ -26,7 +26,7 @@ class GitFileChange:
     deletions: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GitCommitRecord:
     """Commit metadata and touched files parsed from local git history."""
 
@@ -17,25 +17,37 @@ import hashlib
 import logging
 import sys
 import time
-import fnmatch
 import math
 import posixpath
 import re
-from collections import Counter
+from contextlib import contextmanager
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, List, Dict, Optional, Tuple, Set
-from functools import wraps
+from typing import Any, List, Dict, Iterable, Iterator, Optional, Tuple, Set
+from functools import partial, wraps
 
 import neo4j
 import openai
 from tree_sitter import Parser
 
+from agentic_memory.config import CONFIG_DIR_NAME, LEGACY_CONFIG_DIR_NAME
 from agentic_memory.core.base import BaseIngestionPipeline
 from agentic_memory.core.connection import ConnectionManager
 from agentic_memory.core.embedding import EmbeddingService
 from agentic_memory.core.registry import register_source
 from agentic_memory.core.runtime_embedding import EmbeddingRuntimeConfig, resolve_embedding_runtime
-from agentic_memory.ingestion.parser import CodeParser
+from agentic_memory.ingestion.parser import (
+    CodeParser,
+    parse_source_cached,
+    parse_source_path,
+    prune_parse_cache,
+)
+from agentic_memory.ingestion.pipeline_support import (
+    ProgressThrottle,
+    compile_globs,
+    parse_worker_count,
+)
 from agentic_memory.ingestion.python_call_analyzer import (
     PythonCallAnalyzer,
     PythonCallAnalyzerError,
@@ -93,6 +105,60 @@ def _safe_print(text: str = "", *, end: str = "\n") -> None:
     print(_safe_console_text(text), end=end)
 
 
+def _parse_source_path_for_pool(
+    path: str,
+    cache_dir: Optional[str] = None,
+) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """Process-pool parse wrapper that reports read failures instead of raising.
+
+    An ``OSError`` raised inside ``pool.map`` would abort the whole batch, so
+    failures come back as data: ``(False, None)`` when the file no longer
+    exists, ``(True, None)`` when it exists but could not be read (the caller
+    retries and reports that file inline), else ``(True, parsed)``.
+    """
+    try:
+        return True, parse_source_path(path, cache_dir)[1]
+    except FileNotFoundError:
+        return False, None
+    except OSError:
+        return True, None
+
+
+def _bounded_map(pool, fn, items, window: int) -> Iterator[Any]:
+    """Like ``pool.map`` but with at most ``window`` tasks in flight.
+
+    ``Executor.map`` submits every item up front and buffers results the
+    caller has not consumed yet, so memory grows with the input. Results are
+    yielded in input order.
+    """
+    pending: deque[Future] = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(pool.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _status_counts_query(node_filter: str) -> str:
+    """Build the single-round-trip Cypher behind index status counts.
+
+    Each label is counted in its own subquery so the totals come back as one
+    row instead of one bolt round trip per label. ``node_filter`` is either an
+    empty string (global scope) or a ``{repo_id: $repo_id}`` property map.
+    """
+    return f"""
+    CALL () {{
+        MATCH (f:File {node_filter})
+        RETURN count(f) AS files, max(f.last_updated) AS last_updated
+    }}
+    CALL () {{ MATCH (fn:Function {node_filter}) RETURN count(fn) AS functions }}
+    CALL () {{ MATCH (c:Class {node_filter}) RETURN count(c) AS classes }}
+    CALL () {{ MATCH (ch:Chunk {node_filter}) RETURN count(ch) AS chunks }}
+    RETURN files, functions, classes, chunks, last_updated
+    """
+
+
 class CircuitBreaker:
     """
     Circuit breaker pattern for handling repeated Neo4j connection failures.
@@ -239,6 +305,23 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
     MEMORY_ENTITY_LABEL = "MemoryEntity"
     MEMORY_VECTOR_INDEX = "memory_entity_embeddings"
     MEMORY_FULLTEXT_INDEX = "memory_entity_search"
+    # Pass 2 flushes its cross-file embedding queue once either limit is hit.
+    # ~250K chars is a rough proxy for ~60K tokens; 2048 matches the OpenAI
+    # per-request input cap (Gemini sub-batches internally).
+    EMBED_FLUSH_CHAR_BUDGET = 250_000
+    EMBED_FLUSH_MAX_TEXTS = 2048
+    # Upper bound on rows per UNWIND write so a single transaction stays well
+    # under Neo4j's recommended ~100K updates.
+    BULK_WRITE_BATCH_SIZE = 10_000
+    # Records per PULL for pipeline sessions; the Pass 4 start query returns
+    # one record per file, so the driver default of 1000 means many round-trips.
+    SESSION_FETCH_SIZE = 10_000
+    # Below this many files the process-pool startup cost outweighs parallel
+    # parsing, so passes parse inline on the main thread.
+    PARALLEL_PARSE_MIN_FILES = 32
+    # Pass 4 queues CALLS edges across files and writes them once this many
+    # caller->callee pairs are pending.
+    CALL_EDGE_FLUSH_SIZE = 10_000
 
     def __init__(
         self,
@@ -257,6 +340,7 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         embedding_api_key: str | None = None,
         embedding_base_url: str | None = None,
         embedding_dimensions: int | None = None,
+        query_only: bool = False,
     ):
         """
         Initialize the KnowledgeGraphBuilder.
@@ -279,6 +363,8 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
             embedding_api_key: Explicit API key override for code embeddings.
             embedding_base_url: Optional provider base URL override.
             embedding_dimensions: Optional output dimensionality override.
+            query_only: Skip ingestion-only setup (tree-sitter parsers) for
+                callers that only read the graph, such as search and status.
         """
         # Create ConnectionManager internally — preserves existing caller interface
         conn = ConnectionManager(uri=uri, user=user, password=password)
@@ -340,7 +426,9 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         self.embedding_query_task_instruction = code_module_cfg.get(
             "embedding_query_task_instruction"
         )
-        self.parsers = self._init_parsers()
+        # Read-only callers never parse source; _get_code_parser still builds
+        # the parser lazily if one of them ends up needing it.
+        self.parsers: Dict[str, Parser] = {} if query_only else self._init_parsers()
         self.repo_root = repo_root
         self.repo_id = str(repo_root.resolve()) if repo_root else None
         self.token_usage = {
@@ -348,15 +436,27 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
             "embedding_calls": 0,
             "total_cost_usd": 0.0,
         }
+        # Populated only for the duration of run_pipeline so Pass 2 and Pass 3
+        # share one parse per file instead of reparsing.
+        self._parse_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        # Populated only for the duration of run_pipeline so every pass reuses
+        # one session (see _shared_session).
+        self._active_session: Optional[neo4j.Session] = None
+        # Set by reindex_files(parallel_parse=False) so parsing never forks a
+        # process pool from a multi-threaded caller such as the watcher.
+        self._parse_inline = False
 
         # Default ignore patterns. `.claude` contains agent handoffs, cached
         # worktrees, and other local workspace state that should not pollute the
-        # repo's searchable code graph.
+        # repo's searchable code graph. Our own control dirs hold config and the
+        # parse cache, which must never be walked as source.
         default_ignore_dirs = {
             "node_modules",
             "__pycache__",
             ".git",
             ".claude",
+            CONFIG_DIR_NAME,
+            LEGACY_CONFIG_DIR_NAME,
             "dist",
             "build",
             ".venv",
@@ -372,36 +472,67 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
             self.ignore_dirs.update(ignore_dirs)
         self.ignore_files = ignore_files or set()
         self.ignore_patterns = ignore_patterns or set()
+        # Compiled forms of the ignore sets, rebuilt whenever a set changes.
+        self._ignore_matchers: Dict[str, Tuple[frozenset, Any]] = {}
+
+    def _ignore_matcher(self, kind: str, patterns: Set[str], compile_fn) -> Any:
+        """Return ``compile_fn(patterns)``, cached until ``patterns`` changes."""
+        key = frozenset(patterns)
+        cached = self._ignore_matchers.get(kind)
+        if cached is None or cached[0] != key:
+            cached = (key, compile_fn(sorted(key)))
+            self._ignore_matchers[kind] = cached
+        return cached[1]
+
+    @staticmethod
+    def _compile_path_patterns(
+        patterns: List[str],
+    ) -> Tuple[Tuple[str, ...], Optional["re.Pattern[str]"], Optional["re.Pattern[str]"]]:
+        """Split .graphignore patterns into dir prefixes, path globs and name globs."""
+        prefixes: List[str] = []
+        path_globs: List[str] = []
+        name_globs: List[str] = []
+        for pattern in patterns:
+            p = pattern.strip().replace("\\", "/")
+            if not p:
+                continue
+            if p.endswith("/"):
+                prefixes.append(p.rstrip("/"))
+            if "/" in p:
+                path_globs.append(p)
+            else:
+                name_globs.append(p)
+        return tuple(prefixes), compile_globs(path_globs), compile_globs(name_globs)
 
     def _should_ignore_dir(self, dir_name: str) -> bool:
         """Return True when a directory should be excluded from scanning."""
-        if any(fnmatch.fnmatch(dir_name, pattern) for pattern in self.ignore_dirs):
+        matcher = self._ignore_matcher("dirs", self.ignore_dirs, compile_globs)
+        if matcher is not None and matcher.match(os.path.normcase(dir_name)):
             return True
         # Catch common virtualenv naming patterns like .venv-foo / venv-test.
         return dir_name.startswith(".venv") or dir_name.startswith("venv")
 
+    def _should_ignore_file_name(self, file_name: str) -> bool:
+        """Return True when a file name matches an ``ignore_files`` glob."""
+        matcher = self._ignore_matcher("files", self.ignore_files, compile_globs)
+        return matcher is not None and matcher.match(os.path.normcase(file_name)) is not None
+
     def _should_ignore_path(self, rel_path: str) -> bool:
         """Return True when a relative path matches .graphignore patterns."""
         if not self.ignore_patterns:
             return False
 
+        prefixes, path_matcher, name_matcher = self._ignore_matcher(
+            "paths", self.ignore_patterns, self._compile_path_patterns
+        )
         normalized = rel_path.replace("\\", "/")
-        basename = Path(normalized).name
-        for pattern in self.ignore_patterns:
-            p = pattern.strip().replace("\\", "/")
-            if not p:
-                continue
-            if p.endswith("/"):
-                prefix = p.rstrip("/")
-                if normalized == prefix or normalized.startswith(prefix + "/"):
-                    return True
-            if "/" in p:
-                if fnmatch.fnmatch(normalized, p):
-                    return True
-            else:
-                if fnmatch.fnmatch(basename, p):
-                    return True
-        return False
+        for prefix in prefixes:
+            if normalized == prefix or normalized.startswith(prefix + "/"):
+                return True
+        if path_matcher is not None and path_matcher.match(os.path.normcase(normalized)):
+            return True
+        basename = normalized.rsplit("/", 1)[-1]
+        return name_matcher is not None and name_matcher.match(os.path.normcase(basename)) is not None
 
     def _normalize_rel_path(self, rel_path: str) -> str:
         """Store all repo-relative paths in Neo4j using forward slashes."""
@@ -414,7 +545,7 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         normalized = rel_path.replace("\\", "/")
         rel_obj = Path(normalized)
 
-        if rel_obj.name in self.ignore_files:
+        if self._should_ignore_file_name(rel_obj.name):
             return True
         if rel_obj.suffix not in supported_extensions:
             return True
@@ -427,20 +558,32 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
 
     def _delete_file_subgraph(self, session: neo4j.Session, repo_id: str, rel_path: str):
         """Delete one File node and all derived entities/chunks."""
-        session.run(
-            """
-            MATCH (f:File {repo_id: $repo_id, path: $path})-[:DEFINES]->(entity)
-            OPTIONAL MATCH (chunk:Chunk)-[:DESCRIBES]->(entity)
-            DETACH DELETE chunk, entity
-            """,
-            repo_id=repo_id,
-            path=rel_path,
-        )
-        session.run(
-            "MATCH (f:File {repo_id: $repo_id, path: $path}) DETACH DELETE f",
-            repo_id=repo_id,
-            path=rel_path,
-        )
+        self._delete_file_subgraphs(session, repo_id, [rel_path])
+
+    def _delete_file_subgraphs(
+        self, session: neo4j.Session, repo_id: str, rel_paths: list[str]
+    ) -> None:
+        """Delete many File nodes and their derived entities/chunks with UNWIND."""
+        for batch in self._iter_write_batches(rel_paths):
+            session.run(
+                """
+                UNWIND $paths AS path
+                MATCH (f:File {repo_id: $repo_id, path: path})-[:DEFINES]->(entity)
+                OPTIONAL MATCH (chunk:Chunk)-[:DESCRIBES]->(entity)
+                DETACH DELETE chunk, entity
+                """,
+                repo_id=repo_id,
+                paths=batch,
+            )
+            session.run(
+                """
+                UNWIND $paths AS path
+                MATCH (f:File {repo_id: $repo_id, path: path})
+                DETACH DELETE f
+                """,
+                repo_id=repo_id,
+                paths=batch,
+            )
 
     def clear_repo_code_graph(self, repo_path: Optional[Path] = None) -> None:
         """Delete one repo's code graph so the next index run rebuilds everything.
@@ -455,7 +598,7 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         """
         _, repo_id = self._require_repo_context(repo_path)
 
-        with self.driver.session() as session:
+        with self._shared_session() as session:
             session.run(
                 """
                 MATCH (trace:CodeTraceRun {repo_id: $repo_id})
@@ -477,15 +620,16 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                 """,
                 repo_id=repo_id,
             )
-            session.run(
-                """
-                MATCH (n)
-                WHERE n.repo_id = $repo_id
-                  AND (n:Chunk OR n:Function OR n:Class)
-                DETACH DELETE n
-                """,
-                repo_id=repo_id,
-            )
+            # One label-scoped match per label: an unlabeled MATCH (n) with a
+            # label predicate in WHERE scans every node in the database.
+            for label in ("Chunk", "Function", "Class"):
+                session.run(
+                    f"""
+                    MATCH (n:{label} {{repo_id: $repo_id}})
+                    DETACH DELETE n
+                    """,
+                    repo_id=repo_id,
+                )
             session.run(
                 """
                 MATCH (reason:CallDropReason)
@@ -557,19 +701,68 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         ohash: str,
     ) -> None:
         """Create or update one repo-scoped File node."""
-        session.run(
-            """
-            MERGE (f:File {repo_id: $repo_id, path: $path})
-            SET f.name = $name,
-                f.ohash = $ohash,
-                f.last_updated = datetime()
-            """,
+        self._upsert_file_nodes(
+            session,
             repo_id=repo_id,
-            path=rel_path,
-            name=file_name,
-            ohash=ohash,
+            rows=[{"path": rel_path, "name": file_name, "ohash": ohash}],
         )
 
+    def _upsert_file_nodes(
+        self,
+        session: neo4j.Session,
+        *,
+        repo_id: str,
+        rows: list[dict[str, Any]],
+        dirty: bool = False,
+    ) -> None:
+        """Create or update many repo-scoped File nodes with UNWIND writes.
+
+        Args:
+            session: Open Neo4j session.
+            repo_id: Repository scope for the File nodes.
+            rows: Dicts with ``path``, ``name`` and ``ohash`` keys.
+            dirty: Also set ``f.dirty = true``. Pass 1 marks changed files so
+                a run that dies before the later passes finish still rebuilds
+                them next time, even though their ``ohash`` already matches.
+        """
+        dirty_clause = ",\n                    f.dirty = true" if dirty else ""
+        for batch in self._iter_write_batches(rows):
+            session.run(
+                f"""
+                UNWIND $rows AS r
+                MERGE (f:File {{repo_id: $repo_id, path: r.path}})
+                SET f.name = r.name,
+                    f.ohash = r.ohash,
+                    f.last_updated = datetime(){dirty_clause}
+                """,
+                repo_id=repo_id,
+                rows=batch,
+            )
+
+    def _clear_dirty_files(
+        self,
+        session: neo4j.Session,
+        *,
+        repo_id: str,
+        rel_paths: list[str],
+    ) -> None:
+        """Remove the Pass 1 ``dirty`` marker once later passes rebuilt the files."""
+        for batch in self._iter_write_batches(rel_paths):
+            session.run(
+                """
+                UNWIND $paths AS path
+                MATCH (f:File {repo_id: $repo_id, path: path})
+                REMOVE f.dirty
+                """,
+                repo_id=repo_id,
+                paths=batch,
+            )
+
+    def _iter_write_batches(self, rows: list[Any]) -> Iterator[list[Any]]:
+        """Yield ``rows`` in slices of at most :attr:`BULK_WRITE_BATCH_SIZE`."""
+        for start in range(0, len(rows), self.BULK_WRITE_BATCH_SIZE):
+            yield rows[start : start + self.BULK_WRITE_BATCH_SIZE]
+
     def _clear_file_derivatives(
         self,
         session: neo4j.Session,
@@ -578,29 +771,212 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         rel_path: str,
     ) -> None:
         """Delete derived entities, chunks, and outgoing structural edges for one file."""
-        session.run(
-            """
-            MATCH (f:File {repo_id: $repo_id, path: $path})-[:DEFINES]->(entity)
-            OPTIONAL MATCH (chunk:Chunk {repo_id: $repo_id})-[:DESCRIBES]->(entity)
-            DETACH DELETE chunk, entity
-            """,
-            repo_id=repo_id,
-            path=rel_path,
+        self._clear_files_derivatives(session, repo_id=repo_id, rel_paths=[rel_path])
+
+    def _clear_files_derivatives(
+        self,
+        session: neo4j.Session,
+        *,
+        repo_id: str,
+        rel_paths: list[str],
+    ) -> None:
+        """Batched :meth:`_clear_file_derivatives` for many files at once."""
+        for batch in self._iter_write_batches(rel_paths):
+            session.run(
+                """
+                UNWIND $paths AS path
+                MATCH (f:File {repo_id: $repo_id, path: path})-[:DEFINES]->(entity)
+                OPTIONAL MATCH (chunk:Chunk {repo_id: $repo_id})-[:DESCRIBES]->(entity)
+                DETACH DELETE chunk, entity
+                """,
+                repo_id=repo_id,
+                paths=batch,
+            )
+            session.run(
+                """
+                UNWIND $paths AS path
+                MATCH (f:File {repo_id: $repo_id, path: path})-[r:IMPORTS]->()
+                DELETE r
+                """,
+                repo_id=repo_id,
+                paths=batch,
+            )
+
+    def _parse_source_file(self, full_path: Path) -> tuple[bytes, dict[str, Any]]:
+        """Read and parse one source file through the canonical parser.
+
+        The file is read as raw bytes and handed to Tree-sitter without a
+        decode/re-encode round trip; only node slices are decoded.
+        """
+        code_content = full_path.read_bytes()
+        parsed = parse_source_cached(
+            code_content,
+            full_path.suffix,
+            self._parse_cache_dir(),
+            parser=self._get_code_parser(),
         )
-        session.run(
-            """
-            MATCH (f:File {repo_id: $repo_id, path: $path})-[r:IMPORTS]->()
-            DELETE r
-            """,
-            repo_id=repo_id,
-            path=rel_path,
+        return code_content, parsed
+
+    def _parse_cache_dir(self) -> Optional[str]:
+        """Return the on-disk parse cache directory, or ``None`` when disabled.
+
+        ``AM_PARSE_CACHE_DIR`` selects a directory explicitly (``off`` disables
+        it). Otherwise repos initialized with ``.agentic-memory/`` cache parse
+        results under ``.agentic-memory/cache/parse``.
+        """
+        raw = os.getenv("AM_PARSE_CACHE_DIR", "").strip()
+        if raw:
+            if raw.lower() in {"0", "off", "false", "none"}:
+                return None
+            return raw
+        repo_root = getattr(self, "repo_root", None)
+        if repo_root is None:
+            return None
+        config_dir = Path(repo_root) / CONFIG_DIR_NAME
+        if not config_dir.is_dir():
+            return None
+        return str(config_dir / "cache" / "parse")
+
+    def _prune_parse_cache(self) -> None:
+        """Bound the on-disk parse cache after a run has written new entries."""
+        cache_dir = self._parse_cache_dir()
+        if cache_dir is None:
+            return
+        removed = prune_parse_cache(cache_dir)
+        if removed:
+            logger.debug("Pruned %d stale parse cache entries from %s", removed, cache_dir)
+
+    def _clear_parse_cache(self) -> None:
+        """Drop every on-disk parse cache entry so the next parses are fresh."""
+        cache_dir = self._parse_cache_dir()
+        if cache_dir is None:
+            return
+        removed = prune_parse_cache(cache_dir, max_entries=0)
+        if removed:
+            logger.info("Cleared %d parse cache entries from %s", removed, cache_dir)
+
+    @contextmanager
+    def _shared_parse_cache(self) -> Iterator[Dict[str, Dict[str, Any]]]:
+        """Share one parse per file across the passes run inside this block.
+
+        Nested use reuses the outer cache, so a caller that already holds one
+        (for example :meth:`run_pipeline`) keeps it for the whole run.
+        """
+        if self._parse_cache is not None:
+            yield self._parse_cache
+            return
+        self._parse_cache = {}
+        try:
+            yield self._parse_cache
+        finally:
+            self._parse_cache = None
+
+    @contextmanager
+    def _shared_session(self) -> Iterator[neo4j.Session]:
+        """Reuse one Neo4j session for every pass run inside this block.
+
+        Nested use reuses the outer session. Sessions are not thread-safe, so
+        background writers keep opening their own.
+        """
+        active = getattr(self, "_active_session", None)
+        if active is not None:
+            yield active
+            return
+        with self.driver.session(fetch_size=self.SESSION_FETCH_SIZE) as session:
+            self._active_session = session
+            try:
+                yield session
+            finally:
+                self._active_session = None
+
+    def _parse_worker_count(self) -> int:
+        """Return the process count for parallel parsing (``AM_PARSE_WORKERS``)."""
+        return parse_worker_count()
+
+    def _iter_parsed_files(
+        self,
+        repo_path: Path,
+        rel_paths: list[str],
+    ) -> Iterator[tuple[str, Path, Optional[dict[str, Any]], bool]]:
+        """Parse many repo files, in parallel when the batch is large enough.
+
+        Tree-sitter parsing is CPU-bound, so large batches fan out to a
+        ``ProcessPoolExecutor`` running :func:`parse_source_path`; small
+        batches parse inline through :meth:`_parse_source_file`. Results come
+        back in input order either way, and graph writes stay on the caller's
+        thread. Pool results are streamed through a bounded window, so only a
+        few parses per worker are held in memory at once.
+
+        Yields:
+            ``(rel_path, full_path, parsed, missing)`` per input path. ``parsed``
+            is ``None`` when the file no longer exists on disk or cannot be
+            read; ``missing`` is True only in the first case, so callers can
+            tell a deleted file from a transient read failure.
+        """
+        cache = getattr(self, "_parse_cache", None)
+        # Deleted files surface as FileNotFoundError at read time rather
+        # than through a stat per path up front.
+        to_parse = list(
+            dict.fromkeys(
+                rel_path for rel_path in rel_paths if cache is None or rel_path not in cache
+            )
         )
 
-    def _parse_source_file(self, full_path: Path) -> tuple[str, dict[str, Any]]:
-        """Read and parse one source file through the canonical parser."""
-        code_content = full_path.read_text(errors="ignore")
-        parsed = self._get_code_parser().parse_file(code_content, full_path.suffix)
-        return code_content, parsed
+        pool = None
+        pooled: Iterator[Tuple[str, Tuple[bool, Optional[dict[str, Any]]]]] = iter(())
+        pool_pending: Set[str] = set()
+        workers = min(self._parse_worker_count(), len(to_parse))
+        inline = getattr(self, "_parse_inline", False)
+        if not inline and workers > 1 and len(to_parse) >= self.PARALLEL_PARSE_MIN_FILES:
+            parse_path = partial(_parse_source_path_for_pool, cache_dir=self._parse_cache_dir())
+            pool = ProcessPoolExecutor(max_workers=workers)
+            pooled = zip(
+                to_parse,
+                _bounded_map(
+                    pool,
+                    parse_path,
+                    (str(repo_path / rel_path) for rel_path in to_parse),
+                    window=workers * 4,
+                ),
+            )
+            pool_pending = set(to_parse)
+
+        missing: Set[str] = set()
+        try:
+            for rel_path in rel_paths:
+                full_path = repo_path / rel_path
+                if rel_path in missing:
+                    yield rel_path, full_path, None, True
+                    continue
+                parsed = None
+                if cache is not None and rel_path in cache:
+                    parsed = cache[rel_path]
+                elif rel_path in pool_pending:
+                    # Pool results arrive in ``to_parse`` order, which is
+                    # this loop's order with repeats removed.
+                    pool_pending.discard(rel_path)
+                    _, (found, parsed) = next(pooled)
+                    if not found:
+                        missing.add(rel_path)
+                        yield rel_path, full_path, None, True
+                        continue
+                if parsed is None:
+                    try:
+                        _, parsed = self._parse_source_file(full_path)
+                    except FileNotFoundError:
+                        missing.add(rel_path)
+                        yield rel_path, full_path, None, True
+                        continue
+                    except OSError as e:
+                        logger.warning(f"⚠️ Could not read {rel_path}: {e}")
+                        yield rel_path, full_path, None, False
+                        continue
+                if cache is not None:
+                    cache[rel_path] = parsed
+                yield rel_path, full_path, parsed, False
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
 
     def ingest(self, source: Any) -> dict[str, Any]:
         """Ingest a repository directory. Wraps the existing multi-pass pipeline.
@@ -626,13 +1002,41 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
     # DATABASE SETUP
     # =========================================================================
 
+    def _code_vector_index_ddl(self) -> str:
+        """Return the ``CREATE VECTOR INDEX`` statement for code chunks."""
+        return f"""
+            CREATE VECTOR INDEX code_embeddings IF NOT EXISTS
+            FOR (c:Chunk) ON (c.embedding)
+            OPTIONS {{indexConfig: {{
+             `vector.dimensions`: {self.VECTOR_DIMENSIONS},
+             `vector.similarity_function`: 'cosine'
+            }} }}
+            """
+
     def setup_database(self):
         """
         Pass 0: Pre-flight Configuration.
         Creates constraints and vector indexes to optimize ingestion and retrieval.
+
+        The ``code_embeddings`` index follows :attr:`VECTOR_DIMENSIONS`. Code
+        embeddings can be shrunk with Matryoshka truncation (for example
+        ``CODE_EMBEDDING_DIMENSIONS=1024`` for ``text-embedding-3-large`` or
+        Gemini), so an existing index at a different size is dropped and
+        recreated rather than left to silently reject the new vectors.
         """
         logger.info("🚀 [Pass 0] Configuring Database Constraints & Indexes...")
 
+        current_dims = self._conn._existing_vector_index_dims().get("code_embeddings")
+        if current_dims is not None and current_dims != self.VECTOR_DIMENSIONS:
+            logger.warning(
+                "Vector index code_embeddings exists at %dd but code embeddings are %dd; "
+                "dropping and recreating. Run a full reindex to re-embed existing chunks.",
+                current_dims,
+                self.VECTOR_DIMENSIONS,
+            )
+            with self.driver.session() as session:
+                session.run("DROP INDEX code_embeddings IF EXISTS")
+
         queries = [
             # 1. Drop legacy single-repo constraints so the graph can hold
             # multiple repositories without path/signature collisions.
@@ -656,20 +1060,32 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                 "CREATE CONSTRAINT code_trace_run_unique IF NOT EXISTS "
                 "FOR (t:CodeTraceRun) REQUIRE (t.repo_id, t.root_signature) IS UNIQUE"
             ),
+            (
+                "CREATE CONSTRAINT chunk_id_unique IF NOT EXISTS "
+                "FOR (ch:Chunk) REQUIRE ch.id IS UNIQUE"
+            ),
             # 2. Vector Index for Hybrid Search
-            f"""
-            CREATE VECTOR INDEX code_embeddings IF NOT EXISTS
-            FOR (c:Chunk) ON (c.embedding)
-            OPTIONS {{indexConfig: {{
-             `vector.dimensions`: {self.VECTOR_DIMENSIONS},
-             `vector.similarity_function`: 'cosine'
-            }} }}
-            """,
+            self._code_vector_index_ddl(),
             # 3. Fulltext Index for Keyword Search
             """
             CREATE FULLTEXT INDEX entity_text_search IF NOT EXISTS
             FOR (n:Function|Class|File) ON EACH [n.name, n.docstring, n.path]
             """,
+            # 4. Lookup index for Pass 2 embedding reuse by content hash
+            (
+                "CREATE INDEX chunk_content_hash IF NOT EXISTS "
+                "FOR (ch:Chunk) ON (ch.repo_id, ch.content_hash)"
+            ),
+            # 5. Function lookups by name for symbol resolution and tracing
+            # (signature lookups are already backed by the uniqueness constraint).
+            (
+                "CREATE INDEX function_repo_qualified_name IF NOT EXISTS "
+                "FOR (fn:Function) ON (fn.repo_id, fn.qualified_name)"
+            ),
+            (
+                "CREATE INDEX function_repo_name IF NOT EXISTS "
+                "FOR (fn:Function) ON (fn.repo_id, fn.name)"
+            ),
         ]
 
         with self.driver.session() as session:
@@ -720,12 +1136,27 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
     # =========================================================================
 
     def _calculate_ohash(self, file_path: Path) -> str:
-        """Calculates MD5 hash of file content for change detection."""
+        """Hash file content for change detection.
+
+        Uses 128-bit BLAKE2b over 1 MiB streamed reads: faster than MD5 on
+        64-bit CPUs, constant memory for large files, and stdlib-only so the
+        hash never depends on which optional packages are installed. The value
+        is opaque; it is only compared against the stored ``File.ohash``.
+        """
         try:
-            return hashlib.md5(file_path.read_bytes()).hexdigest()
+            return self._hash_file(file_path)
         except (OSError, IOError):
             return ""
 
+    @staticmethod
+    def _hash_file(file_path: Path) -> str:
+        """Return the :meth:`_calculate_ohash` digest, letting read errors propagate."""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, "rb") as handle:
+            for block in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
     @retry_on_openai_error(max_retries=3, delay=1.0)
     def get_embedding(
         self,
@@ -858,6 +1289,263 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
 
         return vectors
 
+    def _write_pass_2_entities(
+        self,
+        tx,
+        *,
+        repo_id: str,
+        pending: Dict[str, List[Dict[str, Any]]],
+        embedding_cache: Dict[str, List[float]],
+    ) -> None:
+        """Rewrite queued files' entities and chunks with a few UNWIND queries.
+
+        Each queued file's previous entities and chunks are cleared first. Then
+        File rows, and Class/Function rows together with their Chunk nodes, are
+        written in dependency order so each MATCH sees the nodes written before
+        it: one query per kind per :attr:`BULK_WRITE_BATCH_SIZE` rows instead of
+        several round-trips per definition.
+
+        Args:
+            tx: Open transaction (or session) used for every write.
+            repo_id: Repository scope for all written nodes.
+            pending: Queue with ``files``, ``classes`` and ``functions`` rows.
+                Class/function rows carry ``content_hash`` for their chunk.
+            embedding_cache: ``content_hash -> vector`` map that already holds
+                a vector for every queued row.
+        """
+        self._clear_files_derivatives(
+            tx,
+            repo_id=repo_id,
+            rel_paths=[row["path"] for row in pending["files"]],
+        )
+        self._upsert_file_nodes(tx, repo_id=repo_id, rows=pending["files"])
+
+        # Chunk vectors go through db.create.setNodeVectorProperty, which
+        # stores them as float32 arrays (half the size of a plain Cypher float
+        # list) while keeping them usable by the code_embeddings index.
+        # Zero-vector fallbacks (no provider configured) must never be reused.
+        store_hash = self.embedding_service is not None
+        class_rows = [
+            {
+                "path": row["path"],
+                "sig": row["sig"],
+                "name": row["name"],
+                "code": row["code"],
+                "embedding": embedding_cache[row["content_hash"]],
+                "content_hash": row["content_hash"] if store_hash else None,
+            }
+            for row in pending["classes"]
+        ]
+        for batch in self._iter_write_batches(class_rows):
+            tx.run(
+                """
+                UNWIND $rows AS r
+                MATCH (f:File {repo_id: $repo_id, path: r.path})
+                MERGE (c:Class {repo_id: $repo_id, qualified_name: r.sig})
+                SET c.name = r.name,
+                    c.code = r.code,
+                    c.path = r.path
+                MERGE (f)-[:DEFINES]->(c)
+                CREATE (ch:Chunk {id: randomUUID()})
+                SET ch.repo_id = $repo_id,
+                    ch.path = r.path,
+                    ch.text = r.code,
+                    ch.content_hash = r.content_hash,
+                    ch.created_at = datetime()
+                CALL db.create.setNodeVectorProperty(ch, 'embedding', r.embedding)
+                MERGE (ch)-[:DESCRIBES]->(c)
+                """,
+                repo_id=repo_id,
+                rows=batch,
+            )
+
+        function_rows = [
+            {
+                "path": row["path"],
+                "sig": row["sig"],
+                "name": row["name"],
+                "qualified_name": row["qualified_name"],
+                "parent_class": row["parent_class"],
+                "class_sig": f"{row['path']}:{row['parent_class']}" if row["parent_class"] else None,
+                "name_line": row["name_line"],
+                "name_column": row["name_column"],
+                "code": row["code"],
+                "embedding": embedding_cache[row["content_hash"]],
+                "content_hash": row["content_hash"] if store_hash else None,
+            }
+            for row in pending["functions"]
+        ]
+        for batch in self._iter_write_batches(function_rows):
+            tx.run(
+                """
+                UNWIND $rows AS r
+                MATCH (f:File {repo_id: $repo_id, path: r.path})
+                MERGE (fn:Function {repo_id: $repo_id, signature: r.sig})
+                SET fn.name = r.name,
+                    fn.qualified_name = r.qualified_name,
+                    fn.parent_class = r.parent_class,
+                    fn.name_line = r.name_line,
+                    fn.name_column = r.name_column,
+                    fn.code = r.code,
+                    fn.path = r.path
+                MERGE (f)-[:DEFINES]->(fn)
+                CREATE (ch:Chunk {id: randomUUID()})
+                SET ch.repo_id = $repo_id,
+                    ch.path = r.path,
+                    ch.text = r.code,
+                    ch.content_hash = r.content_hash,
+                    ch.created_at = datetime()
+                CALL db.create.setNodeVectorProperty(ch, 'embedding', r.embedding)
+                MERGE (ch)-[:DESCRIBES]->(fn)
+                WITH r, fn
+                OPTIONAL MATCH (c:Class {repo_id: $repo_id, qualified_name: r.class_sig})
+                FOREACH (_ IN CASE WHEN c IS NULL THEN [] ELSE [1] END |
+                    MERGE (c)-[:HAS_METHOD]->(fn)
+                )
+                """,
+                repo_id=repo_id,
+                rows=batch,
+            )
+
+    def _submit_pass_2_batch(
+        self,
+        session,
+        embed_pool: ThreadPoolExecutor,
+        *,
+        repo_id: str,
+        pending: Dict[str, List[Dict[str, Any]]],
+        embedding_cache: Dict[str, List[float]],
+        in_flight_hashes: Set[str],
+    ) -> Optional[Dict[str, Any]]:
+        """Hand the queued Pass 2 rows to the background embedding worker.
+
+        Stored vectors are looked up first (before the queued files' old chunks
+        are cleared). Texts that are neither cached nor already being embedded
+        by an earlier in-flight batch are submitted as one
+        :meth:`get_document_embeddings_batch` call on ``embed_pool``, so the
+        provider round-trip overlaps with parsing and graph writes on the
+        calling thread. The queue is emptied; the returned batch is completed
+        with :meth:`_finish_pass_2_batch`.
+        """
+        if not pending["files"]:
+            return None
+
+        rows = {key: list(value) for key, value in pending.items()}
+        for value in pending.values():
+            value.clear()
+
+        chunk_rows = rows["classes"] + rows["functions"]
+        self._load_cached_embeddings(
+            session,
+            repo_id=repo_id,
+            pending=chunk_rows,
+            embedding_cache=embedding_cache,
+        )
+        texts_by_hash: Dict[str, str] = {}
+        for row in chunk_rows:
+            content_hash = row["content_hash"]
+            if content_hash not in embedding_cache and content_hash not in in_flight_hashes:
+                texts_by_hash.setdefault(content_hash, row["enriched_text"])
+        in_flight_hashes.update(texts_by_hash)
+
+        future: Optional[Future] = None
+        if texts_by_hash:
+            future = embed_pool.submit(
+                self.get_document_embeddings_batch, list(texts_by_hash.values())
+            )
+        return {"rows": rows, "hashes": list(texts_by_hash), "future": future}
+
+    def _finish_pass_2_batch(
+        self,
+        session,
+        batch: Optional[Dict[str, Any]],
+        *,
+        repo_id: str,
+        embedding_cache: Dict[str, List[float]],
+        in_flight_hashes: Set[str],
+    ) -> None:
+        """Wait for a submitted batch's vectors, then write it in one transaction.
+
+        Batches must be finished in submission order: a batch may rely on
+        vectors for duplicate texts that an earlier batch is embedding.
+        Committing files, entities and chunks together means a crash can never
+        leave a File with a fresh ``ohash`` but missing chunks.
+        """
+        if batch is None:
+            return
+
+        if batch["future"] is not None:
+            embeddings = batch["future"].result()
+            embedding_cache.update(zip(batch["hashes"], embeddings))
+        in_flight_hashes.difference_update(batch["hashes"])
+
+        tx = session.begin_transaction()
+        try:
+            self._write_pass_2_entities(
+                tx,
+                repo_id=repo_id,
+                pending=batch["rows"],
+                embedding_cache=embedding_cache,
+            )
+            tx.commit()
+        finally:
+            tx.close()
+
+    def _embedding_content_hash(self, enriched_text: str) -> str:
+        """Return the Chunk ``content_hash`` used to reuse stored embeddings.
+
+        The provider, model, dimensions and document task instruction are part
+        of the hashed input, so switching embedding configuration never reuses
+        vectors produced under the old one.
+        """
+        runtime = self.embedding_runtime
+        key = "|".join(
+            [
+                str(getattr(runtime, "provider", "")),
+                str(getattr(runtime, "model", "")),
+                str(self.VECTOR_DIMENSIONS),
+                str(self.embedding_document_task_instruction or ""),
+            ]
+        )
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(key.encode("utf8"))
+        digest.update(b"\n")
+        digest.update(enriched_text.encode("utf8", errors="ignore"))
+        return digest.hexdigest()
+
+    def _load_cached_embeddings(
+        self,
+        session,
+        *,
+        repo_id: str,
+        pending: List[Dict[str, Any]],
+        embedding_cache: Dict[str, List[float]],
+    ) -> None:
+        """Fill ``embedding_cache`` with stored vectors for queued chunk hashes.
+
+        Must run before the queued files' old chunks are cleared, so unchanged
+        functions in an edited file keep their vectors without a provider call.
+        """
+        if self.embedding_service is None:
+            return
+        hashes = sorted(
+            {spec["content_hash"] for spec in pending} - set(embedding_cache)
+        )
+        for batch in self._iter_write_batches(hashes):
+            result = session.run(
+                """
+                UNWIND $hashes AS h
+                MATCH (ch:Chunk {repo_id: $repo_id, content_hash: h})
+                WITH h, head(collect(ch.embedding)) AS embedding
+                WHERE embedding IS NOT NULL
+                RETURN h AS hash, embedding
+                """,
+                repo_id=repo_id,
+                hashes=batch,
+            )
+            for record in result:
+                embedding_cache[record["hash"]] = list(record["embedding"])
+
     # =========================================================================
     # PASS 1: STRUCTURE SCAN & CHANGE DETECTION
     # =========================================================================
@@ -874,7 +1562,8 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
             supported_extensions: Set of file extensions to process
 
         Returns:
-            Repo-relative paths that are new or whose content hash changed.
+            Repo-relative paths that are new, whose content hash changed, or
+            that are still marked ``dirty`` by an earlier unfinished run.
 
         Why this matters:
             Phase 11 exposed that `agent-memory index` was still re-running
@@ -889,59 +1578,65 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         logger.info("📂 [Pass 1] Scanning Directory Structure...")
 
         count = 0
-        pruned_count = 0
         changed_paths: list[str] = []
-        with self.driver.session() as session:
+        with self._shared_session() as session:
+            # One round-trip for every stored hash instead of one lookup per file.
+            known_hashes: dict[str, Any] = {}
+            dirty_paths: set[str] = set()
+            for record in session.run(
+                """
+                MATCH (f:File {repo_id: $repo_id})
+                RETURN f.path as path, f.ohash as hash, f.dirty as dirty
+                """,
+                repo_id=repo_id,
+            ):
+                known_hashes[record["path"]] = record["hash"]
+                if record.get("dirty"):
+                    dirty_paths.add(record["path"])
+            file_rows: list[dict[str, Any]] = []
+            seen_paths: set[str] = set()
             for root, dirs, files in os.walk(repo_path):
                 # Filter directories
                 dirs[:] = [d for d in dirs if not self._should_ignore_dir(d)]
+                rel_root = self._normalize_rel_path(os.path.relpath(root, repo_path))
 
                 for file_name in files:
-                    if file_name in self.ignore_files:
+                    # Cheap string checks first: most walked files are skipped
+                    # before any Path object is built.
+                    if os.path.splitext(file_name)[1] not in supported_extensions:
                         continue
-                    file_path = Path(root) / file_name
-                    if file_path.suffix not in supported_extensions:
+                    if self._should_ignore_file_name(file_name):
                         continue
 
-                    rel_path = self._normalize_rel_path(str(file_path.relative_to(repo_path)))
+                    rel_path = file_name if rel_root == "." else f"{rel_root}/{file_name}"
                     if self._should_ignore_path(rel_path):
                         continue
+                    file_path = Path(root) / file_name
+                    seen_paths.add(rel_path)
                     current_ohash = self._calculate_ohash(file_path)
 
-                    # Check if file exists and hash matches (Change Detection)
-                    result = session.run(
-                        ("MATCH (f:File {repo_id: $repo_id, path: $path}) RETURN f.ohash as hash"),
-                        repo_id=repo_id,
-                        path=rel_path,
-                    ).single()
-
-                    if result and result["hash"] == current_ohash:
-                        # Skip processing, but mark as visited if needed
+                    # Change Detection: skip files whose stored hash still matches,
+                    # unless an earlier run stopped before rebuilding them.
+                    if (
+                        known_hashes.get(rel_path) == current_ohash
+                        and rel_path not in dirty_paths
+                    ):
                         continue
 
-                    # Create/Update File Node
-                    self._upsert_file_node(
-                        session,
-                        repo_id=repo_id,
-                        rel_path=rel_path,
-                        file_name=file_name,
-                        ohash=current_ohash,
+                    file_rows.append(
+                        {"path": rel_path, "name": file_name, "ohash": current_ohash}
                     )
                     count += 1
                     changed_paths.append(rel_path)
 
+            self._upsert_file_nodes(session, repo_id=repo_id, rows=file_rows, dirty=True)
+
             # Prune File nodes that are no longer indexable under current rules.
-            existing_paths = [
-                record["path"]
-                for record in session.run(
-                    "MATCH (f:File {repo_id: $repo_id}) RETURN f.path as path",
-                    repo_id=repo_id,
-                )
-            ]
-            for rel_path in existing_paths:
-                if self._should_prune_file(rel_path, repo_path, supported_extensions):
-                    self._delete_file_subgraph(session, repo_id, rel_path)
-                    pruned_count += 1
+            # The walk applies the same filters as _should_prune_file, so any
+            # stored path it did not visit is stale or excluded.
+            stale_paths = sorted(set(known_hashes) - seen_paths)
+            self._delete_file_subgraphs(session, repo_id, stale_paths)
+            pruned_count = len(stale_paths)
 
         logger.info(f"✅ [Pass 1] Processed {count} new/modified files.")
         if pruned_count:
@@ -963,10 +1658,13 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         1. Extracts Classes/Functions.
         2. Creates 'Chunk' nodes with "Contextual Prefixing".
 
-        Embeddings for each file are computed in one batched provider request
-        (up to 100 chunks per HTTP call for Gemini via
-        :meth:`get_document_embeddings_batch`) instead of one API call per
-        entity, keeping throughput well above the per-call RPM limiter.
+        Entity rows and chunk texts are queued across files, embedded in one
+        batched provider request per flush, and written with a few UNWIND
+        queries in one transaction, so a repo with thousands of small files
+        costs a handful of round-trips instead of several per file or per
+        entity. Embedding runs on one background thread (see
+        :meth:`_submit_pass_2_batch`), so the provider wait for one batch
+        overlaps with parsing the next and writing the previous one.
 
         Args:
             repo_path: Path to repository root (defaults to self.repo_root)
@@ -978,7 +1676,7 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
 
         logger.info("🧠 [Pass 2] Extracting Entities & Creating Chunks...")
 
-        with self.driver.session() as session:
+        with self._shared_session() as session:
             if target_paths is None:
                 result = session.run(
                     "MATCH (f:File {repo_id: $repo_id}) RETURN f.path as path",
@@ -998,163 +1696,117 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                 logger.info("⏭️ [Pass 2] No changed files require entity/chunk rebuild.")
                 return
 
-            for i, rel_path in enumerate(files_to_process):
-                _safe_print(
-                    f"[{i + 1}/{len(files_to_process)}] 🧠 Processing: {rel_path}...",
-                    end="\r",
-                )
-
-                full_path = repo_path / rel_path
-                if not full_path.exists():
-                    continue
-
-                _, parsed = self._parse_source_file(full_path)
-                if not parsed["classes"] and not parsed["functions"]:
-                    continue
-
-                self._clear_file_derivatives(session, repo_id=repo_id, rel_path=rel_path)
-                file_hash = self._calculate_ohash(full_path)
-                self._upsert_file_node(
-                    session,
-                    repo_id=repo_id,
-                    rel_path=rel_path,
-                    file_name=full_path.name,
-                    ohash=file_hash,
-                )
+            pending: Dict[str, List[Dict[str, Any]]] = {
+                "files": [],
+                "classes": [],
+                "functions": [],
+            }
+            pending_chars = 0
+            # content_hash -> vector, shared across flushes so duplicate chunk
+            # texts within one run are embedded once.
+            embedding_cache: Dict[str, List[float]] = {}
+            in_flight_hashes: Set[str] = set()
+            batch_kwargs: Dict[str, Any] = {
+                "repo_id": repo_id,
+                "embedding_cache": embedding_cache,
+                "in_flight_hashes": in_flight_hashes,
+            }
+            # Each flush submits the queued rows for embedding, then writes the
+            # previously submitted batch while the new one is on the wire. One
+            # worker keeps provider calls sequential (the Gemini quota gate is
+            # per process, not per thread).
+            in_flight_batch: Optional[Dict[str, Any]] = None
+            embed_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="am-embed")
+            try:
+                parsed_files = self._iter_parsed_files(repo_path, files_to_process)
+                progress = ProgressThrottle()
+                for i, (rel_path, full_path, parsed, _) in enumerate(parsed_files):
+                    if progress.ready(final=i + 1 == len(files_to_process)):
+                        _safe_print(
+                            f"[{i + 1}/{len(files_to_process)}] 🧠 Processing: {rel_path}...",
+                            end="\r",
+                        )
 
-                # Build Class/Function nodes first, collect enriched texts in the same
-                # order as before (all classes, then all functions), then one batched
-                # embed call per file (see EmbeddingService.embed_batch_with_metadata).
-                chunk_specs: List[Dict[str, Any]] = []
-                texts_to_embed: List[str] = []
+                    if parsed is None:
+                        continue
 
-                for class_row in parsed["classes"]:
-                    class_name = class_row["name"]
-                    class_signature = f"{rel_path}:{class_name}"
-                    class_code = class_row["code"]
-                    session.run(
-                        """
-                        MATCH (f:File {repo_id: $repo_id, path: $path})
-                        MERGE (c:Class {repo_id: $repo_id, qualified_name: $sig})
-                        SET c.name = $name,
-                            c.code = $code,
-                            c.path = $path
-                        MERGE (f)-[:DEFINES]->(c)
-                        """,
-                        repo_id=repo_id,
-                        path=rel_path,
-                        sig=class_signature,
-                        name=class_name,
-                        code=class_code,
-                    )
+                    if not parsed["classes"] and not parsed["functions"]:
+                        continue
 
-                    enriched_text = f"Context: File {rel_path} > Class {class_name}\n\n{class_code}"
-                    texts_to_embed.append(enriched_text)
-                    chunk_specs.append(
+                    pending["files"].append(
                         {
-                            "kind": "class",
-                            "sig": class_signature,
-                            "text": class_code,
+                            "path": rel_path,
+                            "name": full_path.name,
+                            "ohash": self._calculate_ohash(full_path),
                         }
                     )
 
-                for function_row in parsed["functions"]:
-                    function_name = function_row["name"]
-                    parent_class = function_row.get("parent_class", "")
-                    qualified_name = function_row.get("qualified_name") or function_name
-                    function_signature = f"{rel_path}:{qualified_name}"
-                    function_code = function_row["code"]
-
-                    session.run(
-                        """
-                        MATCH (f:File {repo_id: $repo_id, path: $path})
-                        MERGE (fn:Function {repo_id: $repo_id, signature: $sig})
-                        SET fn.name = $name,
-                            fn.qualified_name = $qualified_name,
-                            fn.parent_class = $parent_class,
-                            fn.name_line = $name_line,
-                            fn.name_column = $name_column,
-                            fn.code = $code,
-                            fn.path = $path
-                        MERGE (f)-[:DEFINES]->(fn)
-                        """,
-                        repo_id=repo_id,
-                        path=rel_path,
-                        sig=function_signature,
-                        name=function_name,
-                        qualified_name=qualified_name,
-                        parent_class=parent_class,
-                        name_line=function_row.get("name_line"),
-                        name_column=function_row.get("name_column"),
-                        code=function_code,
-                    )
-
-                    if parent_class:
-                        class_signature = f"{rel_path}:{parent_class}"
-                        session.run(
-                            """
-                            MATCH (c:Class {repo_id: $repo_id, qualified_name: $csig})
-                            MATCH (fn:Function {repo_id: $repo_id, signature: $fsig})
-                            MERGE (c)-[:HAS_METHOD]->(fn)
-                            """,
-                            repo_id=repo_id,
-                            csig=class_signature,
-                            fsig=function_signature,
+                    # Queue Class/Function rows with their enriched chunk text (all
+                    # classes, then all functions). Rows are embedded and written
+                    # together across files once the queue fills up.
+                    for class_row in parsed["classes"]:
+                        class_name = class_row["name"]
+                        class_code = class_row["code"]
+                        enriched_text = f"Context: File {rel_path} > Class {class_name}\n\n{class_code}"
+                        pending["classes"].append(
+                            {
+                                "path": rel_path,
+                                "sig": f"{rel_path}:{class_name}",
+                                "name": class_name,
+                                "code": class_code,
+                                "enriched_text": enriched_text,
+                                "content_hash": self._embedding_content_hash(enriched_text),
+                            }
                         )
-
-                    context_prefix = f"File: {rel_path}"
-                    if parent_class:
-                        context_prefix += f" > Class: {parent_class}"
-                    enriched_text = (
-                        f"Context: {context_prefix} > Method: {function_name}\n\n{function_code}"
-                    )
-                    texts_to_embed.append(enriched_text)
-                    chunk_specs.append(
-                        {
-                            "kind": "function",
-                            "sig": function_signature,
-                            "text": function_code,
-                        }
-                    )
-
-                embeddings = self.get_document_embeddings_batch(texts_to_embed)
-                for spec, embedding in zip(chunk_specs, embeddings):
-                    if spec["kind"] == "class":
-                        session.run(
-                            """
-                            MATCH (c:Class {repo_id: $repo_id, qualified_name: $sig})
-                            CREATE (ch:Chunk {id: randomUUID()})
-                            SET ch.repo_id = $repo_id,
-                                ch.path = $path,
-                                ch.text = $text,
-                                ch.embedding = $embedding,
-                                ch.created_at = datetime()
-                            MERGE (ch)-[:DESCRIBES]->(c)
-                            """,
-                            repo_id=repo_id,
-                            path=rel_path,
-                            sig=spec["sig"],
-                            text=spec["text"],
-                            embedding=embedding,
+                        pending_chars += len(enriched_text)
+
+                    for function_row in parsed["functions"]:
+                        function_name = function_row["name"]
+                        parent_class = function_row.get("parent_class", "")
+                        qualified_name = function_row.get("qualified_name") or function_name
+                        function_code = function_row["code"]
+
+                        context_prefix = f"File: {rel_path}"
+                        if parent_class:
+                            context_prefix += f" > Class: {parent_class}"
+                        enriched_text = (
+                            f"Context: {context_prefix} > Method: {function_name}\n\n{function_code}"
                         )
-                    else:
-                        session.run(
-                            """
-                            MATCH (fn:Function {repo_id: $repo_id, signature: $sig})
-                            CREATE (ch:Chunk {id: randomUUID()})
-                            SET ch.repo_id = $repo_id,
-                                ch.path = $path,
-                                ch.text = $text,
-                                ch.embedding = $embedding,
-                                ch.created_at = datetime()
-                            MERGE (ch)-[:DESCRIBES]->(fn)
-                            """,
-                            repo_id=repo_id,
-                            path=rel_path,
-                            sig=spec["sig"],
-                            text=spec["text"],
-                            embedding=embedding,
+                        pending["functions"].append(
+                            {
+                                "path": rel_path,
+                                "sig": f"{rel_path}:{qualified_name}",
+                                "name": function_name,
+                                "qualified_name": qualified_name,
+                                "parent_class": parent_class,
+                                "name_line": function_row.get("name_line"),
+                                "name_column": function_row.get("name_column"),
+                                "code": function_code,
+                                "enriched_text": enriched_text,
+                                "content_hash": self._embedding_content_hash(enriched_text),
+                            }
                         )
+                        pending_chars += len(enriched_text)
+
+                    pending_count = len(pending["classes"]) + len(pending["functions"])
+                    if (
+                        pending_chars > self.EMBED_FLUSH_CHAR_BUDGET
+                        or pending_count >= self.EMBED_FLUSH_MAX_TEXTS
+                    ):
+                        submitted = self._submit_pass_2_batch(
+                            session, embed_pool, pending=pending, **batch_kwargs
+                        )
+                        self._finish_pass_2_batch(session, in_flight_batch, **batch_kwargs)
+                        in_flight_batch = submitted
+                        pending_chars = 0
+
+                submitted = self._submit_pass_2_batch(
+                    session, embed_pool, pending=pending, **batch_kwargs
+                )
+                self._finish_pass_2_batch(session, in_flight_batch, **batch_kwargs)
+                self._finish_pass_2_batch(session, submitted, **batch_kwargs)
+            finally:
+                embed_pool.shutdown(wait=True)
 
         logger.info("✅ [Pass 2] Entities and Semantic Chunks created.")
 
@@ -1162,13 +1814,13 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
     # PASS 3: IMPORT RESOLUTION
     # =========================================================================
 
-    def _extract_python_import_modules(self, code: str) -> Set[str]:
-        """Extract Python import module names from source text."""
+    def _extract_python_import_modules(self, code: str | bytes) -> Set[str]:
+        """Extract Python import module names from source text or raw bytes."""
         parsed = self._get_code_parser().parse_file(code, ".py")
         return set(parsed["imports"])
 
-    def _extract_js_ts_import_modules(self, code: str) -> Set[str]:
-        """Extract JS/TS/TSX module specifiers from source text."""
+    def _extract_js_ts_import_modules(self, code: str | bytes) -> Set[str]:
+        """Extract JS/TS/TSX module specifiers from source text or raw bytes."""
         modules: Set[str] = set()
         for extension in [".js", ".ts", ".tsx", ".jsx"]:
             parsed = self._get_code_parser().parse_file(code, extension)
@@ -1267,6 +1919,24 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
             return ""
         return spec
 
+    def _build_import_suffix_index(self, paths: list[str]) -> dict[str, Optional[str]]:
+        """Map every multi-segment path suffix to the one file that ends with it.
+
+        Used as the fallback for imports that do not resolve from the repo root,
+        such as ``pkg.utils`` living at ``src/pkg/utils.py``. Suffixes shared by
+        more than one file map to ``None`` so ambiguous imports stay unlinked.
+        """
+        index: dict[str, Optional[str]] = {}
+        for path in paths:
+            parts = path.split("/")
+            for depth in range(2, len(parts)):
+                suffix = "/".join(parts[-depth:])
+                if suffix in index and index[suffix] != path:
+                    index[suffix] = None
+                else:
+                    index[suffix] = path
+        return index
+
     def pass_3_imports(
         self,
         repo_path: Optional[Path] = None,
@@ -1288,7 +1958,7 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         logger.info("🕸️ [Pass 3] Linking Files via Imports...")
         supported_exts = {".py", ".js", ".jsx", ".ts", ".tsx"}
 
-        with self.driver.session() as session:
+        with self._shared_session() as session:
             result = session.run(
                 "MATCH (f:File {repo_id: $repo_id}) RETURN f.path as path",
                 repo_id=repo_id,
@@ -1308,11 +1978,18 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                 logger.info("⏭️ [Pass 3] No changed files require import relinking.")
                 return
 
-            for rel_path in files:
-                full_path = repo_path / rel_path
+            rebuilt_sources: list[str] = []
+            import_rows: list[dict[str, str]] = []
+            suffix_index: Optional[dict[str, Optional[str]]] = None
+            for rel_path, full_path, parsed, missing in self._iter_parsed_files(
+                repo_path, files
+            ):
                 source_ext = full_path.suffix
 
-                if not full_path.exists():
+                if parsed is None and not missing:
+                    # Unreadable but present: keep the node and its edges.
+                    continue
+                if parsed is None:
                     logger.warning(
                         "⚠️ File found in graph but missing on disk (stale): %s. Deleting node.",
                         rel_path,
@@ -1324,37 +2001,53 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                     )
                     continue
 
-                _, parsed = self._parse_source_file(full_path)
                 modules = parsed["imports"]
 
-                # Rebuild imports for this source file to avoid stale edges.
-                session.run(
-                    """
-                    MATCH (source:File {repo_id: $repo_id, path: $src})-[r:IMPORTS]->()
-                    DELETE r
-                    """,
-                    repo_id=repo_id,
-                    src=rel_path,
-                )
+                # Imports for this source file are rebuilt from scratch to avoid stale edges.
+                rebuilt_sources.append(rel_path)
 
                 exact_targets: Set[str] = set()
                 for module_name in modules:
                     candidates = self._resolve_import_candidates(rel_path, module_name, source_ext)
                     matched = {candidate for candidate in candidates if candidate in path_set}
+                    if not matched and not module_name.startswith("."):
+                        # Fallback: resolve absolute specifiers by path suffix, so
+                        # src-layout and aliased imports still link via hash lookups.
+                        if "/" in self._module_to_fuzzy_part(module_name, source_ext):
+                            if suffix_index is None:
+                                suffix_index = self._build_import_suffix_index(all_paths)
+                            matched = {
+                                target
+                                for target in (suffix_index.get(c) for c in candidates)
+                                if target is not None
+                            }
                     exact_targets.update(matched)
 
-                if exact_targets:
-                    session.run(
-                        """
-                        MATCH (source:File {repo_id: $repo_id, path: $src})
-                        UNWIND $targets as target_path
-                        MATCH (target:File {repo_id: $repo_id, path: target_path})
-                        MERGE (source)-[:IMPORTS]->(target)
-                        """,
-                        repo_id=repo_id,
-                        src=rel_path,
-                        targets=sorted(exact_targets),
-                    )
+                import_rows.extend(
+                    {"src": rel_path, "target": target} for target in sorted(exact_targets)
+                )
+
+            for batch in self._iter_write_batches(rebuilt_sources):
+                session.run(
+                    """
+                    UNWIND $paths AS src
+                    MATCH (source:File {repo_id: $repo_id, path: src})-[r:IMPORTS]->()
+                    DELETE r
+                    """,
+                    repo_id=repo_id,
+                    paths=batch,
+                )
+            for batch in self._iter_write_batches(import_rows):
+                session.run(
+                    """
+                    UNWIND $rows AS r
+                    MATCH (source:File {repo_id: $repo_id, path: r.src})
+                    MATCH (target:File {repo_id: $repo_id, path: r.target})
+                    MERGE (source)-[:IMPORTS]->(target)
+                    """,
+                    repo_id=repo_id,
+                    rows=batch,
+                )
 
             logger.info("✅ [Pass 3] Import graph built.")
 
@@ -1416,7 +2109,11 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         repo_path: Path,
         file_records: list[neo4j.Record],
     ) -> tuple[dict[str, dict[str, Any]], list[dict[str, Any]]]:
-        """Parse JS/TS files once and prepare analyzer input rows.
+        """Parse every Pass 4 file once and prepare JS/TS analyzer input rows.
+
+        Parsing goes through :meth:`_iter_parsed_files`, so large repos are
+        parsed in a process pool before the (sequential) resolution and write
+        loop runs.
 
         Returns:
             A tuple of:
@@ -1427,13 +2124,11 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         analyzer_requests: list[dict[str, Any]] = []
         js_like_extensions = {".js", ".jsx", ".ts", ".tsx"}
 
-        for record in file_records:
-            rel_path = record["path"]
-            full_path = repo_path / rel_path
-            if not full_path.exists():
+        rel_paths = [record["path"] for record in file_records]
+        for rel_path, full_path, parsed, _ in self._iter_parsed_files(repo_path, rel_paths):
+            if parsed is None:
                 continue
 
-            _, parsed = self._parse_source_file(full_path)
             parsed_by_path[rel_path] = parsed
 
             if full_path.suffix not in js_like_extensions or not parsed["functions"]:
@@ -1571,31 +2266,99 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         session: neo4j.Session,
         *,
         repo_id: str,
-        caller_signature: str,
-        callee_signatures: list[str],
-        source: str,
-        confidence: float,
+        rows: list[dict[str, Any]],
     ) -> None:
-        """Write repo-scoped CALLS edges with provenance metadata."""
-        if not callee_signatures:
+        """Write repo-scoped CALLS edges with provenance metadata.
+
+        Args:
+            session: Open Neo4j session.
+            repo_id: Repository scope for caller and callee functions.
+            rows: One dict per caller with ``caller_id``, ``callee_ids``,
+                ``source`` and ``confidence``. Ids are the element ids Pass 4
+                read up front, so each endpoint is a direct node lookup. All
+                callers are written with a single UNWIND query inside a managed
+                write transaction, which the driver retries on transient errors
+                such as lock contention.
+        """
+        rows = [row for row in rows if row["callee_ids"]]
+        if not rows:
             return
 
-        session.run(
+        session.execute_write(self._run_call_edge_write, repo_id=repo_id, rows=rows)
+
+    @staticmethod
+    def _run_call_edge_write(
+        tx: neo4j.ManagedTransaction,
+        *,
+        repo_id: str,
+        rows: list[dict[str, Any]],
+    ) -> None:
+        """Transaction function for ``_write_call_edges``."""
+        tx.run(
             """
-            MATCH (caller:Function {repo_id: $repo_id, signature: $caller_sig})
-            UNWIND $callee_sigs as callee_sig
-            MATCH (callee:Function {repo_id: $repo_id, signature: callee_sig})
+            UNWIND $rows as row
+            MATCH (caller:Function)
+            WHERE elementId(caller) = row.caller_id AND caller.repo_id = $repo_id
+            UNWIND row.callee_ids as callee_id
+            MATCH (callee:Function)
+            WHERE elementId(callee) = callee_id AND callee.repo_id = $repo_id
             MERGE (caller)-[r:CALLS]->(callee)
-            SET r.source = $source,
-                r.confidence = $confidence,
+            SET r.source = row.source,
+                r.confidence = row.confidence,
                 r.last_updated = datetime()
             """,
             repo_id=repo_id,
-            caller_sig=caller_signature,
-            callee_sigs=callee_signatures,
-            source=source,
-            confidence=confidence,
-        )
+            rows=rows,
+        ).consume()
+
+    def _flush_call_edges(
+        self,
+        session: neo4j.Session,
+        *,
+        repo_id: str,
+        rows: list[dict[str, Any]],
+    ) -> None:
+        """Write queued Pass 4 CALLS rows and empty the queue.
+
+        Transient failures are retried by the managed write transaction; an
+        error that survives the retries propagates instead of silently
+        dropping the batch's edges.
+        """
+        if not rows:
+            return
+        try:
+            for batch in self._iter_write_batches(rows):
+                self._write_call_edges(session, repo_id=repo_id, rows=batch)
+        finally:
+            rows.clear()
+
+    def _submit_call_edge_flush(
+        self,
+        flush_pool: ThreadPoolExecutor,
+        *,
+        repo_id: str,
+        rows: list[dict[str, Any]],
+    ) -> Optional[Future]:
+        """Hand queued CALLS rows to the background writer and empty the queue.
+
+        The writer opens its own session because a Neo4j session must not be
+        shared across threads. Write errors surface from the returned future.
+        """
+        if not rows:
+            return None
+        batch = list(rows)
+        rows.clear()
+        return flush_pool.submit(self._flush_call_edges_in_own_session, repo_id=repo_id, rows=batch)
+
+    def _flush_call_edges_in_own_session(
+        self,
+        *,
+        repo_id: str,
+        rows: list[dict[str, Any]],
+    ) -> None:
+        """Open a session for the background CALLS writer and flush ``rows``."""
+        with self.driver.session() as session:
+            self._flush_call_edges(session, repo_id=repo_id, rows=rows)
 
     def _clear_call_analysis_artifacts(
         self,
@@ -1610,24 +2373,39 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         both its outgoing `CALLS` edges and any persisted semantic-analysis drop
         reasons from the previous run. Keeping both cleanup operations together
         avoids stale diagnostics that would otherwise make `call-status` look
-        worse than the current code actually is.
+        worse than the current code actually is. Both deletes run in one
+        managed write transaction, so transient errors are retried.
         """
-        session.run(
+        session.execute_write(
+            self._run_call_analysis_artifact_clear,
+            repo_id=repo_id,
+            rel_path=rel_path,
+        )
+
+    @staticmethod
+    def _run_call_analysis_artifact_clear(
+        tx: neo4j.ManagedTransaction,
+        *,
+        repo_id: str,
+        rel_path: str,
+    ) -> None:
+        """Transaction function for ``_clear_call_analysis_artifacts``."""
+        tx.run(
             """
             MATCH (:File {repo_id: $repo_id, path: $path})-[:DEFINES]->(fn:Function)-[r:CALLS]->()
             DELETE r
             """,
             repo_id=repo_id,
             path=rel_path,
-        )
-        session.run(
+        ).consume()
+        tx.run(
             """
             MATCH (:File {repo_id: $repo_id, path: $path})-[r:CALL_ANALYSIS_DROP]->(:CallDropReason)
             DELETE r
             """,
             repo_id=repo_id,
             path=rel_path,
-        )
+        ).consume()
 
     def _write_call_drop_reasons(
         self,
@@ -1737,12 +2515,13 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
 
         logger.info("📞 [Pass 4] Constructing Call Graph...")
 
-        with self.driver.session() as session:
+        with self._shared_session() as session:
             result = session.run(
                 """
                 MATCH (f:File {repo_id: $repo_id})-[:DEFINES]->(fn:Function)
                 RETURN f.path as path,
                        collect({
+                           id: elementId(fn),
                            name: fn.name,
                            sig: fn.signature,
                            qualified_name: fn.qualified_name,
@@ -1758,6 +2537,14 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
             qualified_index, name_index, position_index = self._build_function_signature_indexes(
                 file_records
             )
+            # Resolve signatures to element ids once so edge writes match nodes
+            # by id instead of re-probing the (repo_id, signature) index per edge.
+            function_ids: dict[str, str] = {
+                str(function_row["sig"]): str(function_row["id"])
+                for record in file_records
+                for function_row in record.get("funcs") or []
+                if function_row.get("id") is not None
+            }
             parsed_by_path, analyzer_requests = self._prepare_typescript_analysis_requests(
                 repo_path=repo_path,
                 file_records=file_records,
@@ -1766,6 +2553,10 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                 file_records=file_records,
                 parsed_by_path=parsed_by_path,
             )
+            # The lookup tables above are all the loop needs; drop the raw
+            # records (every function's properties) before the long per-file pass.
+            file_paths = [record["path"] for record in file_records]
+            del file_records
             typescript_results: dict[str, TypeScriptFileCallAnalysis] = {}
             python_results: dict[str, PythonFileCallAnalysis] = {}
 
@@ -1895,23 +2686,39 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                     source="python_service",
                 )
 
-            for i, record in enumerate(file_records):
-                rel_path = record["path"]
-                full_path = repo_path / rel_path
-
-                # Progress logging
-                _safe_print(
-                    f"[{i + 1}/{total_files}] 📞 Processing calls in: {rel_path}...",
-                    end="\r",
-                )
+            # CALLS rows queued across files; each file's old edges are cleared
+            # before its rows are queued, so a later flush never races a clear.
+            # Flushes run on a single writer thread with its own session so the
+            # next files are parsed and resolved while a batch is being written.
+            pending_call_rows: list[dict[str, Any]] = []
+            pending_call_edges = 0
+            in_flight_flush: Optional[Future] = None
+            flush_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="am-calls")
+            try:
+                progress = ProgressThrottle()
+                for i, rel_path in enumerate(file_paths):
+                    if pending_call_edges >= self.CALL_EDGE_FLUSH_SIZE:
+                        if in_flight_flush is not None:
+                            in_flight_flush.result()
+                        in_flight_flush = self._submit_call_edge_flush(
+                            flush_pool, repo_id=repo_id, rows=pending_call_rows
+                        )
+                        pending_call_edges = 0
 
-                if not full_path.exists():
-                    continue
+                    # Progress logging
+                    if progress.ready(final=i + 1 == total_files):
+                        _safe_print(
+                            f"[{i + 1}/{total_files}] 📞 Processing calls in: {rel_path}...",
+                            end="\r",
+                        )
 
-                try:
-                    parsed = parsed_by_path.get(rel_path)
+                    # Every file still on disk was parsed up front, so a missing
+                    # entry means a missing file; no per-file stat is needed.
+                    # Pop so each parse is released once its file is done.
+                    parsed = parsed_by_path.pop(rel_path, None)
                     if parsed is None:
-                        _, parsed = self._parse_source_file(full_path)
+                        continue
+
                     function_rows = parsed["functions"]
                     if not function_rows:
                         continue
@@ -1924,9 +2731,21 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                         rel_path=rel_path,
                     )
 
+                    # Signatures are built once per function and reused below;
+                    # the loops never parse them back into path and name.
+                    function_signatures = [
+                        f"{rel_path}:{function_row['qualified_name']}"
+                        for function_row in function_rows
+                    ]
+
+                    # Only functions that exist in the graph are call candidates;
+                    # builtins and third-party names never reach the edge write.
                     local_candidates: dict[str, list[str]] = {}
-                    for function_row in function_rows:
-                        function_signature = f"{rel_path}:{function_row['qualified_name']}"
+                    for function_row, function_signature in zip(
+                        function_rows, function_signatures
+                    ):
+                        if function_signature not in function_ids:
+                            continue
                         local_candidates.setdefault(function_row["name"], []).append(
                             function_signature
                         )
@@ -1939,8 +2758,9 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                         if python_file_result is not None
                         else {}
                     )
-                    for function_row in function_rows:
-                        caller_signature = f"{rel_path}:{function_row['qualified_name']}"
+                    for function_row, caller_signature in zip(
+                        function_rows, function_signatures
+                    ):
                         resolved_calls: list[str] = []
                         call_source = "static_parser"
                         call_confidence = 0.6
@@ -1994,25 +2814,33 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                             elif typescript_file_result is not None:
                                 typescript_drop_reasons["missing_function_analysis"] += 1
                             for called_name in function_row.get("calls", []):
-                                candidate_sigs = local_candidates.get(called_name, [])
+                                if called_name not in local_candidates:
+                                    continue
+                                candidate_sigs = local_candidates[called_name]
                                 if (
                                     len(candidate_sigs) == 1
                                     and candidate_sigs[0] != caller_signature
                                 ):
                                     resolved_calls.append(candidate_sigs[0])
 
-                        deduped_calls = sorted(set(resolved_calls))
-                        if not deduped_calls:
+                        caller_id = function_ids.get(caller_signature)
+                        callee_ids = [
+                            function_ids[callee_sig]
+                            for callee_sig in sorted(set(resolved_calls))
+                            if callee_sig in function_ids
+                        ]
+                        if caller_id is None or not callee_ids:
                             continue
 
-                        self._write_call_edges(
-                            session,
-                            repo_id=repo_id,
-                            caller_signature=caller_signature,
-                            callee_signatures=deduped_calls,
-                            source=call_source,
-                            confidence=call_confidence,
+                        pending_call_rows.append(
+                            {
+                                "caller_id": caller_id,
+                                "callee_ids": callee_ids,
+                                "source": call_source,
+                                "confidence": call_confidence,
+                            }
                         )
+                        pending_call_edges += len(callee_ids)
 
                     self._write_call_drop_reasons(
                         session,
@@ -2029,8 +2857,11 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                         drop_reasons=dict(python_drop_reasons),
                     )
 
-                except (neo4j.exceptions.DatabaseError, neo4j.exceptions.ClientError) as e:
-                    logger.warning(f"⚠️ Failed to process calls in {rel_path}: {e}")
+                if in_flight_flush is not None:
+                    in_flight_flush.result()
+                self._flush_call_edges(session, repo_id=repo_id, rows=pending_call_rows)
+            finally:
+                flush_pool.shutdown(wait=True)
 
             _safe_print(
                 f"\n✅ [Pass 4] Call Graph approximation complete. Processed {total_files} files."
@@ -2047,32 +2878,80 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         This is the watcher-safe single-file path used for create/modify events.
         It keeps file structure, imports, and conservative same-file call edges
         in sync without forcing a full repository rebuild.
-        """
-        repo_path, repo_id = self._require_repo_context(repo_path)
-        normalized_path = self._normalize_rel_path(rel_path)
-        full_path = repo_path / normalized_path
 
-        if not full_path.exists():
+        Raises:
+            FileNotFoundError: If the file no longer exists on disk.
+        """
+        resolved_repo_path, _ = self._require_repo_context(repo_path)
+        full_path = resolved_repo_path / self._normalize_rel_path(rel_path)
+        if not full_path.is_file():
             raise FileNotFoundError(full_path)
+        self.reindex_files([rel_path], repo_path=repo_path)
 
-        _, parsed = self._parse_source_file(full_path)
-        file_hash = self._calculate_ohash(full_path)
+    def reindex_files(
+        self,
+        rel_paths: Iterable[str],
+        *,
+        repo_path: Optional[Path] = None,
+        parallel_parse: bool = True,
+    ) -> None:
+        """Rebuild derived graph state for a batch of changed files.
 
-        with self.driver.session() as session:
-            self._upsert_file_node(
-                session,
-                repo_id=repo_id,
-                rel_path=normalized_path,
-                file_name=full_path.name,
-                ohash=file_hash,
-            )
+        The watcher coalesces editor save bursts and multi-file refactors into
+        one call, so the File upserts share one write and Pass 2/3 parse, embed
+        and link the whole batch together instead of once per event. Files that
+        vanished before they could be read (a branch switch mid-batch) are
+        skipped; their delete events clean up the graph.
+
+        Args:
+            rel_paths: Repo-relative paths to rebuild.
+            repo_path: Repository root (defaults to ``self.repo_root``).
+            parallel_parse: When False, parse inline even for large batches.
+                Threaded callers pass False because forking a process pool
+                from a process with live observer and driver threads is unsafe.
+
+        Raises:
+            OSError: If a file exists but cannot be read; deleted files are
+                skipped instead.
+        """
+        repo_path, repo_id = self._require_repo_context(repo_path)
+        normalized_paths = list(
+            dict.fromkeys(self._normalize_rel_path(rel_path) for rel_path in rel_paths)
+        )
+        if not normalized_paths:
+            return
 
-        # Reuse the multi-pass logic for one changed file. The JIT tracing pivot
-        # keeps structural graph rebuilds cheap by stopping at Pass 3; call-path
-        # exploration now happens on demand through the trace service instead of
-        # forcing every file change to re-run repo-wide CALLS analysis.
-        self.pass_2_entity_definition(repo_path, target_paths={normalized_path})
-        self.pass_3_imports(repo_path, target_paths={normalized_path})
+        rows: list[dict[str, Any]] = []
+        for normalized_path in normalized_paths:
+            full_path = repo_path / normalized_path
+            # The hash read doubles as the existence check; other read
+            # errors propagate so the file is not mistaken for deleted.
+            try:
+                ohash = self._hash_file(full_path)
+            except FileNotFoundError:
+                logger.info("Skipping %s: removed before it could be reindexed", normalized_path)
+                continue
+            rows.append({"path": normalized_path, "name": full_path.name, "ohash": ohash})
+        if not rows:
+            return
+
+        with self.driver.session() as session:
+            self._upsert_file_nodes(session, repo_id=repo_id, rows=rows)
+
+        # Reuse the multi-pass logic for the changed files. The JIT tracing
+        # pivot keeps structural graph rebuilds cheap by stopping at Pass 3;
+        # call-path exploration now happens on demand through the trace service
+        # instead of forcing every file change to re-run repo-wide CALLS analysis.
+        target_paths = {row["path"] for row in rows}
+        previous_inline = getattr(self, "_parse_inline", False)
+        self._parse_inline = previous_inline or not parallel_parse
+        try:
+            with self._shared_parse_cache():
+                self.pass_2_entity_definition(repo_path, target_paths=target_paths)
+                self.pass_3_imports(repo_path, target_paths=target_paths)
+        finally:
+            self._parse_inline = previous_inline
+        self._prune_parse_cache()
 
     def delete_file(
         self,
@@ -2095,6 +2974,7 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         repo_path: Optional[Path] = None,
         supported_extensions: Optional[Set[str]] = None,
         full_reindex: bool = False,
+        bulk_load: bool = False,
     ) -> Dict:
         """
         Execute the default code-ingestion pipeline with cost tracking.
@@ -2108,12 +2988,18 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
             repo_path: Path to repository root (defaults to self.repo_root)
             supported_extensions: Set of file extensions to process in Pass 1
             full_reindex: When True, clear this repo's existing code graph
-                before Pass 1 so every file is reparsed and re-embedded.
+                and on-disk parse cache before Pass 1 so every file is
+                reparsed and re-embedded.
+            bulk_load: When True, drop the ``code_embeddings`` vector index
+                before Pass 2 and rebuild it once afterwards instead of
+                updating the HNSW graph on every chunk write. Semantic search
+                is unavailable while Pass 2 runs. If the run dies mid-way, the
+                next ``setup_database`` recreates the missing index.
 
         Returns:
             Dict with pipeline execution metrics
         """
-        repo_path, _ = self._require_repo_context(repo_path)
+        repo_path, repo_id = self._require_repo_context(repo_path)
 
         start_time = time.time()
         _safe_print("=" * 60)
@@ -2124,26 +3010,50 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         self.setup_database()
         setup_database_seconds = time.time() - stage_started
 
-        full_reindex_seconds = 0.0
-        if full_reindex:
+        # Every pass below reuses one session instead of opening its own.
+        with self._shared_session():
+            full_reindex_seconds = 0.0
+            if full_reindex:
+                stage_started = time.time()
+                self.clear_repo_code_graph(repo_path)
+                # Cached parses must not outlive the graph they fed.
+                self._clear_parse_cache()
+                full_reindex_seconds = time.time() - stage_started
+
             stage_started = time.time()
-            self.clear_repo_code_graph(repo_path)
-            full_reindex_seconds = time.time() - stage_started
+            changed_paths = self.pass_1_structure_scan(
+                repo_path,
+                supported_extensions=supported_extensions,
+            )
+            pass_1_seconds = time.time() - stage_started
 
-        stage_started = time.time()
-        changed_paths = self.pass_1_structure_scan(
-            repo_path,
-            supported_extensions=supported_extensions,
-        )
-        pass_1_seconds = time.time() - stage_started
+            bulk_load = bulk_load and bool(changed_paths)
 
-        stage_started = time.time()
-        self.pass_2_entity_definition(repo_path, target_paths=changed_paths)
-        pass_2_seconds = time.time() - stage_started
+            # Pass 2 and Pass 3 share one parse per changed file.
+            with self._shared_parse_cache():
+                stage_started = time.time()
+                if bulk_load:
+                    with self._shared_session() as session:
+                        session.run("DROP INDEX code_embeddings IF EXISTS")
+                try:
+                    self.pass_2_entity_definition(repo_path, target_paths=changed_paths)
+                finally:
+                    if bulk_load:
+                        # One batched HNSW build over every stored chunk.
+                        with self._shared_session() as session:
+                            session.run(self._code_vector_index_ddl())
+                pass_2_seconds = time.time() - stage_started
 
-        stage_started = time.time()
-        self.pass_3_imports(repo_path, target_paths=changed_paths)
-        pass_3_seconds = time.time() - stage_started
+                stage_started = time.time()
+                self.pass_3_imports(repo_path, target_paths=changed_paths)
+                pass_3_seconds = time.time() - stage_started
+
+            if changed_paths:
+                with self._shared_session() as session:
+                    self._clear_dirty_files(session, repo_id=repo_id, rel_paths=changed_paths)
+
+        if changed_paths:
+            self._prune_parse_cache()
 
         elapsed = time.time() - start_time
         changed_file_count = len(changed_paths)
@@ -2183,6 +3093,7 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         return {
             "elapsed_seconds": elapsed,
             "full_reindex": full_reindex,
+            "bulk_load": bulk_load,
             "changed_files": changed_file_count,
             "setup_database_seconds": setup_database_seconds,
             "full_reindex_seconds": full_reindex_seconds,
@@ -2204,8 +3115,22 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         CALLS pipeline available for diagnostics and experimentation without
         making it part of the default ingestion tax.
         """
+        self._await_indexes()
         self.pass_4_call_graph(repo_path)
 
+    def _await_indexes(self, timeout_seconds: int = 300) -> None:
+        """Wait until freshly created indexes are online before heavy lookups.
+
+        Indexes created by :meth:`setup_database` populate in the background;
+        Pass 4 issues thousands of signature lookups and should not start
+        while the planner still has to fall back to label scans.
+        """
+        try:
+            with self.driver.session() as session:
+                session.run("CALL db.awaitIndexes($timeout)", timeout=timeout_seconds)
+        except (neo4j.exceptions.DatabaseError, neo4j.exceptions.ClientError) as e:
+            logger.warning(f"Index wait skipped: {e}")
+
     def resolve_function_symbol(
         self,
         symbol: str,
@@ -2886,6 +3811,44 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                 }
             return {"imports": [], "imported_by": []}
 
+    def get_index_stats(
+        self,
+        *,
+        repo_id: str | None = None,
+        global_scope: bool = False,
+    ) -> Dict[str, Any]:
+        """Return File/Function/Class/Chunk counts and the last sync time.
+
+        Backs both ``agent-memory status`` and the MCP ``get_index_status`` tool,
+        so a long-lived process can answer it on its existing driver instead of
+        an agent spawning a fresh CLI process per check. All counts come back
+        from a single query.
+
+        Args:
+            repo_id: Repository to count; defaults to ``self.repo_id``.
+            global_scope: Count every node in the database instead of one repo.
+        """
+        with self.driver.session() as session:
+            if global_scope:
+                record = session.run(_status_counts_query("")).single()
+            else:
+                resolved_repo_id = repo_id or self.repo_id
+                if resolved_repo_id is None:
+                    raise ValueError("repo_id is required for index status")
+                record = session.run(
+                    _status_counts_query("{repo_id: $repo_id}"),
+                    repo_id=resolved_repo_id,
+                ).single()
+        if record is None:
+            return {"files": 0, "functions": 0, "classes": 0, "chunks": 0, "last_sync": None}
+        return {
+            "files": record["files"],
+            "functions": record["functions"],
+            "classes": record["classes"],
+            "chunks": record["chunks"],
+            "last_sync": record["last_updated"],
+        }
+
     def identify_impact(
         self,
         file_path: str,
@@ -3926,9 +4889,13 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                 ORDER BY fv.path
                 """
                 files_result = session.run(files_cypher, sha=sha)
-                files = [dict(record) for record in files_result]
-                additions = sum(int(file_info.get("additions", 0) or 0) for file_info in files)
-                deletions = sum(int(file_info.get("deletions", 0) or 0) for file_info in files)
+                files = []
+                additions = deletions = 0
+                for record in files_result:
+                    file_info = dict(record)
+                    files.append(file_info)
+                    additions += int(file_info.get("additions", 0) or 0)
+                    deletions += int(file_info.get("deletions", 0) or 0)
 
                 context["files"] = files
                 context["stats"] = {
@@ -19,16 +19,49 @@ Typical consumer workflow:
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import importlib.metadata
+import json
 import logging
+import os
 import re
-from typing import Any, Dict, Iterable, Iterator, List
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from tree_sitter import Language, Node, Parser, Tree
 import tree_sitter_javascript
 import tree_sitter_python
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Bump when the parse_file result shape changes so stale on-disk entries miss.
+PARSE_CACHE_VERSION = 1
+# Entries beyond this count are pruned least-recently-used first.
+PARSE_CACHE_MAX_ENTRIES = 20_000
+
+
+@functools.lru_cache(maxsize=None)
+def _load_language(name: str) -> Language:
+    """Return the process-wide ``Language`` for one bundled grammar.
+
+    ``Language`` objects are immutable and safe to share, so every
+    :class:`CodeParser` in a process (builder, watcher, CLI helpers, pool
+    workers) reuses one native grammar handle instead of loading its own.
+    """
+    if name == "python":
+        return Language(tree_sitter_python.language())
+    if name == "javascript":
+        return Language(tree_sitter_javascript.language())
+    raise ValueError(f"Unknown tree-sitter grammar: {name}")
+
+
 class CodeParser:
     """Parse Python and JavaScript-family sources into graph-ingestion records.
 
@@ -61,6 +94,21 @@ class CodeParser:
         re.VERBOSE,
     )
     _CALL_NAME_RE = re.compile(r"\b([A-Za-z_$][\w$]*)\s*\(")
+    # Node types that open a new call-owning scope; their calls belong to
+    # the nested definition, not to the enclosing function.
+    _PYTHON_NESTED_SCOPE_TYPES = frozenset({"function_definition", "class_definition"})
+    _JS_NESTED_SCOPE_TYPES = frozenset(
+        {
+            "function_declaration",
+            "function_expression",
+            "arrow_function",
+            "method_definition",
+            "class_declaration",
+        }
+    )
+    _TEXT_CALL_KEYWORDS = frozenset(
+        {"catch", "for", "function", "if", "return", "switch", "while"}
+    )
 
     def __init__(self) -> None:
         """Initialize and cache one parser per supported extension."""
@@ -69,25 +117,31 @@ class CodeParser:
         self._init_parsers()
 
     def _init_parsers(self) -> None:
-        """Create parser instances for each supported language."""
+        """Create parser instances for each supported language.
+
+        Grammars come from the shared :func:`_load_language` cache, and all
+        JavaScript-family extensions share one ``Parser`` since they use the
+        same grammar.
+        """
         try:
-            python_language = Language(tree_sitter_python.language())
+            python_language = _load_language("python")
             self.languages[".py"] = python_language
             self.parsers[".py"] = Parser(python_language)
 
-            javascript_language = Language(tree_sitter_javascript.language())
+            javascript_language = _load_language("javascript")
+            javascript_parser = Parser(javascript_language)
             for extension in self.SUPPORTED_JS_EXTENSIONS:
                 self.languages[extension] = javascript_language
-                self.parsers[extension] = Parser(javascript_language)
+                self.parsers[extension] = javascript_parser
         except (ImportError, RuntimeError) as exc:
             logger.error("Failed to initialize tree-sitter parsers: %s", exc)
 
-    def parse_file(self, code: str, extension: str) -> Dict[str, Any]:
+    def parse_file(self, code: str | bytes, extension: str) -> Dict[str, Any]:
         """Parse one source file into normalized graph-ingestion data.
 
         Args:
-            code: Full file contents (decoded text). Encoded to UTF-8 for the
-                Tree-sitter parser.
+            code: Full file contents, either raw UTF-8 bytes (preferred; handed
+                to Tree-sitter as-is) or decoded text (encoded once).
             extension: File suffix including the dot, for example ``".py"``.
 
         Returns:
@@ -97,7 +151,8 @@ class CodeParser:
                 ``parent_class``, ``code``, line/column hints, and per-function
                 ``calls`` (simple callee names).
                 ``imports``: Deduped module specifier strings.
-                ``calls``: All per-function call names flattened into one list.
+                ``calls``: All per-function call names flattened into one list,
+                deduplicated in first-seen order.
                 ``env_vars``: Python-only events for ``os.getenv`` /
                 ``os.environ.get`` / ``load_dotenv`` when detected.
                 ``diagnostics``: Non-fatal notes (unsupported extension, parse
@@ -129,8 +184,9 @@ class CodeParser:
             )
             return default_result
 
+        code_bytes = code if isinstance(code, bytes) else code.encode("utf8")
         try:
-            tree = parser.parse(code.encode("utf8"))
+            tree = parser.parse(code_bytes)
         except (RuntimeError, ValueError, TypeError) as exc:
             logger.error("Failed to parse %s source: %s", extension, exc)
             default_result["diagnostics"].append(
@@ -143,14 +199,16 @@ class CodeParser:
             return default_result
 
         if extension == ".py":
-            result = self._parse_python(tree, code)
+            result = self._parse_python(tree, code_bytes)
         else:
-            result = self._parse_javascript_like(tree, code)
+            result = self._parse_javascript_like(tree, code_bytes)
 
-        result["calls"] = [call for fn in result["functions"] for call in fn["calls"]]
+        result["calls"] = self._stable_dedupe(
+            call for fn in result["functions"] for call in fn["calls"]
+        )
         return result
 
-    def _parse_python(self, tree: Tree, code: str) -> Dict[str, Any]:
+    def _parse_python(self, tree: Tree, code: bytes) -> Dict[str, Any]:
         """Extract Python classes, functions, imports, calls, and env-var usage."""
         classes: list[dict[str, Any]] = []
         functions: list[dict[str, Any]] = []
@@ -227,7 +285,7 @@ class CodeParser:
             "diagnostics": diagnostics,
         }
 
-    def _parse_javascript_like(self, tree: Tree, code: str) -> Dict[str, Any]:
+    def _parse_javascript_like(self, tree: Tree, code: bytes) -> Dict[str, Any]:
         """Extract JavaScript/JSX/TS/TSX structure using the JS grammar."""
         classes: list[dict[str, Any]] = []
         functions: list[dict[str, Any]] = []
@@ -308,7 +366,11 @@ class CodeParser:
         # Until the project switches to a dedicated TypeScript grammar, salvage
         # the common "typed variable arrow function" shapes with a lightweight
         # text pass so graph identity remains complete enough for semantic CALLS.
-        functions.extend(self._extract_typescript_typed_arrow_functions(code, functions))
+        functions.extend(
+            self._extract_typescript_typed_arrow_functions(
+                code.decode("utf8", errors="ignore"), functions
+            )
+        )
 
         return {
             "classes": classes,
@@ -319,46 +381,40 @@ class CodeParser:
             "diagnostics": diagnostics,
         }
 
-    def _extract_python_calls(self, owner: Node, code: str) -> list[str]:
+    def _extract_python_calls(self, owner: Node, code: bytes) -> list[str]:
         """Return call names that belong to one Python function or method."""
-        call_names: list[str] = []
+        call_names: dict[bytes, None] = {}
         for node in self._walk_owned_descendants(
             owner,
-            skip_types={"function_definition", "class_definition"},
+            skip_types=self._PYTHON_NESTED_SCOPE_TYPES,
         ):
             if node.type != "call":
                 continue
             callee = node.child_by_field_name("function")
-            call_name = self._callee_name(callee, code)
+            call_name = self._callee_name_bytes(callee, code)
             if call_name:
-                call_names.append(call_name)
-        return self._stable_dedupe(call_names)
+                call_names.setdefault(call_name, None)
+        return self._decode_call_names(call_names)
 
-    def _extract_js_calls(self, owner: Node, code: str) -> list[str]:
+    def _extract_js_calls(self, owner: Node, code: bytes) -> list[str]:
         """Return call names that belong to one JS function-like owner."""
-        call_names: list[str] = []
+        call_names: dict[bytes, None] = {}
         for node in self._walk_owned_descendants(
             owner,
-            skip_types={
-                "function_declaration",
-                "function_expression",
-                "arrow_function",
-                "method_definition",
-                "class_declaration",
-            },
+            skip_types=self._JS_NESTED_SCOPE_TYPES,
         ):
             if node.type != "call_expression":
                 continue
             callee = node.child_by_field_name("function")
-            call_name = self._callee_name(callee, code)
-            if call_name and call_name != "import":
-                call_names.append(call_name)
-        return self._stable_dedupe(call_names)
+            call_name = self._callee_name_bytes(callee, code)
+            if call_name and call_name != b"import":
+                call_names.setdefault(call_name, None)
+        return self._decode_call_names(call_names)
 
     def _extract_python_env_var_event(
         self,
         node: Node,
-        code: str,
+        code: bytes,
     ) -> dict[str, Any] | None:
         """Detect a narrow set of Python env-var access patterns."""
         if node.type != "call":
@@ -388,14 +444,14 @@ class CodeParser:
                 }
         return None
 
-    def _python_from_import_module(self, node: Node, code: str) -> str:
+    def _python_from_import_module(self, node: Node, code: bytes) -> str:
         """Return the module portion of a Python `from ... import ...` statement."""
         for child in node.children:
             if child.type in {"dotted_name", "relative_import"}:
                 return self._node_text(child, code)
         return ""
 
-    def _js_variable_function(self, node: Node, code: str) -> dict[str, Any] | None:
+    def _js_variable_function(self, node: Node, code: bytes) -> dict[str, Any] | None:
         """Extract `const fn = () => {}` / `const fn = function(){}` shapes."""
         name_node = node.child_by_field_name("name")
         value_node = node.child_by_field_name("value")
@@ -420,7 +476,7 @@ class CodeParser:
             "calls": self._extract_js_calls(value_node, code),
         }
 
-    def _extract_js_import(self, node: Node, code: str) -> str | None:
+    def _extract_js_import(self, node: Node, code: bytes) -> str | None:
         """Extract one JS import-like specifier from an AST node."""
         if node.type in {"import_statement", "export_statement"}:
             for child in node.children:
@@ -542,51 +598,46 @@ class CodeParser:
 
     def _extract_calls_from_text(self, code: str) -> list[str]:
         """Best-effort call extraction for rescued TS function declarations."""
-        reserved = {
-            "catch",
-            "for",
-            "function",
-            "if",
-            "return",
-            "switch",
-            "while",
-        }
         calls = [
             match.group(1)
             for match in self._CALL_NAME_RE.finditer(code)
-            if match.group(1) not in reserved
+            if match.group(1) not in self._TEXT_CALL_KEYWORDS
         ]
         return self._stable_dedupe(calls)
 
-    def _identifier_text(self, node: Node, code: str) -> str:
-        """Return the first identifier-like child text for a definition node."""
+    def _identifier_node(self, node: Node) -> Optional[Node]:
+        """Return the name node for a definition, preferring the grammar's ``name`` field."""
+        name_node = node.child_by_field_name("name")
+        if name_node is not None:
+            return name_node
         for child in node.children:
             if child.type in {"identifier", "property_identifier"}:
-                return self._node_text(child, code)
-        return ""
+                return child
+        return None
+
+    def _identifier_text(self, node: Node, code: bytes) -> str:
+        """Return the name text for a definition node."""
+        name_node = self._identifier_node(node)
+        return self._node_text(name_node, code) if name_node is not None else ""
 
     def _identifier_line(self, node: Node) -> int:
-        """Return the 1-based line number of the first identifier-like child."""
-        for child in node.children:
-            if child.type in {"identifier", "property_identifier"}:
-                return child.start_point[0] + 1
-        return node.start_point[0] + 1
+        """Return the 1-based line number of the definition's name."""
+        name_node = self._identifier_node(node) or node
+        return name_node.start_point[0] + 1
 
     def _identifier_column(self, node: Node) -> int:
-        """Return the 1-based column number of the first identifier-like child."""
-        for child in node.children:
-            if child.type in {"identifier", "property_identifier"}:
-                return child.start_point[1] + 1
-        return node.start_point[1] + 1
+        """Return the 1-based column number of the definition's name."""
+        name_node = self._identifier_node(node) or node
+        return name_node.start_point[1] + 1
 
-    def _dotted_name_text(self, node: Node, code: str) -> str:
+    def _dotted_name_text(self, node: Node, code: bytes) -> str:
         """Return the first dotted-name child text for a Python import node."""
         for child in node.children:
             if child.type == "dotted_name":
                 return self._node_text(child, code)
         return ""
 
-    def _python_parent_class(self, node: Node, code: str) -> str:
+    def _python_parent_class(self, node: Node, code: bytes) -> str:
         """Return the nearest containing Python class name, if any."""
         current = node.parent
         while current is not None:
@@ -595,7 +646,7 @@ class CodeParser:
             current = current.parent
         return ""
 
-    def _js_parent_class(self, node: Node, code: str) -> str:
+    def _js_parent_class(self, node: Node, code: bytes) -> str:
         """Return the nearest containing JS class name, if any."""
         current = node.parent
         while current is not None:
@@ -604,7 +655,7 @@ class CodeParser:
             current = current.parent
         return ""
 
-    def _js_method_name(self, node: Node, code: str) -> str:
+    def _js_method_name(self, node: Node, code: bytes) -> str:
         """Return the property name for a JS method definition."""
         name_node = node.child_by_field_name("name")
         if name_node is not None:
@@ -625,25 +676,35 @@ class CodeParser:
             return name_node.start_point[1] + 1
         return self._identifier_column(node)
 
-    def _callee_name(self, callee: Node | None, code: str) -> str:
-        """Return a short call target name used for conservative call linking."""
+    def _callee_name_bytes(self, callee: Node | None, code: bytes) -> bytes:
+        """Return a short call target name used for conservative call linking.
+
+        The name stays a raw UTF-8 slice so repeated call sites are deduplicated
+        before any decode; see :meth:`_decode_call_names`.
+        """
         if callee is None:
-            return ""
+            return b""
         if callee.type in {"identifier", "property_identifier"}:
-            return self._node_text(callee, code)
+            return code[callee.start_byte : callee.end_byte]
         if callee.type == "attribute":
             attribute_child = callee.child_by_field_name("attribute")
             if attribute_child is not None:
-                return self._node_text(attribute_child, code)
+                return code[attribute_child.start_byte : attribute_child.end_byte]
         if callee.type == "member_expression":
             property_child = callee.child_by_field_name("property")
             if property_child is not None:
-                return self._node_text(property_child, code)
+                return code[property_child.start_byte : property_child.end_byte]
         if callee.type == "import":
-            return "import"
-        return ""
+            return b"import"
+        return b""
+
+    def _decode_call_names(self, call_names: Iterable[bytes]) -> list[str]:
+        """Decode unique call-name slices once each, keeping first-seen order."""
+        return self._stable_dedupe(
+            name.decode("utf8", errors="ignore") for name in call_names
+        )
 
-    def _full_callee_name(self, callee: Node, code: str) -> str:
+    def _full_callee_name(self, callee: Node, code: bytes) -> str:
         """Return a full dotted call expression when that is safer than the short name."""
         if callee.type in {"identifier", "property_identifier"}:
             return self._node_text(callee, code)
@@ -661,64 +722,61 @@ class CodeParser:
             return "import"
         return self._node_text(callee, code)
 
-    def _string_literal_value(self, node: Node, code: str) -> str:
+    def _string_literal_value(self, node: Node, code: bytes) -> str:
         """Strip surrounding quotes from a string literal node."""
         raw = self._node_text(node, code).strip()
         if len(raw) >= 2 and raw[0] in {"'", '"'} and raw[-1] == raw[0]:
             return raw[1:-1]
         return raw
 
-    def _node_text(self, node: Node, code: str) -> str:
+    def _node_text(self, node: Node, code: bytes) -> str:
         """Return the source slice that corresponds to one node.
 
         Tree-sitter byte offsets are measured against UTF-8 bytes, not Python's
-        Unicode code-point indexing. Slicing the original `str` directly works
+        Unicode code-point indexing. Slicing a decoded `str` directly works
         only for ASCII-only files. As soon as a file contains emoji or other
         multi-byte characters before a definition, every later symbol boundary
         drifts and function names become corrupted.
 
-        Decoding the exact byte range keeps node text stable across repositories
-        that contain Unicode in docstrings, comments, or banners.
+        The AST helpers therefore carry the raw source bytes and decode only
+        the exact byte range of each node they need.
         """
-        return code.encode("utf8")[node.start_byte:node.end_byte].decode(
-            "utf8", errors="ignore"
-        )
+        return code[node.start_byte:node.end_byte].decode("utf8", errors="ignore")
 
     def _walk(self, node: Node) -> Iterator[Node]:
-        """Yield one node and all descendants depth-first."""
-        yield node
-        for child in node.children:
-            yield from self._walk(child)
+        """Yield one node and all descendants depth-first.
+
+        Uses an explicit stack instead of nested generators, so each node costs
+        O(1) to yield regardless of how deeply it is nested.
+        """
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            yield current
+            stack.extend(reversed(current.children))
 
     def _walk_owned_descendants(
         self,
         owner: Node,
         *,
-        skip_types: set[str],
+        skip_types: frozenset[str],
     ) -> Iterator[Node]:
         """Yield descendants that belong to one function-like owner.
 
         Nested definitions are intentionally skipped so parent functions do not
         inherit calls from inner functions, inner classes, or nested methods.
         """
-        for child in owner.children:
-            if child.type in skip_types:
-                continue
-            yield child
-            for descendant in self._walk_owned_descendants(child, skip_types=skip_types):
-                yield descendant
+        stack = [child for child in reversed(owner.children) if child.type not in skip_types]
+        while stack:
+            current = stack.pop()
+            yield current
+            stack.extend(
+                child for child in reversed(current.children) if child.type not in skip_types
+            )
 
     def _stable_dedupe(self, values: Iterable[str]) -> list[str]:
         """Return values with duplicates removed while preserving first-seen order."""
-        seen: set[str] = set()
-        ordered: list[str] = []
-        for value in values:
-            normalized = value.strip()
-            if not normalized or normalized in seen:
-                continue
-            seen.add(normalized)
-            ordered.append(normalized)
-        return ordered
+        return list(dict.fromkeys(filter(None, (value.strip() for value in values))))
 
     def _dedupe_function_rows(self, rows: List[dict[str, Any]]) -> list[dict[str, Any]]:
         """Deduplicate function rows by qualified name and source line.
@@ -726,12 +784,203 @@ class CodeParser:
         JS extraction can encounter the same function through a wrapper node and
         the underlying declaration node. This keeps the first stable row only.
         """
-        seen: set[tuple[str, int]] = set()
-        ordered: list[dict[str, Any]] = []
+        ordered: dict[tuple[str, int], dict[str, Any]] = {}
         for row in rows:
             key = (str(row.get("qualified_name") or row.get("name") or ""), int(row.get("start_line") or 0))
-            if key in seen:
-                continue
-            seen.add(key)
-            ordered.append(row)
-        return ordered
+            ordered.setdefault(key, row)
+        return list(ordered.values())
+
+
+_WORKER_STATE = threading.local()
+
+
+def get_worker_parser() -> CodeParser:
+    """Return the :class:`CodeParser` owned by the calling thread.
+
+    Tree-sitter ``Parser`` objects are not safe to share between concurrent
+    callers, while the grammar ``Language`` objects are. Each process/thread therefore builds its own
+    parser on first use (reusing the shared grammars) and keeps it for every
+    later file.
+    """
+    parser = getattr(_WORKER_STATE, "parser", None)
+    if parser is None:
+        parser = CodeParser()
+        _WORKER_STATE.parser = parser
+    return parser
+
+
+def _loads_cache_entry(data: bytes) -> Dict[str, Any]:
+    """Decode a parse cache entry, using ``orjson`` when it is installed."""
+    entry: Dict[str, Any] = orjson.loads(data) if orjson is not None else json.loads(data)
+    return entry
+
+
+def _dumps_cache_entry(parsed: Dict[str, Any]) -> bytes:
+    """Encode a parse cache entry, using ``orjson`` when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(parsed)
+    return json.dumps(parsed).encode("utf8")
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_cache_salt() -> bytes:
+    """Return the cache-key prefix: format version plus code and grammar versions.
+
+    Upgrading ``tree-sitter``, a grammar package or this package (including a
+    fix to the extractors below) can change parse output without touching
+    :data:`PARSE_CACHE_VERSION`, so their versions are keyed too. The digest of
+    this module covers editable installs, whose version number stays put.
+    """
+    versions = [str(PARSE_CACHE_VERSION)]
+    for dist in (
+        "agent-memory-labs",
+        "tree-sitter",
+        "tree-sitter-python",
+        "tree-sitter-javascript",
+    ):
+        try:
+            versions.append(importlib.metadata.version(dist))
+        except importlib.metadata.PackageNotFoundError:
+            versions.append("unknown")
+    try:
+        versions.append(hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest())
+    except OSError:
+        versions.append("unknown")
+    return ":".join(versions).encode("utf8")
+
+
+_PREPARED_CACHE_DIRS: set[str] = set()
+
+
+def _prepare_cache_dir(cache_dir: Path) -> None:
+    """Create ``cache_dir`` once per process with a ``.gitignore`` covering it.
+
+    The cache usually lives inside the indexed repo, so it must not show up as
+    untracked files there.
+    """
+    key = str(cache_dir)
+    if key in _PREPARED_CACHE_DIRS:
+        return
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    gitignore = cache_dir / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("# Local parse cache written by agentic-memory.\n*\n")
+    _PREPARED_CACHE_DIRS.add(key)
+
+
+def prune_parse_cache(
+    cache_dir: str | Path,
+    max_entries: int = PARSE_CACHE_MAX_ENTRIES,
+) -> int:
+    """Delete the least recently used parse cache entries beyond ``max_entries``.
+
+    Cache hits refresh an entry's mtime, so the oldest mtimes belong to file
+    versions nothing has asked for recently (typically superseded edits).
+
+    Returns:
+        Number of entries removed.
+    """
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [entry for entry in it if entry.name.endswith(".json")]
+    except OSError:
+        return 0
+    excess = len(entries) - max_entries
+    if excess <= 0:
+        return 0
+
+    def _mtime(entry: os.DirEntry) -> int:
+        try:
+            return entry.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    entries.sort(key=_mtime)
+    removed = 0
+    for entry in entries[:excess]:
+        try:
+            os.unlink(entry.path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def parse_source_cached(
+    code: bytes,
+    ext: str,
+    cache_dir: Optional[str | Path] = None,
+    *,
+    parser: Optional[CodeParser] = None,
+) -> Dict[str, Any]:
+    """Parse ``code``, reusing an on-disk result keyed by its content hash.
+
+    Entries live at ``<cache_dir>/<blake2b>.json``, where the digest covers the
+    file bytes, the suffix, :data:`PARSE_CACHE_VERSION` and the installed
+    Tree-sitter grammar versions. An unchanged file therefore skips
+    Tree-sitter entirely on later runs. Unreadable or unwritable cache entries
+    only cost a reparse. Growth is bounded by :func:`prune_parse_cache`.
+
+    Args:
+        code: Raw file bytes.
+        ext: File suffix, as for :meth:`CodeParser.parse_file`.
+        cache_dir: Cache directory; ``None`` disables the cache.
+        parser: Parser to use on a miss (defaults to :func:`get_worker_parser`).
+
+    Returns:
+        The :meth:`CodeParser.parse_file` result.
+    """
+    parser = parser or get_worker_parser()
+    if cache_dir is None:
+        return parser.parse_file(code, ext)
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_parse_cache_salt())
+    digest.update(f":{ext.lower()}\0".encode("utf8"))
+    digest.update(code)
+    cache_path = Path(cache_dir) / f"{digest.hexdigest()}.json"
+    try:
+        parsed = _loads_cache_entry(cache_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as exc:
+        logger.debug("Ignoring unreadable parse cache entry %s: %s", cache_path, exc)
+    else:
+        try:
+            # Refresh the mtime so prune_parse_cache treats this entry as recent.
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return parsed
+
+    parsed = parser.parse_file(code, ext)
+    try:
+        _prepare_cache_dir(cache_path.parent)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(_dumps_cache_entry(parsed))
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logger.debug("Could not write parse cache entry %s: %s", cache_path, exc)
+    return parsed
+
+
+def parse_source_path(
+    path: str,
+    cache_dir: Optional[str] = None,
+) -> tuple[str, Dict[str, Any]]:
+    """Read and parse one file using the calling worker's :class:`CodeParser`.
+
+    This is the picklable entry point for ``ProcessPoolExecutor`` workers and
+    is equally safe from thread pools, because parsing goes through
+    :func:`get_worker_parser`.
+
+    Args:
+        path: Absolute path of the source file.
+        cache_dir: Optional parse cache directory (see :func:`parse_source_cached`).
+
+    Returns:
+        Tuple of ``(path, parse_result)`` where ``parse_result`` has the same
+        shape as :meth:`CodeParser.parse_file`.
+    """
+    source_path = Path(path)
+    return path, parse_source_cached(source_path.read_bytes(), source_path.suffix, cache_dir)
@@ -0,0 +1,64 @@
+"""Small helpers shared by the code-graph ingestion pipelines.
+
+Both :mod:`agentic_memory.ingestion.graph` and the legacy
+``codememory.ingestion.graph`` builder import these, so ignore-pattern
+matching, worker sizing and progress output behave the same in each.
+"""
+
+import fnmatch
+import logging
+import os
+import re
+import time
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressThrottle:
+    """Rate-limit per-file ``\\r`` progress lines to a few updates per second.
+
+    Printing every file flushes the terminal once per loop iteration, which
+    dominates short loop bodies on large repos and in CI logs.
+    """
+
+    def __init__(self, interval: float = 0.1):
+        self.interval = interval
+        self._last = float("-inf")
+
+    def ready(self, *, final: bool = False) -> bool:
+        """Return whether a progress line is due now (always for the last item)."""
+        now = time.monotonic()
+        if not final and now - self._last < self.interval:
+            return False
+        self._last = now
+        return True
+
+
+def compile_globs(patterns: List[str]) -> Optional["re.Pattern[str]"]:
+    """Compile fnmatch-style globs into one regex (``None`` when empty).
+
+    Matches :func:`fnmatch.fnmatch` semantics, including ``os.path.normcase``
+    on both sides, so callers must normcase the candidate before matching.
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns)
+    )
+
+
+def worker_count_from_env(env_var: str, default: int) -> int:
+    """Return a positive worker count from ``env_var``, or ``default`` when unset/invalid."""
+    raw = os.getenv(env_var, "").strip()
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r", env_var, raw)
+    return default
+
+
+def parse_worker_count() -> int:
+    """Return the process count for parallel parsing (``AM_PARSE_WORKERS``)."""
+    return worker_count_from_env("AM_PARSE_WORKERS", os.cpu_count() or 1)
@@ -43,7 +43,7 @@ class PythonCallAnalyzerUnavailableError(PythonCallAnalyzerError):
     """Raised when the local environment cannot run the Python analyzer."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _AnalyzerConfig:
     """Resolved configuration for the local basedpyright language server."""
 
@@ -51,7 +51,7 @@ class _AnalyzerConfig:
     disabled_reason: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonOutgoingCall:
     """One analyzer-resolved outgoing Python call target.
 
@@ -75,7 +75,7 @@ class PythonOutgoingCall:
     definition_column: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonFunctionCallAnalysis:
     """Outgoing call analysis for one Python function or method."""
 
@@ -84,7 +84,7 @@ class PythonFunctionCallAnalysis:
     outgoing_calls: tuple[PythonOutgoingCall, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonFileCallAnalysis:
     """Analyzer output for one Python file."""
 
@@ -94,7 +94,7 @@ class PythonFileCallAnalysis:
     drop_reason_counts: dict[str, int] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonAnalyzerIssue:
     """One batch-level analyzer problem from a multi-batch Python run."""
 
@@ -105,7 +105,7 @@ class PythonAnalyzerIssue:
     message: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ResolvedDefinitionTarget:
     """Result of mapping one LSP definition lookup back to repo-local symbols.
 
@@ -121,7 +121,7 @@ class _ResolvedDefinitionTarget:
     drop_reason: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _CallSite:
     """One call expression inside a function body."""
 
@@ -130,7 +130,7 @@ class _CallSite:
     column_zero: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _FunctionSymbol:
     """Python function or method definition discovered from AST."""
 
@@ -143,7 +143,7 @@ class _FunctionSymbol:
     call_sites: tuple[_CallSite, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ClassSymbol:
     """Python class definition discovered from AST."""
 
@@ -152,7 +152,7 @@ class _ClassSymbol:
     name_column: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _FileSymbolIndex:
     """Repo-local symbol cache for one Python file.
 
@@ -450,7 +450,7 @@ class PythonCallAnalyzer:
         results: dict[str, PythonFileCallAnalysis] = {}
         issues: list[PythonAnalyzerIssue] = []
         for batch_number, batch_files in enumerate(batches, start=1):
-            logger.info(
+            logger.debug(
                 "Python call analyzer batch %s/%s starting (%s files).",
                 batch_number,
                 len(batches),
@@ -520,7 +520,11 @@ class PythonCallAnalyzer:
                     )
                 continue
 
-            logger.info(
+            # One INFO line per ten batches (and the last); the rest at DEBUG.
+            logger.log(
+                logging.INFO
+                if batch_number % 10 == 0 or batch_number == len(batches)
+                else logging.DEBUG,
                 "Python call analyzer batch %s/%s completed (%s files).",
                 batch_number,
                 len(batches),
@@ -867,15 +871,10 @@ def _dedupe_python_outgoing_calls(
     calls: list[PythonOutgoingCall],
 ) -> tuple[PythonOutgoingCall, ...]:
     """Return stable deduplicated outgoing-call rows."""
-    deduped: list[PythonOutgoingCall] = []
-    seen: set[tuple[str, str, str | None]] = set()
+    deduped: dict[tuple[str, str, str | None], PythonOutgoingCall] = {}
     for call in calls:
-        key = (call.rel_path, call.name, call.qualified_name_guess)
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(call)
-    return tuple(deduped)
+        deduped.setdefault((call.rel_path, call.name, call.qualified_name_guess), call)
+    return tuple(deduped.values())
 
 
 def _increment(counter: dict[str, int], reason: str) -> None:
@@ -37,7 +37,7 @@ class TypeScriptCallAnalyzerUnavailableError(TypeScriptCallAnalyzerError):
     """Raised when the local environment cannot run the TypeScript helper."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _AnalyzerConfig:
     """Resolved configuration for the local TypeScript helper process."""
 
@@ -46,7 +46,7 @@ class _AnalyzerConfig:
     disabled_reason: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TypeScriptOutgoingCall:
     """One analyzer-resolved outgoing JS/TS call target.
 
@@ -72,7 +72,7 @@ class TypeScriptOutgoingCall:
     definition_column: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TypeScriptFunctionCallAnalysis:
     """Outgoing call analysis for one JS/TS function or method."""
 
@@ -81,7 +81,7 @@ class TypeScriptFunctionCallAnalysis:
     outgoing_calls: tuple[TypeScriptOutgoingCall, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TypeScriptFileCallAnalysis:
     """Analyzer output for one JS/TS file.
 
@@ -96,7 +96,7 @@ class TypeScriptFileCallAnalysis:
     drop_reason_counts: dict[str, int] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TypeScriptAnalyzerIssue:
     """One batch-level analyzer problem from a multi-batch run."""
 
@@ -181,7 +181,7 @@ class TypeScriptCallAnalyzer:
         results: dict[str, TypeScriptFileCallAnalysis] = {}
 
         for batch_number, batch_files in enumerate(batches, start=1):
-            logger.info(
+            logger.debug(
                 "TypeScript call analyzer batch %s/%s starting (%s files).",
                 batch_number,
                 len(batches),
@@ -296,7 +296,11 @@ class TypeScriptCallAnalyzer:
                 )
             raise
 
-        logger.info(
+        # One INFO line per ten batches (and the last); the rest at DEBUG.
+        logger.log(
+            logging.INFO
+            if batch_index % 10 == 0 or batch_index == total_batches
+            else logging.DEBUG,
             "TypeScript call analyzer batch %s/%s completed (%s files).",
             batch_index,
             total_batches,
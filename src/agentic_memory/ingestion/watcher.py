@@ -12,6 +12,7 @@ observer thread processes events until interrupted.
 
 import time
 import logging
+import threading
 from pathlib import Path
 from typing import Optional, Set
 
@@ -34,7 +35,10 @@ class CodeChangeHandler(FileSystemEventHandler):
     :meth:`KnowledgeGraphBuilder.reindex_file` on create/modify and
     :meth:`KnowledgeGraphBuilder.delete_file` on delete. Rapid duplicate
     ``modified`` events for the same path are suppressed briefly so save bursts
-    from editors do not enqueue redundant full reindexes.
+    from editors do not enqueue redundant full reindexes. Accepted events are
+    held for ``batch_window`` seconds and then applied together, so a burst
+    touching many files (a reformat, a branch switch) is parsed and embedded
+    as one :meth:`KnowledgeGraphBuilder.reindex_files` batch.
 
     Attributes:
         builder: Graph builder that owns Neo4j sessions and ignore rules.
@@ -42,6 +46,7 @@ class CodeChangeHandler(FileSystemEventHandler):
             are computed from this anchor.
         supported_extensions: File suffixes eligible for indexing; defaults to
             common Python and JS/TS extensions.
+        batch_window: Seconds to keep collecting events before applying them.
     """
 
     def __init__(
@@ -49,6 +54,7 @@ class CodeChangeHandler(FileSystemEventHandler):
         builder: KnowledgeGraphBuilder,
         repo_root: Path,
         supported_extensions: Optional[Set[str]] = None,
+        batch_window: float = 0.05,
     ):
         """Create a handler bound to one builder and repository root.
 
@@ -58,11 +64,18 @@ class CodeChangeHandler(FileSystemEventHandler):
                 repo-relative paths for graph operations.
             supported_extensions: If omitted, uses ``.py``, ``.js``, ``.ts``,
                 ``.tsx``, and ``.jsx``.
+            batch_window: Delay before a batch of pending events is applied.
         """
         self.builder = builder
         self.repo_root = repo_root
         self._debounce_cache: dict[str, float] = {}
         self.supported_extensions = supported_extensions or {".py", ".js", ".ts", ".tsx", ".jsx"}
+        self.batch_window = batch_window
+        # rel_path -> "reindex" | "delete"; the latest event for a path wins.
+        self._pending: dict[str, str] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
 
     def _is_ignored_path(self, path: Path) -> bool:
         """Return True when the path or any ancestor segment is ignored.
@@ -110,12 +123,9 @@ class CodeChangeHandler(FileSystemEventHandler):
             rel_path = str(path.relative_to(self.repo_root))
             rel_path = rel_path.replace("\\", "/")
             logger.info(f"♻️  Change detected: {rel_path}")
+            self._schedule(rel_path, "reindex")
 
-            self.builder.reindex_file(rel_path, repo_path=self.repo_root)
-
-            logger.info(f"✅ Updated graph for: {rel_path}")
-
-        except (OSError, IOError, neo4j.exceptions.DatabaseError) as e:
+        except ValueError as e:
             logger.error(f"❌ Failed to ingest {path.name}: {e}")
 
     def on_created(self, event):
@@ -133,11 +143,9 @@ class CodeChangeHandler(FileSystemEventHandler):
             rel_path = str(path.relative_to(self.repo_root))
             rel_path = rel_path.replace("\\", "/")
             logger.info(f"➕ New file detected: {rel_path}")
+            self._schedule(rel_path, "reindex")
 
-            self.builder.reindex_file(rel_path, repo_path=self.repo_root)
-            logger.info(f"✅ Indexed new file: {rel_path}")
-
-        except (OSError, IOError, neo4j.exceptions.DatabaseError) as e:
+        except ValueError as e:
             logger.error(f"❌ Failed to ingest new file {path.name}: {e}")
 
     def on_deleted(self, event):
@@ -155,14 +163,74 @@ class CodeChangeHandler(FileSystemEventHandler):
             rel_path = str(path.relative_to(self.repo_root))
             rel_path = rel_path.replace("\\", "/")
             logger.info(f"🗑️  File deleted: {rel_path}")
+            self._schedule(rel_path, "delete")
 
-            self.builder.delete_file(rel_path, repo_path=self.repo_root)
-
-            logger.info(f"✅ Removed from graph: {rel_path}")
-
-        except (OSError, neo4j.exceptions.DatabaseError) as e:
+        except ValueError as e:
             logger.error(f"❌ Failed to delete {path.name} from graph: {e}")
 
+    def _schedule(self, rel_path: str, action: str) -> None:
+        """Queue ``action`` for ``rel_path`` and arm the batch timer if idle."""
+        with self._pending_lock:
+            self._pending[rel_path] = action
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.batch_window, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Apply every pending event: deletes first, then one batched reindex."""
+        with self._flush_lock:
+            with self._pending_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return
+
+            for rel_path, action in pending.items():
+                if action != "delete":
+                    continue
+                try:
+                    self.builder.delete_file(rel_path, repo_path=self.repo_root)
+                    logger.info(f"✅ Removed from graph: {rel_path}")
+                except (OSError, neo4j.exceptions.DatabaseError) as e:
+                    logger.error(f"❌ Failed to delete {rel_path} from graph: {e}")
+
+            # A file can vanish between its event and the flush; its delete
+            # event is already on the way, so only reindex what still exists.
+            reindex_paths = [
+                rel_path
+                for rel_path, action in pending.items()
+                if action == "reindex" and (self.repo_root / rel_path).exists()
+            ]
+            if not reindex_paths:
+                return
+            try:
+                self._reindex(reindex_paths)
+                logger.info(f"✅ Updated graph for {len(reindex_paths)} file(s)")
+                return
+            except (OSError, IOError, neo4j.exceptions.DatabaseError) as e:
+                if len(reindex_paths) == 1:
+                    logger.error(f"❌ Failed to ingest {reindex_paths[0]}: {e}")
+                    return
+                logger.warning(
+                    f"⚠️  Batch update of {len(reindex_paths)} file(s) failed ({e}); "
+                    "retrying one file at a time"
+                )
+
+            # One bad file must not drop the rest of the burst.
+            for rel_path in reindex_paths:
+                try:
+                    self._reindex([rel_path])
+                    logger.info(f"✅ Updated graph: {rel_path}")
+                except (OSError, IOError, neo4j.exceptions.DatabaseError) as e:
+                    logger.error(f"❌ Failed to ingest {rel_path}: {e}")
+
+    def _reindex(self, rel_paths: list[str]) -> None:
+        """Reindex ``rel_paths`` inline; this runs on the batch timer thread."""
+        self.builder.reindex_files(rel_paths, repo_path=self.repo_root, parallel_parse=False)
+
     def _delete_file_entities(self, rel_path: str):
         """
         Delete all entities associated with a file.
@@ -261,7 +329,10 @@ def start_continuous_watch(
         while True:
             time.sleep(1)
     except KeyboardInterrupt:
+        logger.info("👋 Shutting down...")
         observer.stop()
+        # Join before the final flush so no late event re-arms the batch timer
+        # against a closed builder.
+        observer.join()
+        event_handler.flush()
         builder.close()
-        logger.info("👋 Shutting down...")
-    observer.join()
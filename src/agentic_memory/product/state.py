@@ -290,14 +290,15 @@ class ProductStateStore:
             title=title,
             metadata=metadata or {},
         )
+        timestamp = _utc_now()
         binding = {
             "workspace_id": workspace_id.strip(),
             "agent_id": agent_id.strip(),
             "session_id": session_id.strip(),
             "device_id": device_id.strip() if device_id else None,
             "project_id": project["project_id"],
-            "activated_at": _utc_now(),
-            "updated_at": _utc_now(),
+            "activated_at": timestamp,
+            "updated_at": timestamp,
             "metadata": metadata or {},
         }
         if not binding["workspace_id"] or not binding["agent_id"] or not binding["session_id"]:
@@ -552,10 +553,11 @@ class ProductStateStore:
             for index, existing in enumerate(state["hosted_api_keys"]):
                 if existing.get("key_id") != normalized_key_id:
                     continue
+                timestamp = _utc_now()
                 updated = {
                     **existing,
-                    "last_used_at": _utc_now(),
-                    "updated_at": _utc_now(),
+                    "last_used_at": timestamp,
+                    "updated_at": timestamp,
                 }
                 state["hosted_api_keys"][index] = updated
                 self._touch_state(state)
@@ -730,10 +732,11 @@ class ProductStateStore:
                     return None
                 if not self._verify_password(password, str(existing.get("password_hash") or "")):
                     return None
+                timestamp = _utc_now()
                 updated = {
                     **existing,
-                    "last_login_at": _utc_now(),
-                    "updated_at": _utc_now(),
+                    "last_login_at": timestamp,
+                    "updated_at": timestamp,
                 }
                 state["oauth_users"][index] = updated
                 self._touch_state(state)
@@ -821,11 +824,12 @@ class ProductStateStore:
                 if existing.get("resource") != normalized_resource:
                     return None
 
+                timestamp = _utc_now()
                 updated = {
                     **existing,
                     "status": "consumed",
-                    "used_at": _utc_now(),
-                    "updated_at": _utc_now(),
+                    "used_at": timestamp,
+                    "updated_at": timestamp,
                 }
                 state["oauth_authorization_codes"][index] = updated
                 self._touch_state(state)
@@ -936,10 +940,11 @@ class ProductStateStore:
             for index, existing in enumerate(state["oauth_access_tokens"]):
                 if existing.get("token_id") != normalized_token_id:
                     continue
+                timestamp = _utc_now()
                 updated = {
                     **existing,
-                    "last_used_at": _utc_now(),
-                    "updated_at": _utc_now(),
+                    "last_used_at": timestamp,
+                    "updated_at": timestamp,
                 }
                 state["oauth_access_tokens"][index] = updated
                 self._touch_state(state)
@@ -977,11 +982,12 @@ class ProductStateStore:
                     return None
                 if existing.get("resource") != normalized_resource:
                     return None
+                timestamp = _utc_now()
                 updated = {
                     **existing,
                     "status": "rotated",
-                    "rotated_at": _utc_now(),
-                    "updated_at": _utc_now(),
+                    "rotated_at": timestamp,
+                    "updated_at": timestamp,
                 }
                 state["oauth_refresh_tokens"][index] = updated
                 self._touch_state(state)
@@ -1227,6 +1233,7 @@ class ProductStateStore:
         return legacy_config.exists() or renamed_config.exists()
 
     def _normalize(self, payload: dict[str, Any]) -> dict[str, Any]:
+        timestamp = _utc_now()
         state = self._default_state()
         state.update(
             {
@@ -1254,16 +1261,16 @@ class ProductStateStore:
             components[component] = {
                 "status": record.get("status", default_status),
                 "details": record.get("details", {}),
-                "updated_at": record.get("updated_at", _utc_now()),
+                "updated_at": record.get("updated_at", timestamp),
             }
         state["runtime"]["components"] = components
 
         onboarding = dict(state["app"].get("onboarding", {}))
         onboarding["required_steps"] = list(onboarding.get("required_steps", DEFAULT_ONBOARDING_STEPS))
         onboarding["completed_steps"] = sorted(set(onboarding.get("completed_steps", [])))
-        onboarding["updated_at"] = onboarding.get("updated_at", _utc_now())
+        onboarding["updated_at"] = onboarding.get("updated_at", timestamp)
         state["app"]["onboarding"] = onboarding
-        state["app"]["updated_at"] = state["app"].get("updated_at", _utc_now())
+        state["app"]["updated_at"] = state["app"].get("updated_at", timestamp)
         state["app"]["last_seen_at"] = state["app"].get("last_seen_at")
         state["hosted_api_keys"] = [
             {
@@ -1274,8 +1281,8 @@ class ProductStateStore:
                 "token_prefix": record.get("token_prefix", ""),
                 "status": record.get("status", "active"),
                 "created_by": record.get("created_by", "operator"),
-                "created_at": record.get("created_at", _utc_now()),
-                "updated_at": record.get("updated_at", _utc_now()),
+                "created_at": record.get("created_at", timestamp),
+                "updated_at": record.get("updated_at", timestamp),
                 "last_used_at": record.get("last_used_at"),
             }
             for record in state.get("hosted_api_keys", [])
@@ -1291,8 +1298,8 @@ class ProductStateStore:
                 "scopes": sorted(set(record.get("scopes", ["mcp:tools"]))),
                 "status": record.get("status", "active"),
                 "created_by": record.get("created_by", "operator"),
-                "created_at": record.get("created_at", _utc_now()),
-                "updated_at": record.get("updated_at", _utc_now()),
+                "created_at": record.get("created_at", timestamp),
+                "updated_at": record.get("updated_at", timestamp),
                 "last_login_at": record.get("last_login_at"),
             }
             for record in state.get("oauth_users", [])
@@ -1316,8 +1323,8 @@ class ProductStateStore:
                 "scope": str(record.get("scope") or "mcp:tools").strip() or "mcp:tools",
                 "metadata": record.get("metadata", {}) if isinstance(record.get("metadata"), dict) else {},
                 "status": str(record.get("status") or "active").strip() or "active",
-                "created_at": record.get("created_at", _utc_now()),
-                "updated_at": record.get("updated_at", _utc_now()),
+                "created_at": record.get("created_at", timestamp),
+                "updated_at": record.get("updated_at", timestamp),
             }
             for record in state.get("oauth_clients", [])
             if isinstance(record, dict) and str(record.get("client_id") or "").strip()
@@ -1336,10 +1343,10 @@ class ProductStateStore:
                 "code_challenge": record.get("code_challenge", ""),
                 "code_challenge_method": record.get("code_challenge_method", "S256"),
                 "status": record.get("status", "active"),
-                "created_at": record.get("created_at", _utc_now()),
-                "expires_at": record.get("expires_at", _utc_now()),
+                "created_at": record.get("created_at", timestamp),
+                "expires_at": record.get("expires_at", timestamp),
                 "used_at": record.get("used_at"),
-                "updated_at": record.get("updated_at", _utc_now()),
+                "updated_at": record.get("updated_at", timestamp),
             }
             for record in state.get("oauth_authorization_codes", [])
             if isinstance(record, dict) and record.get("code_hash") and record.get("client_id")
@@ -1356,10 +1363,10 @@ class ProductStateStore:
                 "resource": record.get("resource", ""),
                 "scopes": sorted(set(record.get("scopes", []))),
                 "status": record.get("status", "active"),
-                "created_at": record.get("created_at", _utc_now()),
-                "expires_at": record.get("expires_at", _utc_now()),
+                "created_at": record.get("created_at", timestamp),
+                "expires_at": record.get("expires_at", timestamp),
                 "last_used_at": record.get("last_used_at"),
-                "updated_at": record.get("updated_at", _utc_now()),
+                "updated_at": record.get("updated_at", timestamp),
             }
             for record in state.get("oauth_access_tokens", [])
             if isinstance(record, dict) and record.get("token_hash") and record.get("client_id")
@@ -1376,10 +1383,10 @@ class ProductStateStore:
                 "resource": record.get("resource", ""),
                 "scopes": sorted(set(record.get("scopes", []))),
                 "status": record.get("status", "active"),
-                "created_at": record.get("created_at", _utc_now()),
-                "expires_at": record.get("expires_at", _utc_now()),
+                "created_at": record.get("created_at", timestamp),
+                "expires_at": record.get("expires_at", timestamp),
                 "rotated_at": record.get("rotated_at"),
-                "updated_at": record.get("updated_at", _utc_now()),
+                "updated_at": record.get("updated_at", timestamp),
             }
             for record in state.get("oauth_refresh_tokens", [])
             if isinstance(record, dict) and record.get("token_hash") and record.get("client_id")
@@ -1390,7 +1397,7 @@ class ProductStateStore:
                 "metric": record.get("metric"),
                 "count": int(record.get("count", 0)),
                 "metadata": record.get("metadata", {}) if isinstance(record.get("metadata"), dict) else {},
-                "updated_at": record.get("updated_at", _utc_now()),
+                "updated_at": record.get("updated_at", timestamp),
             }
             for record in state.get("usage_counters", [])
             if isinstance(record, dict) and record.get("workspace_id") and record.get("metric")
@@ -1312,6 +1312,48 @@ def get_file_info(
         return f"❌ Failed to get file info: {str(e)}"
 
 
+@mcp.tool()
+@rate_limit
+@log_tool_call
+def get_index_status(
+    repo_id: str | None = None,
+    ctx: Context | None = None,
+) -> str:
+    """
+    Report how much of the repository is indexed (the ``status`` command counts).
+
+    Answers from the server's already-open Neo4j driver, so agents polling
+    index progress do not pay a CLI start-up and bolt handshake per check.
+
+    Args:
+        repo_id: Repository id to report on; defaults to the server's repo.
+
+    Returns:
+        Formatted file, function, class and chunk counts plus the last sync time
+    """
+    current_graph = get_graph()
+    if not current_graph:
+        return "❌ Graph not initialized. Check Neo4j connection."
+
+    try:
+        stats = current_graph.get_index_stats(repo_id=repo_id)
+        output = "## 📈 Index Status\n\n"
+        output += f"- Files: {stats['files']:,}\n"
+        output += f"- Functions: {stats['functions']:,}\n"
+        output += f"- Classes: {stats['classes']:,}\n"
+        output += f"- Chunks: {stats['chunks']:,}\n"
+        output += f"- Last sync: {stats['last_sync'] or 'never'}\n"
+        return validate_tool_output(output.strip())
+    except ValueError as e:
+        return f"❌ Invalid index status request: {str(e)}"
+    except (neo4j.exceptions.DatabaseError, neo4j.exceptions.ClientError) as e:
+        logger.error(f"Index status error: {e}")
+        return f"❌ Failed to get index status: {str(e)}"
+    except Exception as e:
+        logger.error(f"Unexpected index status error: {e}")
+        return f"❌ Failed to get index status: {str(e)}"
+
+
 @mcp.tool()
 @rate_limit
 @log_tool_call
@@ -1419,7 +1461,7 @@ def _build_research_pipeline_for_repo_root(repo_root: Path):
         return None
 
     uri, user, password = neo4j_connection_triple_for_repo(repo_root)
-    conn = ConnectionManager(uri, user, password)
+    conn = ConnectionManager.shared(uri, user, password)
     extractor = EntityExtractionService(
         api_key=extraction_llm.api_key,
         model=extraction_llm.model,
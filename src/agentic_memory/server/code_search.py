@@ -636,12 +636,4 @@ def _props_source_id(props: dict[str, Any], labels: list[str]) -> str:
 
 def _stable_dedupe(values: Iterable[str]) -> list[str]:
     """Return values with duplicates removed while preserving order."""
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for value in values:
-        normalized = value.strip()
-        if not normalized or normalized in seen:
-            continue
-        seen.add(normalized)
-        ordered.append(normalized)
-    return ordered
+    return list(dict.fromkeys(filter(None, (value.strip() for value in values))))
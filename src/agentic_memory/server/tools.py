@@ -846,7 +846,7 @@ def _build_conversation_pipeline_for_repo_root(repo_root: Path) -> ConversationI
     from agentic_memory.server.app import neo4j_connection_triple_for_repo
 
     uri, user, password = neo4j_connection_triple_for_repo(repo_root)
-    conn = ConnectionManager(uri, user, password)
+    conn = ConnectionManager.shared(uri, user, password)
     embedder = build_embedding_service("chat")
     extractor = EntityExtractionService.from_env()
     return ConversationIngestionPipeline(
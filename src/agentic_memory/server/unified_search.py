@@ -41,7 +41,7 @@ from agentic_memory.web.pipeline import ResearchIngestionPipeline
 logger = logging.getLogger(__name__)
 
 # Subset strings accepted in the ``modules`` comma-list from the MCP tool layer.
-VALID_MODULES = {"code", "web", "conversation"}
+VALID_MODULES = frozenset({"code", "web", "conversation"})
 
 
 def _clip_excerpt(text: str | None, *, length: int = 300) -> str:
@@ -53,12 +53,12 @@ def _normalize_modules(modules: Iterable[str] | None) -> list[str]:
     """Normalize requested module filters."""
     if modules is None:
         return ["code", "web", "conversation"]
-    normalized: list[str] = []
-    for module in modules:
-        lowered = module.strip().lower()
-        if lowered in VALID_MODULES and lowered not in normalized:
-            normalized.append(lowered)
-    return normalized or ["code", "web", "conversation"]
+    normalized = dict.fromkeys(
+        lowered
+        for lowered in (module.strip().lower() for module in modules)
+        if lowered in VALID_MODULES
+    )
+    return list(normalized) or ["code", "web", "conversation"]
 
 
 def _normalize_code_results(
@@ -26,6 +26,11 @@ import copy
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 DEFAULT_CONFIG = {
     "neo4j": {
         "uri": "bolt://localhost:7687",
@@ -112,6 +117,29 @@ DEFAULT_CONFIG = {
     },
 }
 
+# Serialized once so fresh default dicts come from ``json.loads``, which is
+# several times cheaper than ``copy.deepcopy`` on this all-JSON structure.
+_DEFAULT_CONFIG_JSON = json.dumps(DEFAULT_CONFIG)
+
+
+def _default_config() -> Dict[str, Any]:
+    """Return a fresh, independently mutable copy of :data:`DEFAULT_CONFIG`."""
+    config: Dict[str, Any] = json.loads(_DEFAULT_CONFIG_JSON)
+    return config
+
+
+def _loads_config(data: bytes) -> Dict[str, Any]:
+    """Decode ``config.json`` bytes, using ``orjson`` when it is installed."""
+    config: Dict[str, Any] = orjson.loads(data) if orjson is not None else json.loads(data)
+    return config
+
+
+def _dumps_config(payload: Dict[str, Any]) -> bytes:
+    """Encode a config payload as indented JSON, using ``orjson`` when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf8")
+
 
 class Config:
     """Load, merge, and persist CodeMemory settings for one repository.
@@ -138,10 +166,13 @@ class Config:
         self.config_dir = repo_root / ".codememory"
         self.config_file = self.config_dir / "config.json"
         self.graphignore_file = self.config_dir / ".graphignore"
+        # Serialized merged config for the file state in ``_loaded_key`` (mtime, size).
+        self._loaded_json: Optional[str] = None
+        self._loaded_key: Optional[tuple[int, int]] = None
 
     def exists(self) -> bool:
         """Return True if ``config_file`` is present on disk."""
-        return self.config_file.exists()
+        return self.config_file.is_file()
 
     def load(self) -> Dict[str, Any]:
         """Load JSON config merged with defaults, or return a deep copy of defaults.
@@ -155,13 +186,20 @@ class Config:
                 read.
         """
         if not self.exists():
-            return copy.deepcopy(DEFAULT_CONFIG)
+            return _default_config()
 
         try:
-            with open(self.config_file, "r") as f:
-                config = json.load(f)
+            stat = self.config_file.stat()
+            key = (stat.st_mtime_ns, stat.st_size)
+            if self._loaded_json is None or self._loaded_key != key:
+                config = _loads_config(self.config_file.read_bytes())
                 # Merge with defaults to handle missing keys
-                return self._merge_defaults(config)
+                self._loaded_json = json.dumps(self._merge_defaults(config))
+                self._loaded_key = key
+            # Callers such as save_git_config mutate the result, so hand out a
+            # copy and keep the cached merge pristine.
+            config_copy: Dict[str, Any] = json.loads(self._loaded_json)
+            return config_copy
         except (json.JSONDecodeError, IOError) as e:
             raise RuntimeError(f"Failed to load config from {self.config_file}: {e}")
 
@@ -186,8 +224,11 @@ class Config:
         if payload.get("nemotron", {}).get("api_key") == "":
             payload["nemotron"]["api_key"] = None
 
-        with open(self.config_file, "w") as f:
-            json.dump(payload, f, indent=2)
+        self.config_file.write_bytes(_dumps_config(payload))
+
+        stat = self.config_file.stat()
+        self._loaded_json = json.dumps(self._merge_defaults(payload))
+        self._loaded_key = (stat.st_mtime_ns, stat.st_size)
 
     def ensure_graphignore(self, ignore_dirs: Optional[list[str]] = None) -> None:
         """Create ``.graphignore`` with defaults if the file is missing.
@@ -199,7 +240,7 @@ class Config:
             ignore_dirs: Optional directory names to write as ignore patterns;
                 trailing slashes are added per line.
         """
-        if self.graphignore_file.exists():
+        if self.graphignore_file.is_file():
             return
 
         ignore_dirs = ignore_dirs or self.load().get("indexing", {}).get("ignore_dirs", [])
@@ -231,7 +272,7 @@ class Config:
         Returns:
             List of pattern strings, or an empty list if the file is missing.
         """
-        if not self.graphignore_file.exists():
+        if not self.graphignore_file.is_file():
             return []
         patterns: list[str] = []
         with open(self.graphignore_file, "r") as f:
@@ -251,7 +292,7 @@ class Config:
         Returns:
             Merged dict with all default keys present.
         """
-        return self._deep_merge_dicts(copy.deepcopy(DEFAULT_CONFIG), config)
+        return self._deep_merge_dicts(_default_config(), config)
 
     def _deep_merge_dicts(self, base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
         """Recursively merge ``overrides`` into ``base`` (dict values merge, scalars replace).
@@ -410,7 +451,7 @@ class Config:
         """
         config = self.load()
         merged_git = self._deep_merge_dicts(
-            copy.deepcopy(DEFAULT_CONFIG["git"]),
+            _default_config()["git"],
             config.get("git", {}),
         )
         config["git"] = self._deep_merge_dicts(merged_git, git_config)
@@ -429,25 +470,22 @@ def find_repo_root(start_path: Path = None) -> Optional[Path]:
         if none, the nearest ancestor that contains ``.git``; if still none,
         ``start_path.resolve()`` as a deterministic fallback.
     """
-    start_path = start_path or Path.cwd()
-    current = start_path.resolve()
-
-    # Walk up directories looking for .codememory
-    while current != current.parent:
-        codememory_dir = current / ".codememory"
-        if codememory_dir.exists():
-            return current
-        current = current.parent
-
-    # Not found, check if current dir is a git repo
-    current = start_path.resolve()
-    while current != current.parent:
-        if (current / ".git").exists():
+    start = (start_path or Path.cwd()).resolve()
+
+    # One upward walk: a .codememory dir anywhere above wins over a nearer
+    # .git, so remember the first git root and keep climbing.
+    git_root: Optional[Path] = None
+    for current in (start, *start.parents):
+        if current == current.parent:
+            break
+        if (current / ".codememory").is_dir():
             return current
-        current = current.parent
+        # ``.git`` is a file in worktrees and submodules, so only test existence.
+        if git_root is None and (current / ".git").exists():
+            git_root = current
 
-    # Fallback to current directory
-    return start_path.resolve()
+    # Fall back to the nearest git repo, then the starting directory
+    return git_root or start
 
 
 def load_config_for_current_dir() -> Optional[Config]:
@@ -462,7 +500,7 @@ def load_config_for_current_dir() -> Optional[Config]:
     repo_root = find_repo_root()
     codememory_dir = repo_root / ".codememory"
 
-    if not codememory_dir.exists():
+    if not codememory_dir.is_dir():
         return None
 
     return Config(repo_root)
@@ -12,14 +12,30 @@ Exports:
     parse_numstat_output: Parse ``git show --numstat`` lines.
 """
 
-from codememory.ingestion.git_graph import (
-    GitGraphIngestor,
-    parse_name_status_output,
-    parse_numstat_output,
-)
+import importlib
+from typing import Any
+
+# Resolved on first attribute access (PEP 562), so importing a sibling module
+# such as ``codememory.ingestion.parser`` (as parse worker processes do)
+# does not also load the git helpers and the Neo4j driver.
+_LAZY_EXPORTS = {
+    "GitGraphIngestor": "codememory.ingestion.git_graph",
+    "parse_name_status_output": "codememory.ingestion.git_graph",
+    "parse_numstat_output": "codememory.ingestion.git_graph",
+}
 
 __all__ = [
     "GitGraphIngestor",
     "parse_name_status_output",
     "parse_numstat_output",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name from its defining module on first use."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -20,33 +20,70 @@ Dependencies:
 import os
 import hashlib
 import logging
+import threading
 import time
-import fnmatch
 import math
 import posixpath
 import re
+from bisect import bisect_right
+from collections import deque
 from pathlib import Path
-from typing import Any, List, Dict, Optional, Tuple, Set
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Iterator, List, Dict, Optional, Tuple, Set, Union
 from functools import wraps
 
 import openai
 import neo4j
 from openai import OpenAI
-from tree_sitter import Language, Parser, Query, QueryCursor
-
-# Import language bindings
-import tree_sitter_python
-import tree_sitter_javascript
-
+from tree_sitter import Parser, QueryCursor
+
+from agentic_memory.ingestion.pipeline_support import (
+    ProgressThrottle,
+    compile_globs,
+    parse_worker_count,
+    worker_count_from_env,
+)
 from codememory.core.base import BaseIngestionPipeline
 from codememory.core.connection import ConnectionManager
 from codememory.core.registry import register_source
+from codememory.ingestion.parser import get_language, get_parser, get_query
 
 logger = logging.getLogger(__name__)
 
 # Register code ingestion source at module load time
 register_source("code_treesitter", ["Memory", "Code", "Chunk"])
 
+_DEFINITION_EXTENSIONS = {".py", ".js", ".jsx", ".ts", ".tsx"}
+
+# ``@doc`` anchors on the first statement of the body, so docstrings come
+# back in the same match as their definition.
+PY_DEFINITION_QUERY = """
+(class_definition
+    name: (identifier) @name
+    body: (block . (expression_statement (string (string_content) @doc))?) @body) @class
+(function_definition
+    name: (identifier) @name
+    body: (block . (expression_statement (string (string_content) @doc))?) @body) @function
+"""
+# Simple JS/TS fallback
+JS_DEFINITION_QUERY = """
+(class_declaration name: (identifier) @name) @class
+(function_declaration name: (identifier) @name) @function
+"""
+# Pass 1 marks new/changed File nodes dirty; Pass 2 clears the flag once the
+# file's entities are written, so an interrupted run is resumed next time.
+_CLEAR_DIRTY_QUERY = "MATCH (f:File {path: $path}) REMOVE f.dirty"
+PY_IMPORT_QUERY = """
+(import_statement name: (dotted_name) @module)
+(import_from_statement module_name: (dotted_name) @module)
+"""
+# Definitions and call sites come back from one traversal; each call is then
+# bucketed into the innermost function that contains it.
+PY_CALL_QUERY = """
+(function_definition name: (identifier) @def_name) @def
+(call function: (identifier) @callee)
+"""
+
 
 class CircuitBreaker:
     """Fail-fast guard around Neo4j operations after repeated ``ServiceUnavailable``.
@@ -177,6 +214,205 @@ def retry_on_openai_error(max_retries=3, delay=1.0):
     return decorator
 
 
+# JS/TS import specifiers, compiled once rather than per file
+_JS_TS_IMPORT_PATTERNS = tuple(
+    re.compile(pattern, flags=re.MULTILINE)
+    for pattern in (
+        # import x from "mod" / import {x} from "mod" / import type {x} from "mod"
+        r'^\s*import\s+(?:type\s+)?(?:[\w*\s{},$]+\s+from\s+)?["\']([^"\']+)["\']',
+        # export {x} from "mod" / export * from "mod"
+        r'^\s*export\s+(?:type\s+)?(?:\*|\{[^}]*\})\s+from\s+["\']([^"\']+)["\']',
+        # const x = require("mod")
+        r'require\(\s*["\']([^"\']+)["\']\s*\)',
+        # import("mod")
+        r'import\(\s*["\']([^"\']+)["\']\s*\)',
+    )
+)
+
+
+def _run_write(session: neo4j.Session, cypher: str, /, **params: Any) -> None:
+    """Run one write statement in a managed transaction.
+
+    ``execute_write`` retries transient failures (leader switch, expired
+    connection) on the existing driver, so a blip replays one statement
+    instead of failing the pass.
+    """
+    session.execute_write(lambda tx: tx.run(cypher, **params).consume())
+
+
+def _bounded_map(pool, fn, *iterables, window: int) -> Iterator[Any]:
+    """Like ``pool.map`` but with at most ``window`` tasks in flight.
+
+    ``Executor.map`` submits every item up front and buffers results the
+    caller has not consumed yet, so memory grows with the repo.
+    """
+    pending: deque[Future[Any]] = deque()
+    for args in zip(*iterables):
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(pool.submit(fn, *args))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _node_text(code: bytes, node) -> str:
+    """Decode the source bytes spanned by a tree-sitter node.
+
+    Node offsets are byte offsets, so they must slice the encoded source;
+    slicing the decoded ``str`` drifts on any non-ASCII character.
+    """
+    return code[node.start_byte:node.end_byte].decode("utf8", errors="ignore")
+
+
+def _parent_class_name(code: bytes, node) -> str:
+    """Return the outermost enclosing ``class_definition`` name, or ``""``."""
+    parent_class = ""
+    current = node.parent
+    while current:
+        if current.type == "class_definition":
+            name_node = current.child_by_field_name("name")
+            if name_node is not None:
+                parent_class = _node_text(code, name_node)
+        current = current.parent
+    return parent_class
+
+
+def _calls_by_function(code: bytes, tree, rel_path: str) -> Dict[str, List[str]]:
+    """Map each function signature in ``tree`` to the names it calls directly.
+
+    Signatures match the ``rel_path:Class.method`` form written in Pass 2.
+    Calls outside any function are dropped; nested functions own their own
+    calls rather than their enclosing function.
+    """
+    defs: List[Tuple[int, int, str]] = []
+    call_nodes = []
+    for _, match in QueryCursor(get_query(".py", PY_CALL_QUERY)).matches(tree.root_node):
+        if "def" in match:
+            def_node = match["def"][0]
+            name = _node_text(code, match["def_name"][0])
+            parent_class = _parent_class_name(code, def_node)
+            qual_name = f"{parent_class}.{name}" if parent_class else name
+            defs.append((def_node.start_byte, def_node.end_byte, f"{rel_path}:{qual_name}"))
+        else:
+            call_nodes.extend(match["callee"])
+
+    if not defs:
+        return {}
+
+    # Definitions nest properly, so sorted by start each one's enclosing def
+    # is the nearest earlier def still open; the innermost def around a call
+    # is found by bisecting on starts and walking up that chain.
+    defs.sort(key=lambda d: (d[0], -d[1]))
+    starts = [start for start, _, _ in defs]
+    enclosing: List[int] = []
+    open_defs: List[int] = []
+    for index, (start, end, _) in enumerate(defs):
+        while open_defs and defs[open_defs[-1]][1] <= start:
+            open_defs.pop()
+        enclosing.append(open_defs[-1] if open_defs else -1)
+        open_defs.append(index)
+
+    calls: Dict[str, Dict[str, None]] = {}
+    for node in call_nodes:
+        index = bisect_right(starts, node.start_byte) - 1
+        while index >= 0 and defs[index][1] < node.end_byte:
+            index = enclosing[index]
+        if index >= 0:
+            calls.setdefault(defs[index][2], {}).setdefault(_node_text(code, node), None)
+    return {sig: list(names) for sig, names in calls.items()}
+
+
+def _extract_file_definitions(
+    full_path: str, rel_path: str
+) -> Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+    """Parse one file and return its Pass 2 ``(class_rows, function_rows)``.
+
+    Module-level and free of Neo4j/OpenAI state so ``pass_2_entity_definition``
+    can run it in a ``ProcessPoolExecutor``; the rows are plain dicts (no
+    tree-sitter nodes), so they pickle back to the parent process.
+
+    Returns:
+        ``None`` when the file is missing or has no definition grammar.
+    """
+    path = Path(full_path)
+    if not path.exists():
+        return None
+
+    extension = path.suffix
+    if extension not in _DEFINITION_EXTENSIONS:
+        return None
+
+    code_bytes = path.read_bytes()
+    tree = get_parser(extension).parse(code_bytes)
+
+    # Language-specific query to find definitions
+    query_scm = PY_DEFINITION_QUERY if extension == ".py" else JS_DEFINITION_QUERY
+
+    # Use updated querycursor for executing queries
+    query = get_query(".py" if extension == ".py" else ".js", query_scm)
+    cursor = QueryCursor(query)
+
+    # Collect every definition first; the file is then written with
+    # one UNWIND per label/relation instead of a round-trip per node.
+    class_rows: Dict[str, Dict[str, Any]] = {}
+    function_rows: Dict[str, Dict[str, Any]] = {}
+    for _, match in cursor.matches(tree.root_node):
+        tag = "class" if "class" in match else "function"
+        name_nodes = match.get("name")
+        if not name_nodes:
+            continue
+        name = _node_text(code_bytes, name_nodes[0])
+        doc_nodes = match.get("doc")
+        docstring = _node_text(code_bytes, doc_nodes[0]).strip() if doc_nodes else None
+        for node in match[tag]:
+            node_text = _node_text(code_bytes, node)
+
+            if tag == "class":
+                signature = f"{rel_path}:{name}"
+                row = class_rows.setdefault(
+                    signature,
+                    {
+                        "sig": signature,
+                        "chunk_text": node_text,
+                        "enriched_text": (
+                            f"Context: File {rel_path} > Class {name}\n\n{node_text}"
+                        ),
+                    },
+                )
+                row.update(name=name, code=node_text, docstring=docstring)
+
+            elif tag == "function":
+                # Check parent for Class context
+                parent_class = _parent_class_name(code_bytes, node)
+
+                qual_name = f"{parent_class}.{name}" if parent_class else name
+                full_sig = f"{rel_path}:{qual_name}"
+
+                # The secret sauce: "Contextual Prefixing"
+                context_prefix = f"File: {rel_path}"
+                if parent_class:
+                    context_prefix += f" > Class: {parent_class}"
+
+                row = function_rows.setdefault(
+                    full_sig,
+                    {
+                        "sig": full_sig,
+                        "chunk_text": node_text,
+                        "enriched_text": (
+                            f"Context: {context_prefix} > Method: {name}\n\n{node_text}"
+                        ),
+                    },
+                )
+                row.update(
+                    name=name,
+                    code=node_text,
+                    docstring=docstring,
+                    class_sig=f"{rel_path}:{parent_class}" if parent_class else None,
+                )
+
+    return list(class_rows.values()), list(function_rows.values())
+
+
 class KnowledgeGraphBuilder(BaseIngestionPipeline):
     """
     Orchestrates the creation of the Hybrid GraphRAG system.
@@ -193,7 +429,16 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
     EMBEDDING_MODEL = "text-embedding-3-large"
     COST_PER_1M_TOKENS = 0.13  # USD
     VECTOR_DIMENSIONS = 3072
+    # Inputs per embeddings request; the endpoint accepts up to 2048 and the
+    # binding limit is tokens per minute, not request count.
+    EMBED_BATCH_SIZE = 100
     DOMAIN_LABEL = "Code"
+    # Below this many files, process start-up costs more than it saves.
+    PARALLEL_PARSE_MIN_FILES = 32
+    # Concurrent Pass 2 file writers; each holds one pooled Bolt connection.
+    DEFAULT_WRITE_WORKERS = 8
+    # Functions whose called names are staged per Pass 4 write
+    CALLEE_STAGE_BATCH_SIZE = 500
 
     def __init__(
         self,
@@ -236,6 +481,8 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
             "embedding_calls": 0,
             "total_cost_usd": 0.0,
         }
+        # Pass 2 writers embed concurrently and share token_usage
+        self._usage_lock = threading.Lock()
 
         # Default ignore patterns
         self.ignore_dirs = ignore_dirs or {
@@ -254,10 +501,44 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         }
         self.ignore_files = ignore_files or set()
         self.ignore_patterns = ignore_patterns or set()
+        # Set once Pass 1 has marked this run's changed files ``dirty``.
+        self._scanned = False
+        # Compiled ignore matchers keyed by kind; rebuilt if the patterns change.
+        self._ignore_matchers: Dict[str, Tuple[frozenset, Any]] = {}
+
+    def _ignore_matcher(self, kind: str, patterns: Set[str], compile_fn) -> Any:
+        """Return ``compile_fn(patterns)``, cached until ``patterns`` changes."""
+        key = frozenset(patterns)
+        cached = self._ignore_matchers.get(kind)
+        if cached is None or cached[0] != key:
+            cached = (key, compile_fn(sorted(key)))
+            self._ignore_matchers[kind] = cached
+        return cached[1]
+
+    @staticmethod
+    def _compile_path_patterns(
+        patterns: List[str],
+    ) -> Tuple[Tuple[str, ...], Optional["re.Pattern[str]"], Optional["re.Pattern[str]"]]:
+        """Split .graphignore patterns into dir prefixes, path globs and name globs."""
+        prefixes: List[str] = []
+        path_globs: List[str] = []
+        name_globs: List[str] = []
+        for pattern in patterns:
+            p = pattern.strip().replace("\\", "/")
+            if not p:
+                continue
+            if p.endswith("/"):
+                prefixes.append(p.rstrip("/"))
+            if "/" in p:
+                path_globs.append(p)
+            else:
+                name_globs.append(p)
+        return tuple(prefixes), compile_globs(path_globs), compile_globs(name_globs)
 
     def _should_ignore_dir(self, dir_name: str) -> bool:
         """Return True when a directory should be excluded from scanning."""
-        if any(fnmatch.fnmatch(dir_name, pattern) for pattern in self.ignore_dirs):
+        matcher = self._ignore_matcher("dirs", self.ignore_dirs, compile_globs)
+        if matcher is not None and matcher.match(os.path.normcase(dir_name)):
             return True
         # Catch common virtualenv naming patterns like .venv-foo / venv-test.
         return dir_name.startswith(".venv") or dir_name.startswith("venv")
@@ -267,23 +548,17 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         if not self.ignore_patterns:
             return False
 
+        prefixes, path_matcher, name_matcher = self._ignore_matcher(
+            "paths", self.ignore_patterns, self._compile_path_patterns
+        )
         normalized = rel_path.replace("\\", "/")
-        basename = Path(normalized).name
-        for pattern in self.ignore_patterns:
-            p = pattern.strip().replace("\\", "/")
-            if not p:
-                continue
-            if p.endswith("/"):
-                prefix = p.rstrip("/")
-                if normalized == prefix or normalized.startswith(prefix + "/"):
-                    return True
-            if "/" in p:
-                if fnmatch.fnmatch(normalized, p):
-                    return True
-            else:
-                if fnmatch.fnmatch(basename, p):
-                    return True
-        return False
+        for prefix in prefixes:
+            if normalized == prefix or normalized.startswith(prefix + "/"):
+                return True
+        if path_matcher is not None and path_matcher.match(os.path.normcase(normalized)):
+            return True
+        basename = normalized.rsplit("/", 1)[-1]
+        return name_matcher is not None and name_matcher.match(os.path.normcase(basename)) is not None
 
     def _should_prune_file(
         self, rel_path: str, repo_path: Path, supported_extensions: Set[str]
@@ -305,7 +580,8 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
 
     def _delete_file_subgraph(self, session: neo4j.Session, rel_path: str):
         """Delete one File node and all derived entities/chunks."""
-        session.run(
+        _run_write(
+            session,
             """
             MATCH (f:File {path: $path})-[:DEFINES]->(entity)
             OPTIONAL MATCH (chunk:Chunk)-[:DESCRIBES]->(entity)
@@ -313,24 +589,30 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
             """,
             path=rel_path,
         )
-        session.run("MATCH (f:File {path: $path}) DETACH DELETE f", path=rel_path)
+        _run_write(session, "MATCH (f:File {path: $path}) DETACH DELETE f", path=rel_path)
 
     def _init_parsers(self) -> Dict[str, Parser]:
         """Initializes Tree-sitter parsers for Python and JS/TS."""
         parsers = {}
 
         # Python
-        py_lang = Language(tree_sitter_python.language())
-        parsers[".py"] = Parser(py_lang)
+        parsers[".py"] = Parser(get_language(".py"))
 
         # JavaScript/TypeScript
-        js_lang = Language(tree_sitter_javascript.language())
-        js_parser = Parser(js_lang)
+        js_parser = Parser(get_language(".js"))
         for ext in [".js", ".jsx", ".ts", ".tsx"]:
             parsers[ext] = js_parser
 
         return parsers
 
+    def _parse_worker_count(self) -> int:
+        """Return the process count for parallel parsing (``AM_PARSE_WORKERS``)."""
+        return parse_worker_count()
+
+    def _write_worker_count(self) -> int:
+        """Return the thread count for concurrent Pass 2 writes (``AM_WRITE_WORKERS``)."""
+        return worker_count_from_env("AM_WRITE_WORKERS", self.DEFAULT_WRITE_WORKERS)
+
     def ingest(self, source: Any) -> dict[str, Any]:
         """Ingest a repository directory. Wraps the existing multi-pass pipeline.
 
@@ -369,6 +651,8 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
             "CREATE CONSTRAINT file_path_unique IF NOT EXISTS FOR (f:File) REQUIRE f.path IS UNIQUE",
             "CREATE CONSTRAINT function_sig_unique IF NOT EXISTS FOR (f:Function) REQUIRE f.signature IS UNIQUE",
             "CREATE CONSTRAINT class_name_unique IF NOT EXISTS FOR (c:Class) REQUIRE c.qualified_name IS UNIQUE",
+            # Pass 4 and the watcher resolve callees by bare name
+            "CREATE INDEX function_name IF NOT EXISTS FOR (f:Function) ON (f.name)",
             # 2. Vector Index for Hybrid Search
             f"""
             CREATE VECTOR INDEX code_embeddings IF NOT EXISTS
@@ -398,13 +682,23 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
     # =========================================================================
 
     def _calculate_ohash(self, file_path: Path) -> str:
-        """Calculates MD5 hash of file content for change detection."""
+        """Calculates MD5 hash of file content for change detection.
+
+        Streams the file instead of reading it whole; ``hashlib.file_digest``
+        (Python 3.11+) does the loop in C.
+        """
         try:
-            return hashlib.md5(file_path.read_bytes()).hexdigest()
+            with open(file_path, "rb") as handle:
+                if hasattr(hashlib, "file_digest"):
+                    file_hash: str = hashlib.file_digest(handle, "md5").hexdigest()
+                    return file_hash
+                digest = hashlib.md5()
+                for block in iter(lambda: handle.read(1 << 20), b""):
+                    digest.update(block)
+                return digest.hexdigest()
         except (OSError, IOError):
             return ""
 
-    @retry_on_openai_error(max_retries=3, delay=1.0)
     def get_embedding(self, text: str) -> List[float]:
         """
         Generates embedding using OpenAI text-embedding-3-large with token tracking and truncation.
@@ -415,40 +709,66 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         Returns:
             List of floats representing the embedding vector
         """
+        embeddings: List[List[float]] = self.get_embeddings([text])
+        return embeddings[0]
+
+    @retry_on_openai_error(max_retries=3, delay=1.0)
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embeds many texts with one OpenAI request per ``EMBED_BATCH_SIZE`` inputs.
+
+        Args:
+            texts: The texts to embed
+
+        Returns:
+            One embedding vector per input text, in input order
+        """
+        if not texts:
+            return []
+
         if self.openai_client is None:
             logger.warning("OPENAI_API_KEY not configured; returning zero-vector embedding.")
-            return [0.0] * self.VECTOR_DIMENSIONS
+            return [[0.0] * self.VECTOR_DIMENSIONS for _ in texts]
 
         # Truncate text to avoid OpenAI 400 Bad Request (Limit is 8192 tokens)
         # Using 24000 chars as safety margin for most code files.
         MAX_CHARS = 24000
 
-        if len(text) > MAX_CHARS:
-            logger.warning(
-                f"⚠️ Truncating text chunk of size {len(text)} to {MAX_CHARS} chars."
-            )
-            text = text[:MAX_CHARS] + "...[TRUNCATED]"
-
-        text = text.replace("\n", " ")
-
-        try:
-            response = self.openai_client.embeddings.create(
-                input=[text], model=self.EMBEDDING_MODEL
-            )
+        prepared = []
+        for text in texts:
+            if len(text) > MAX_CHARS:
+                logger.warning(
+                    f"⚠️ Truncating text chunk of size {len(text)} to {MAX_CHARS} chars."
+                )
+                text = text[:MAX_CHARS] + "...[TRUNCATED]"
+            prepared.append(text.replace("\n", " "))
+
+        embeddings: List[List[float]] = []
+        for start in range(0, len(prepared), self.EMBED_BATCH_SIZE):
+            batch = prepared[start:start + self.EMBED_BATCH_SIZE]
+            try:
+                response = self.openai_client.embeddings.create(
+                    input=batch, model=self.EMBEDDING_MODEL
+                )
 
-            # Track token usage
-            tokens_used = response.usage.total_tokens
-            self.token_usage["embedding_tokens"] += tokens_used
-            self.token_usage["embedding_calls"] += 1
-            self.token_usage["total_cost_usd"] = (
-                self.token_usage["embedding_tokens"] / 1_000_000
-            ) * self.COST_PER_1M_TOKENS
+                # Track token usage
+                tokens_used = response.usage.total_tokens
+                with self._usage_lock:
+                    self.token_usage["embedding_tokens"] += tokens_used
+                    self.token_usage["embedding_calls"] += 1
+                    self.token_usage["total_cost_usd"] = (
+                        self.token_usage["embedding_tokens"] / 1_000_000
+                    ) * self.COST_PER_1M_TOKENS
+
+                embeddings.extend(
+                    item.embedding for item in sorted(response.data, key=lambda d: d.index)
+                )
+            except (openai.APIError, openai.RateLimitError, openai.APIConnectionError) as e:
+                logger.error(f"❌ OpenAI Embedding Error: {e}")
+                # Zero-vectors on failure to allow pipeline to continue
+                embeddings.extend([0.0] * self.VECTOR_DIMENSIONS for _ in batch)
 
-            return response.data[0].embedding
-        except (openai.APIError, openai.RateLimitError, openai.APIConnectionError) as e:
-            logger.error(f"❌ OpenAI Embedding Error: {e}")
-            # Return zero-vector on failure to allow pipeline to continue
-            return [0.0] * self.VECTOR_DIMENSIONS
+        return embeddings
 
     # =========================================================================
     # PASS 1: STRUCTURE SCAN & CHANGE DETECTION
@@ -459,7 +779,8 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
     ):
         """
         Scans the directory structure.
-        Creates File nodes if they are new or modified. Skips if oHash matches.
+        Creates File nodes if they are new or modified. Skips if oHash matches,
+        unless the File is still ``dirty`` from a run that stopped before Pass 2.
 
         Args:
             repo_path: Path to repository root (defaults to self.repo_root)
@@ -477,6 +798,16 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         count = 0
         pruned_count = 0
         with self.driver.session() as session:
+            # One read for every stored hash instead of a lookup per file
+            known_hashes: Dict[str, Any] = {}
+            dirty_paths: Set[str] = set()
+            for record in session.run(
+                "MATCH (f:File) RETURN f.path as path, f.ohash as hash, f.dirty as dirty"
+            ):
+                known_hashes[record["path"]] = record["hash"]
+                if record.get("dirty"):
+                    dirty_paths.add(record["path"])
+
             for root, dirs, files in os.walk(repo_path):
                 # Filter directories
                 dirs[:] = [d for d in dirs if not self._should_ignore_dir(d)]
@@ -493,22 +824,21 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                         continue
                     current_ohash = self._calculate_ohash(file_path)
 
-                    # Check if file exists and hash matches (Change Detection)
-                    result = session.run(
-                        "MATCH (f:File {path: $path}) RETURN f.ohash as hash", path=rel_path
-                    ).single()
-
-                    if result and result["hash"] == current_ohash:
+                    # Change Detection: skip files whose stored hash still matches,
+                    # unless an earlier run stopped before Pass 2 rebuilt them.
+                    if known_hashes.get(rel_path) == current_ohash and rel_path not in dirty_paths:
                         # Skip processing, but mark as visited if needed
                         continue
 
                     # Create/Update File Node
-                    session.run(
+                    _run_write(
+                        session,
                         """
                         MERGE (f:File {path: $path})
                         SET f.name = $name,
                             f.ohash = $ohash,
-                            f.last_updated = datetime()
+                            f.last_updated = datetime(),
+                            f.dirty = true
                     """,
                         path=rel_path,
                         name=file_name,
@@ -517,15 +847,12 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                     count += 1
 
             # Prune File nodes that are no longer indexable under current rules.
-            existing_paths = [
-                record["path"]
-                for record in session.run("MATCH (f:File) RETURN f.path as path")
-            ]
-            for rel_path in existing_paths:
+            for rel_path in known_hashes:
                 if self._should_prune_file(rel_path, repo_path, supported_extensions):
                     self._delete_file_subgraph(session, rel_path)
                     pruned_count += 1
 
+        self._scanned = True
         logger.info(f"✅ [Pass 1] Processed {count} new/modified files.")
         if pruned_count:
             logger.info(f"🧹 [Pass 1] Pruned {pruned_count} excluded/stale files from graph.")
@@ -551,221 +878,238 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         logger.info("🧠 [Pass 2] Extracting Entities & Creating Chunks...")
 
         with self.driver.session() as session:
-            # Fetch all files that need indexing
-            result = session.run("MATCH (f:File) RETURN f.path as path")
+            # Fetch all files that need indexing: those Pass 1 marked dirty
+            # (this run's changes plus any an interrupted run left behind),
+            # or every File when Pass 1 has not run on this builder.
+            if self._scanned:
+                result = session.run("MATCH (f:File) WHERE f.dirty RETURN f.path as path")
+            else:
+                result = session.run("MATCH (f:File) RETURN f.path as path")
             files_to_process = [record["path"] for record in result]
 
-            for i, rel_path in enumerate(files_to_process):
-                print(f"[{i+1}/{len(files_to_process)}] 🧠 Processing: {rel_path}...", end="\r")
+            full_paths = [str(repo_path / rel_path) for rel_path in files_to_process]
+            workers = min(self._parse_worker_count(), len(files_to_process))
+            pool = None
+            if workers > 1 and len(files_to_process) >= self.PARALLEL_PARSE_MIN_FILES:
+                # Tree-sitter parsing is CPU-bound; parse in worker processes
+                # while this process embeds and writes earlier files in order.
+                pool = ProcessPoolExecutor(max_workers=workers)
+                extracted_files = _bounded_map(
+                    pool,
+                    _extract_file_definitions,
+                    full_paths,
+                    files_to_process,
+                    window=workers * 4,
+                )
+            else:
+                extracted_files = map(_extract_file_definitions, full_paths, files_to_process)
+
+            # Embedding and Bolt round-trips are latency-bound: keep several
+            # files in flight, each writer on its own session.
+            write_workers = self._write_worker_count()
+            writers = None
+            if write_workers > 1:
+                writers = ThreadPoolExecutor(
+                    max_workers=write_workers, thread_name_prefix="cm-write"
+                )
+            pending: deque[Future] = deque()
+
+            try:
+                progress = ProgressThrottle()
+                for i, (rel_path, extracted) in enumerate(zip(files_to_process, extracted_files)):
+                    if progress.ready(final=i + 1 == len(files_to_process)):
+                        print(
+                            f"[{i+1}/{len(files_to_process)}] 🧠 Processing: {rel_path}...",
+                            end="\r",
+                        )
+                    if extracted is None:
+                        # Missing or no grammar: nothing to rebuild for it.
+                        _run_write(session, _CLEAR_DIRTY_QUERY, path=rel_path)
+                        continue
 
-                full_path = repo_path / rel_path
-                if not full_path.exists():
-                    continue
+                    class_rows, function_rows = extracted
+                    if writers is None:
+                        self._write_file_entities(
+                            session,
+                            rel_path=rel_path,
+                            class_rows=class_rows,
+                            function_rows=function_rows,
+                        )
+                        continue
 
-                code_content = full_path.read_text(errors="ignore")
-                extension = full_path.suffix
-                parser = self.parsers.get(extension)
-                if not parser:
-                    continue
+                    # Bound in-flight files so parsed rows cannot pile up
+                    if len(pending) >= 2 * write_workers:
+                        pending.popleft().result()
+                    pending.append(
+                        writers.submit(
+                            self._write_file_entities_in_own_session,
+                            rel_path=rel_path,
+                            class_rows=class_rows,
+                            function_rows=function_rows,
+                        )
+                    )
 
-                tree = parser.parse(bytes(code_content, "utf8"))
-
-                # Language-specific query to find definitions
-                if extension == ".py":
-                    query_scm = """
-                    (class_definition
-                        name: (identifier) @name
-                        body: (block) @body) @class
-                    (function_definition
-                        name: (identifier) @name
-                        body: (block) @body) @function
-                    """
-                else:  # Simple JS/TS fallback
-                    query_scm = """
-                    (class_declaration name: (identifier) @name) @class
-                    (function_declaration name: (identifier) @name) @function
-                    """
+                while pending:
+                    pending.popleft().result()
+            finally:
+                if writers is not None:
+                    writers.shutdown(wait=True)
+                if pool is not None:
+                    pool.shutdown(wait=True, cancel_futures=True)
 
-                # Use updated querycursor for executing queries
-                lang = (
-                    Language(tree_sitter_python.language())
-                    if extension == ".py"
-                    else Language(tree_sitter_javascript.language())
-                )
+        logger.info("✅ [Pass 2] Entities and Semantic Chunks created.")
 
-                query = Query(lang, query_scm)
-                cursor = QueryCursor(query)
-                captures = cursor.captures(tree.root_node)
-
-                # Process captures
-                for tag, nodes in captures.items():
-                    for node in nodes:
-                        node_text = code_content[node.start_byte:node.end_byte]
-                        name = ""
-
-                        # Try to extract name from identifier child
-                        for child in node.children:
-                            if child.type == "identifier":
-                                name = code_content[child.start_byte:child.end_byte]
-                                break
-
-                        if not name:
-                            continue
-
-                        signature = f"{rel_path}:{name}"
-
-                        if tag == "class":
-                            # 1. Create Class Node
-                            session.run(
-                                """
-                                MATCH (f:File {path: $path})
-                                MERGE (c:Class {qualified_name: $sig})
-                                SET c.name = $name, c.code = $code
-                                MERGE (f)-[:DEFINES]->(c)
-                            """,
-                                path=rel_path,
-                                sig=signature,
-                                name=name,
-                                code=node_text,
-                            )
-
-                            # 2. Hybrid Chunking: Class Context
-                            # Skip if chunk already exists (avoid re-embedding)
-                            existing = session.run(
-                                """
-                                MATCH (c:Class {qualified_name: $sig})
-                                OPTIONAL MATCH (ch:Chunk)-[:DESCRIBES]->(c)
-                                RETURN ch.id as chunk_id LIMIT 1
-                            """,
-                                sig=signature,
-                            ).single()
-
-                            if not existing or not existing["chunk_id"]:
-                                # Prepend context to the vector
-                                enriched_text = f"Context: File {rel_path} > Class {name}\n\n{node_text}"
-                                embedding = self.get_embedding(enriched_text)
-
-                                session.run(
-                                    """
-                                    MATCH (c:Class {qualified_name: $sig})
-                                    CREATE (ch:Chunk {id: randomUUID()})
-                                    SET ch.text = $text,
-                                        ch.embedding = $embedding,
-                                        ch.created_at = datetime()
-                                    MERGE (ch)-[:DESCRIBES]->(c)
-                                """,
-                                    sig=signature,
-                                    text=node_text,
-                                    embedding=embedding,
-                                )
-
-                        elif tag == "function":
-                            # Check parent for Class context
-                            parent_class = ""
-                            current = node.parent
-                            while current:
-                                if current.type == "class_definition":
-                                    for child in current.children:
-                                        if child.type == "identifier":
-                                            parent_class = code_content[
-                                                child.start_byte:child.end_byte
-                                            ]
-                                            break
-                                current = current.parent
-
-                            qual_name = f"{parent_class}.{name}" if parent_class else name
-                            full_sig = f"{rel_path}:{qual_name}"
-
-                            # 1. Create Function Node
-                            session.run(
-                                """
-                                MATCH (f:File {path: $path})
-                                MERGE (fn:Function {signature: $sig})
-                                SET fn.name = $name, fn.code = $code
-                                MERGE (f)-[:DEFINES]->(fn)
-                            """,
-                                path=rel_path,
-                                sig=full_sig,
-                                name=name,
-                                code=node_text,
-                            )
-
-                            # Link to parent class if exists
-                            if parent_class:
-                                class_sig = f"{rel_path}:{parent_class}"
-                                session.run(
-                                    """
-                                    MATCH (c:Class {qualified_name: $csig})
-                                    MATCH (fn:Function {signature: $fsig})
-                                    MERGE (c)-[:HAS_METHOD]->(fn)
-                                """,
-                                    csig=class_sig,
-                                    fsig=full_sig,
-                                )
-
-                            # 2. Hybrid Chunking: Function Context
-                            # Skip if chunk already exists (avoid re-embedding)
-                            existing = session.run(
-                                """
-                                MATCH (fn:Function {signature: $sig})
-                                OPTIONAL MATCH (ch:Chunk)-[:DESCRIBES]->(fn)
-                                RETURN ch.id as chunk_id LIMIT 1
-                            """,
-                                sig=full_sig,
-                            ).single()
-
-                            if not existing or not existing["chunk_id"]:
-                                # The secret sauce: "Contextual Prefixing"
-                                context_prefix = f"File: {rel_path}"
-                                if parent_class:
-                                    context_prefix += f" > Class: {parent_class}"
-
-                                enriched_text = (
-                                    f"Context: {context_prefix} > Method: {name}\n\n{node_text}"
-                                )
-                                embedding = self.get_embedding(enriched_text)
-
-                                session.run(
-                                    """
-                                    MATCH (fn:Function {signature: $sig})
-                                    CREATE (ch:Chunk {id: randomUUID()})
-                                    SET ch.text = $text,
-                                        ch.embedding = $embedding,
-                                        ch.created_at = datetime()
-                                    MERGE (ch)-[:DESCRIBES]->(fn)
-                                """,
-                                    sig=full_sig,
-                                    text=node_text,
-                                    embedding=embedding,
-                                )
+    def _write_file_entities_in_own_session(self, **kwargs: Any) -> None:
+        """Run ``_write_file_entities`` on a fresh session; sessions are not thread-safe."""
+        with self.driver.session() as session:
+            self._write_file_entities(session, **kwargs)
 
-        logger.info("✅ [Pass 2] Entities and Semantic Chunks created.")
+    def _write_file_entities(
+        self,
+        session: neo4j.Session,
+        *,
+        rel_path: str,
+        class_rows: List[Dict[str, Any]],
+        function_rows: List[Dict[str, Any]],
+    ) -> None:
+        """Write one file's classes, functions and chunks in a single transaction.
+
+        Entities that already have a ``Chunk`` are not re-embedded. Embeddings are
+        computed before the transaction opens, so the write itself is only the
+        batched ``UNWIND`` statements.
+
+        Args:
+            session: Open Neo4j session.
+            rel_path: Repo-relative path of the defining file.
+            class_rows: One dict per class (``sig``, ``name``, ``code``, ``docstring``,
+                ``chunk_text``, ``enriched_text``).
+            function_rows: One dict per function; as ``class_rows`` plus
+                ``class_sig`` for methods.
+        """
+        if not class_rows and not function_rows:
+            _run_write(session, _CLEAR_DIRTY_QUERY, path=rel_path)
+            return
+
+        chunked_classes = {
+            record["sig"]
+            for record in session.run(
+                """
+                UNWIND $sigs as sig
+                MATCH (:Chunk)-[:DESCRIBES]->(c:Class {qualified_name: sig})
+                RETURN DISTINCT sig
+                """,
+                sigs=[row["sig"] for row in class_rows],
+            )
+        }
+        chunked_functions = {
+            record["sig"]
+            for record in session.run(
+                """
+                UNWIND $sigs as sig
+                MATCH (:Chunk)-[:DESCRIBES]->(fn:Function {signature: sig})
+                RETURN DISTINCT sig
+                """,
+                sigs=[row["sig"] for row in function_rows],
+            )
+        }
+        new_class_rows = [row for row in class_rows if row["sig"] not in chunked_classes]
+        new_function_rows = [
+            row for row in function_rows if row["sig"] not in chunked_functions
+        ]
+        # One batched embeddings request covers every new chunk in the file
+        embeddings = self.get_embeddings(
+            [row["enriched_text"] for row in new_class_rows + new_function_rows]
+        )
+        class_chunks = [
+            {"sig": row["sig"], "text": row["chunk_text"], "embedding": embedding}
+            for row, embedding in zip(new_class_rows, embeddings)
+        ]
+        function_chunks = [
+            {"sig": row["sig"], "text": row["chunk_text"], "embedding": embedding}
+            for row, embedding in zip(new_function_rows, embeddings[len(new_class_rows):])
+        ]
+
+        def _write(tx: neo4j.ManagedTransaction) -> None:
+            tx.run(
+                """
+                MATCH (f:File {path: $path})
+                UNWIND $rows as row
+                MERGE (c:Class {qualified_name: row.sig})
+                SET c.name = row.name, c.code = row.code, c.docstring = row.docstring
+                MERGE (f)-[:DEFINES]->(c)
+                """,
+                path=rel_path,
+                rows=class_rows,
+            ).consume()
+            tx.run(
+                """
+                MATCH (f:File {path: $path})
+                UNWIND $rows as row
+                MERGE (fn:Function {signature: row.sig})
+                SET fn.name = row.name, fn.code = row.code, fn.docstring = row.docstring
+                MERGE (f)-[:DEFINES]->(fn)
+                """,
+                path=rel_path,
+                rows=function_rows,
+            ).consume()
+            tx.run(
+                """
+                UNWIND $rows as row
+                MATCH (c:Class {qualified_name: row.class_sig})
+                MATCH (fn:Function {signature: row.sig})
+                MERGE (c)-[:HAS_METHOD]->(fn)
+                """,
+                rows=[row for row in function_rows if row["class_sig"]],
+            ).consume()
+            tx.run(
+                """
+                UNWIND $rows as row
+                MATCH (c:Class {qualified_name: row.sig})
+                CREATE (ch:Chunk {id: randomUUID()})
+                SET ch.text = row.text,
+                    ch.embedding = row.embedding,
+                    ch.created_at = datetime()
+                MERGE (ch)-[:DESCRIBES]->(c)
+                """,
+                rows=class_chunks,
+            ).consume()
+            tx.run(
+                """
+                UNWIND $rows as row
+                MATCH (fn:Function {signature: row.sig})
+                CREATE (ch:Chunk {id: randomUUID()})
+                SET ch.text = row.text,
+                    ch.embedding = row.embedding,
+                    ch.created_at = datetime()
+                MERGE (ch)-[:DESCRIBES]->(fn)
+                """,
+                rows=function_chunks,
+            ).consume()
+            # Committed with the entities, so a crash leaves the file dirty.
+            tx.run(_CLEAR_DIRTY_QUERY, path=rel_path).consume()
+
+        session.execute_write(_write)
 
     # =========================================================================
     # PASS 3: IMPORT RESOLUTION
     # =========================================================================
 
-    def _extract_python_import_modules(self, code: str) -> Set[str]:
+    def _extract_python_import_modules(self, code: Union[str, bytes]) -> Set[str]:
         """Extract Python import module names from source text."""
         parser = self.parsers.get(".py")
         if not parser:
             return set()
 
-        query_scm = """
-        (import_statement name: (dotted_name) @module)
-        (import_from_statement module_name: (dotted_name) @module)
-        """
         modules: Set[str] = set()
 
         try:
-            tree = parser.parse(bytes(code, "utf8"))
-            lang = Language(tree_sitter_python.language())
-            query = Query(lang, query_scm)
-            cursor = QueryCursor(query)
+            code_bytes = code.encode("utf8") if isinstance(code, str) else code
+            tree = parser.parse(code_bytes)
+            cursor = QueryCursor(get_query(".py", PY_IMPORT_QUERY))
             captures = cursor.captures(tree.root_node)
 
             for node in captures.get("module", []):
-                module_name = code[node.start_byte:node.end_byte].strip()
+                module_name = _node_text(code_bytes, node).strip()
                 if module_name:
                     modules.add(module_name)
         except (RuntimeError, AttributeError, ValueError) as e:
@@ -775,20 +1119,9 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
 
     def _extract_js_ts_import_modules(self, code: str) -> Set[str]:
         """Extract JS/TS/TSX module specifiers from source text using regex heuristics."""
-        patterns = [
-            # import x from "mod" / import {x} from "mod" / import type {x} from "mod"
-            r'^\s*import\s+(?:type\s+)?(?:[\w*\s{},$]+\s+from\s+)?["\']([^"\']+)["\']',
-            # export {x} from "mod" / export * from "mod"
-            r'^\s*export\s+(?:type\s+)?(?:\*|\{[^}]*\})\s+from\s+["\']([^"\']+)["\']',
-            # const x = require("mod")
-            r'require\(\s*["\']([^"\']+)["\']\s*\)',
-            # import("mod")
-            r'import\(\s*["\']([^"\']+)["\']\s*\)',
-        ]
-
         modules: Set[str] = set()
-        for pattern in patterns:
-            for match in re.finditer(pattern, code, flags=re.MULTILINE):
+        for pattern in _JS_TS_IMPORT_PATTERNS:
+            for match in pattern.finditer(code):
                 module_name = match.group(1).strip()
                 if module_name:
                     modules.add(module_name)
@@ -877,6 +1210,7 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
             raise ValueError("repo_path must be provided either in __init__ or as parameter")
 
         # Pass 3: parse import specifiers per File, rebuild IMPORTS edges (exact + fuzzy fallback).
+        # Both resolve to concrete paths in-process and are written as File.path index seeks.
         logger.info("🕸️ [Pass 3] Linking Files via Imports...")
         supported_exts = {".py", ".js", ".jsx", ".ts", ".tsx"}
 
@@ -885,6 +1219,9 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
             all_paths = [r["path"] for r in result]
             path_set = set(all_paths)
             files = [path for path in all_paths if Path(path).suffix in supported_exts]
+            # Fuzzy fragment -> matching paths. Resolved against the path list
+            # already in memory instead of a CONTAINS scan over every File node.
+            fuzzy_matches: Dict[str, List[str]] = {}
 
             for rel_path in files:
                 full_path = repo_path / rel_path
@@ -894,17 +1231,20 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                     logger.warning(
                         f"⚠️ File found in graph but missing on disk (Stale): {rel_path}. Deleting node."
                     )
-                    session.run("MATCH (f:File {path: $path}) DETACH DELETE f", path=rel_path)
+                    _run_write(session, "MATCH (f:File {path: $path}) DETACH DELETE f", path=rel_path)
                     continue
 
-                code = full_path.read_text(errors="ignore")
+                code = full_path.read_bytes()
                 if source_ext == ".py":
                     modules = self._extract_python_import_modules(code)
                 else:
-                    modules = self._extract_js_ts_import_modules(code)
+                    modules = self._extract_js_ts_import_modules(
+                        code.decode("utf8", errors="ignore")
+                    )
 
                 # Rebuild imports for this source file to avoid stale edges.
-                session.run(
+                _run_write(
+                    session,
                     """
                     MATCH (source:File {path: $src})-[r:IMPORTS]->()
                     DELETE r
@@ -912,21 +1252,26 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                     src=rel_path,
                 )
 
-                exact_targets: Set[str] = set()
-                fuzzy_parts: Set[str] = set()
+                targets: Set[str] = set()
                 for module_name in modules:
                     candidates = self._resolve_import_candidates(rel_path, module_name, source_ext)
                     matched = {candidate for candidate in candidates if candidate in path_set}
                     if matched:
-                        exact_targets.update(matched)
+                        targets.update(matched)
                         continue
 
                     fuzzy_part = self._module_to_fuzzy_part(module_name, source_ext)
-                    if fuzzy_part:
-                        fuzzy_parts.add(fuzzy_part)
-
-                if exact_targets:
-                    session.run(
+                    if not fuzzy_part:
+                        continue
+                    if fuzzy_part not in fuzzy_matches:
+                        fuzzy_matches[fuzzy_part] = [
+                            path for path in all_paths if fuzzy_part in path
+                        ]
+                    targets.update(fuzzy_matches[fuzzy_part])
+
+                if targets:
+                    _run_write(
+                        session,
                         """
                         MATCH (source:File {path: $src})
                         UNWIND $targets as target_path
@@ -934,19 +1279,7 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                         MERGE (source)-[:IMPORTS]->(target)
                         """,
                         src=rel_path,
-                        targets=sorted(exact_targets),
-                    )
-
-                for mod_part in sorted(fuzzy_parts):
-                    session.run(
-                        """
-                        MATCH (source:File {path: $src})
-                        MATCH (target:File)
-                        WHERE target.path CONTAINS $mod_part
-                        MERGE (source)-[:IMPORTS]->(target)
-                        """,
-                        src=rel_path,
-                        mod_part=mod_part,
+                        targets=sorted(targets),
                     )
 
             logger.info("✅ [Pass 3] Import graph built.")
@@ -958,7 +1291,9 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
     def pass_4_call_graph(self, repo_path: Optional[Path] = None):
         """
         Links functions based on calls.
-        Optimized to parse each file once, then process all functions within it.
+        Parses each file once, attributes every call to the innermost function
+        containing it, stages those names on the Function nodes, then resolves
+        every CALLS edge in one set-based join.
 
         Args:
             repo_path: Path to repository root (defaults to self.repo_root)
@@ -970,71 +1305,79 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
         # Pass 4: per-file call sites (Python identifier calls) → CALLS edges between Function nodes.
         logger.info("📞 [Pass 4] Constructing Call Graph...")
 
-        query_scm = """(call function: (identifier) @name)"""
-
         with self.driver.session() as session:
-            # Get all function definitions ordered by file
+            # Files that define at least one function can originate calls
             result = session.run(
                 """
-                MATCH (f:File)-[:DEFINES]->(fn:Function)
-                RETURN f.path as path, collect({name: fn.name, sig: fn.signature}) as funcs
+                MATCH (f:File)-[:DEFINES]->(:Function)
+                RETURN DISTINCT f.path as path
             """
             )
-            file_records = list(result)
-            total_files = len(file_records)
-
-            for i, record in enumerate(file_records):
-                rel_path = record["path"]
-                funcs_in_file = record["funcs"]
+            file_paths = [record["path"] for record in result]
+            total_files = len(file_paths)
+
+            # Stage each function's called names on its Function node; the
+            # edges are then resolved in one set-based join below.
+            staged: List[Dict[str, Any]] = []
+            progress = ProgressThrottle()
+            for i, rel_path in enumerate(file_paths):
                 full_path = repo_path / rel_path
 
                 # Progress logging
-                print(f"[{i+1}/{total_files}] 📞 Processing calls in: {rel_path}...", end="\r")
+                if progress.ready(final=i + 1 == total_files):
+                    print(f"[{i+1}/{total_files}] 📞 Processing calls in: {rel_path}...", end="\r")
 
-                if not full_path.exists():
+                try:
+                    code = full_path.read_bytes()
+                except OSError:
                     continue
+                tree = self.parsers[".py"].parse(code)
 
-                try:
-                    code = full_path.read_text(errors="ignore")
-                    tree = self.parsers[".py"].parse(bytes(code, "utf8"))
-
-                    lang = Language(tree_sitter_python.language())
-                    query = Query(lang, query_scm)
-                    cursor = QueryCursor(query)
-                    captures = cursor.captures(tree.root_node)
-
-                    # Extract all calls in the file once
-                    calls_in_file = []
-                    for tag, nodes in captures.items():
-                        for node in nodes:
-                            called_name = code[node.start_byte:node.end_byte]
-                            calls_in_file.append(called_name)
-
-                    if not calls_in_file:
-                        continue
+                staged.extend(
+                    {"sig": sig, "callees": callees}
+                    for sig, callees in _calls_by_function(code, tree, rel_path).items()
+                )
+                if len(staged) >= self.CALLEE_STAGE_BATCH_SIZE:
+                    self._stage_callees(session, staged)
+                    staged = []
 
-                    # Batch the creation of relationships for performance
-                    for func in funcs_in_file:
-                        caller_sig = func["sig"]
-
-                        # Create relationships for found calls
-                        session.run(
-                            """
-                            UNWIND $calls as called_name
-                            MATCH (caller:Function {signature: $caller_sig})
-                            MATCH (callee:Function {name: called_name})
-                            WHERE caller <> callee
-                            MERGE (caller)-[:CALLS]->(callee)
-                        """,
-                            caller_sig=caller_sig,
-                            calls=calls_in_file,
-                        )
+            if staged:
+                self._stage_callees(session, staged)
 
-                except (neo4j.exceptions.DatabaseError, neo4j.exceptions.ClientError) as e:
-                    logger.warning(f"⚠️ Failed to process calls in {rel_path}: {e}")
+            # One join over every staged Function; the planner seeks callees on
+            # the Function.name index. Runs in auto-commit batches, so it
+            # cannot go through a managed transaction.
+            session.run(
+                """
+                MATCH (caller:Function)
+                WHERE caller.callees IS NOT NULL
+                CALL {
+                    WITH caller
+                    WITH caller, caller.callees as callees
+                    REMOVE caller.callees
+                    WITH caller, callees
+                    UNWIND callees as called_name
+                    MATCH (callee:Function {name: called_name})
+                    WHERE caller <> callee
+                    MERGE (caller)-[:CALLS]->(callee)
+                } IN TRANSACTIONS OF 100 ROWS
+                """
+            ).consume()
 
             print(f"\n✅ [Pass 4] Call Graph approximation complete. Processed {total_files} files.")
 
+    def _stage_callees(self, session: neo4j.Session, rows: List[Dict[str, Any]]) -> None:
+        """Store each function's called names as ``Function.callees`` for the Pass 4 join."""
+        _run_write(
+            session,
+            """
+            UNWIND $rows as row
+            MATCH (fn:Function {signature: row.sig})
+            SET fn.callees = row.callees
+            """,
+            rows=rows,
+        )
+
     # =========================================================================
     # FULL PIPELINE
     # =========================================================================
@@ -1353,9 +1696,13 @@ class KnowledgeGraphBuilder(BaseIngestionPipeline):
                 ORDER BY fv.path
                 """
                 files_result = session.run(files_cypher, sha=sha)
-                files = [dict(record) for record in files_result]
-                additions = sum(int(file_info.get("additions", 0) or 0) for file_info in files)
-                deletions = sum(int(file_info.get("deletions", 0) or 0) for file_info in files)
+                files = []
+                additions = deletions = 0
+                for record in files_result:
+                    file_info = dict(record)
+                    files.append(file_info)
+                    additions += int(file_info.get("additions", 0) or 0)
+                    deletions += int(file_info.get("deletions", 0) or 0)
 
                 context["files"] = files
                 context["stats"] = {
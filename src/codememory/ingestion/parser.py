@@ -19,19 +19,145 @@ Dependencies:
     ``tree-sitter``, ``tree-sitter-python``, ``tree-sitter-javascript``.
 """
 
+import functools
 import logging
-from typing import Dict, List, Any
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 from tree_sitter import Language, Parser, Query, QueryCursor, Node, Tree
 import tree_sitter_python
 import tree_sitter_javascript
 
 logger = logging.getLogger(__name__)
 
+_PARSER_STATE = threading.local()
+
+
+@functools.lru_cache(maxsize=None)
+def get_language(extension: str) -> Language:
+    """Return the process-wide grammar for ``extension`` (Python or JS family)."""
+    if extension == ".py":
+        return Language(tree_sitter_python.language())
+    return Language(tree_sitter_javascript.language())
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_query(lang: Language, query_scm: str) -> Query:
+    """Compile ``query_scm`` for ``lang`` once per process."""
+    query: Query = Query(lang, query_scm)
+    return query
+
+
+def get_query(extension: str, query_scm: str) -> Query:
+    """Return ``query_scm`` compiled once per process for ``extension``'s grammar.
+
+    Compiled queries are immutable, so callers only create a fresh
+    ``QueryCursor`` per tree instead of recompiling per file or definition.
+    """
+    key = ".py" if extension == ".py" else ".js"
+    return _compile_query(get_language(key), query_scm)
+
+
+def get_parser(extension: str) -> Parser:
+    """Return this thread's ``Parser`` for ``extension`` (parsers are not thread-safe)."""
+    parsers = getattr(_PARSER_STATE, "parsers", None)
+    if parsers is None:
+        parsers = _PARSER_STATE.parsers = {}
+    key = ".py" if extension == ".py" else ".js"
+    parser = parsers.get(key)
+    if parser is None:
+        parser = parsers[key] = Parser(get_language(key))
+    return parser
+
+
+def _point_at(code: bytes, offset: int) -> Tuple[int, int]:
+    """Return the tree-sitter ``(row, column)`` point for byte ``offset`` in ``code``."""
+    row = code.count(b"\n", 0, offset)
+    return row, offset - (code.rfind(b"\n", 0, offset) + 1)
+
+
+class IncrementalParseCache:
+    """Bounded LRU of ``path -> (Tree, bytes)`` for re-parsing edited files.
+
+    Watcher events usually touch a few lines of a file that was parsed moments
+    before. Feeding the previous tree (after ``Tree.edit`` describes the changed
+    byte span) back into ``Parser.parse`` lets tree-sitter reuse every subtree
+    outside that span instead of re-parsing the whole file.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, Tree, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse(self, key: str, extension: str, code: bytes) -> Tree:
+        """Parse ``code`` for ``key``, reusing the cached tree when one exists."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+
+        old_tree: Optional[Tree] = None
+        if entry is not None and entry[0] == extension:
+            _, old_tree, old_code = entry
+            if old_code == code:
+                tree = old_tree
+            else:
+                self._apply_edit(old_tree, old_code, code)
+                tree = get_parser(extension).parse(code, old_tree)
+        else:
+            tree = get_parser(extension).parse(code)
+
+        with self._lock:
+            self._entries[key] = (extension, tree, code)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return tree
+
+    def discard(self, key: str) -> None:
+        """Forget the cached tree for ``key`` (e.g. after the file is deleted)."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    @staticmethod
+    def _apply_edit(tree: Tree, old: bytes, new: bytes) -> None:
+        """Describe the single changed span between ``old`` and ``new`` on ``tree``."""
+        limit = min(len(old), len(new))
+        start = 0
+        while start < limit and old[start] == new[start]:
+            start += 1
+        suffix = 0
+        while (
+            suffix < limit - start
+            and old[len(old) - 1 - suffix] == new[len(new) - 1 - suffix]
+        ):
+            suffix += 1
+        old_end = len(old) - suffix
+        new_end = len(new) - suffix
+        tree.edit(
+            start_byte=start,
+            old_end_byte=old_end,
+            new_end_byte=new_end,
+            start_point=_point_at(old, start),
+            old_end_point=_point_at(old, old_end),
+            new_end_point=_point_at(new, new_end),
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def get_code_parser() -> "CodeParser":
+    """Return the process-wide :class:`CodeParser`.
+
+    Grammars, compiled queries and (per-thread) parsers are all shared, so one
+    instance serves every caller, including watcher event threads.
+    """
+    return CodeParser()
+
+
 class CodeParser:
     """tree-sitter-based parser that extracts structured metadata from source files.
 
-    Instantiate once per process (parsers are stateless after initialisation)
-    and call ``parse_file`` for each source file during ingestion. The returned
+    Use :func:`get_code_parser` for the shared per-process instance (grammars
+    and compiled queries are process-wide, parsers per thread) and call
+    ``parse_file`` for each source file during ingestion. The returned
     dict is consumed by ``KnowledgeGraphBuilder`` to create Neo4j nodes and
     relationships for the code knowledge graph.
 
@@ -39,36 +165,12 @@ class CodeParser:
     Files with unsupported extensions return the default empty-result dict so
     that callers never need to branch on parser availability.
 
-    Attributes:
-        parsers: Dict mapping file extension -> tree-sitter ``Parser`` instance.
-        languages: Dict mapping file extension -> tree-sitter ``Language``
-            grammar object (used to compile S-expression queries).
+    Grammars, compiled queries and thread-local parsers come from the
+    module-level :func:`get_language`, :func:`get_query` and :func:`get_parser`
+    caches, so the instance itself holds no parsing state.
     """
 
-    def __init__(self):
-        self.parsers = {}
-        self.languages = {}
-        self._init_parsers()
-
-    def _init_parsers(self):
-        """Load Python and JavaScript grammars and populate ``parsers`` / ``languages``.
-
-        Logs and swallows initialization errors so ``parse_file`` can still
-        return empty structures when grammars fail to load.
-        """
-        try:
-            # Python
-            py_lang = Language(tree_sitter_python.language())
-            self.languages['.py'] = py_lang
-            self.parsers['.py'] = Parser(py_lang)
-
-            # JS/TS
-            js_lang = Language(tree_sitter_javascript.language())
-            for ext in ['.js', '.jsx', '.ts', '.tsx']:
-                self.languages[ext] = js_lang
-                self.parsers[ext] = Parser(js_lang)
-        except (ImportError, RuntimeError) as e:
-            logger.error(f"Failed to initialize parsers: {e}")
+    SUPPORTED_EXTENSIONS = frozenset({".py", ".js", ".jsx", ".ts", ".tsx"})
 
     def parse_file(self, code: str, extension: str) -> Dict[str, Any]:
         """Parse source code and return structured metadata for graph ingestion.
@@ -108,27 +210,28 @@ class CodeParser:
             "calls": [],
             "env_vars": [],
         }
-        parser = self.parsers.get(extension)
-        if not parser:
+        if extension not in self.SUPPORTED_EXTENSIONS:
             logger.warning(f"No parser found for extension {extension}")
             return default_result
 
         try:
-            tree = parser.parse(bytes(code, "utf8"))
-            lang = self.languages[extension]
+            # Work on the encoded source: node offsets are byte offsets.
+            code_bytes = code.encode("utf8")
+            # Thread-local parser, so one CodeParser can serve many threads
+            tree = get_parser(extension).parse(code_bytes)
 
             return {
-                "classes": self._extract_classes(tree, code, lang, extension),
-                "functions": self._extract_functions(tree, code, lang, extension),
-                "imports": self._extract_imports(tree, code, lang, extension),
-                "calls": self._extract_calls(tree, code, lang, extension),
-                "env_vars": self._extract_env_vars(tree, code, lang, extension)
+                "classes": self._extract_classes(tree, code_bytes, extension),
+                "functions": self._extract_functions(tree, code_bytes, extension),
+                "imports": self._extract_imports(tree, code_bytes, extension),
+                "calls": self._extract_calls(tree, code_bytes, extension),
+                "env_vars": self._extract_env_vars(tree, code_bytes, extension)
             }
         except (ValueError, RuntimeError, AttributeError, TypeError) as e:
             logger.error(f"Error parsing file with extension {extension}: {e}")
             return default_result
 
-    def _extract_classes(self, tree: Tree, code: str, lang: Language, extension: str) -> List[Dict[str, Any]]:
+    def _extract_classes(self, tree: Tree, code: bytes, extension: str) -> List[Dict[str, Any]]:
         """Run class-definition queries and return name, span text, and start line."""
         classes = []
         if extension == '.py':
@@ -143,7 +246,7 @@ class CodeParser:
             """
 
         try:
-            query = Query(lang, query_scm)
+            query = get_query(extension, query_scm)
             cursor = QueryCursor(query)
             matches = cursor.matches(tree.root_node)
 
@@ -151,13 +254,13 @@ class CodeParser:
                 if 'name' not in match_map: continue
 
                 name_node = match_map['name'][0]
-                name = code[name_node.start_byte:name_node.end_byte]
+                name = self._text(code, name_node)
 
                 def_node = match_map['class_def'][0]
 
                 classes.append({
                     "name": name,
-                    "code": code[def_node.start_byte:def_node.end_byte],
+                    "code": self._text(code, def_node),
                     "start_line": def_node.start_point[0] + 1
                 })
 
@@ -166,7 +269,7 @@ class CodeParser:
 
         return classes
 
-    def _extract_functions(self, tree: Tree, code: str, lang: Language, extension: str) -> List[Dict[str, Any]]:
+    def _extract_functions(self, tree: Tree, code: bytes, extension: str) -> List[Dict[str, Any]]:
         """Run function-declaration queries; attach optional parent class name for methods."""
         functions = []
         if extension == '.py':
@@ -181,7 +284,7 @@ class CodeParser:
             """
 
         try:
-            query = Query(lang, query_scm)
+            query = get_query(extension, query_scm)
             cursor = QueryCursor(query)
             matches = cursor.matches(tree.root_node)
 
@@ -189,7 +292,7 @@ class CodeParser:
                 if 'name' not in match_map: continue
 
                 name_node = match_map['name'][0]
-                name = code[name_node.start_byte:name_node.end_byte]
+                name = self._text(code, name_node)
 
                 def_node = match_map['function_def'][0]
 
@@ -198,7 +301,7 @@ class CodeParser:
 
                 functions.append({
                     "name": name,
-                    "code": code[def_node.start_byte:def_node.end_byte],
+                    "code": self._text(code, def_node),
                     "parent_class": parent_class,
                     "start_line": def_node.start_point[0] + 1
                 })
@@ -207,7 +310,7 @@ class CodeParser:
 
         return functions
 
-    def _extract_imports(self, tree: Tree, code: str, lang: Language, extension: str) -> List[str]:
+    def _extract_imports(self, tree: Tree, code: bytes, extension: str) -> List[str]:
         """Return dotted module names from Python import/from-import statements only."""
         imports = []
         if extension != '.py': return imports # Only Python supported for now
@@ -218,18 +321,18 @@ class CodeParser:
         """
 
         try:
-            query = Query(lang, query_scm)
+            query = get_query(extension, query_scm)
             cursor = QueryCursor(query)
             captures = cursor.captures(tree.root_node)
             for node in captures.get("module", []):
-                module_name = code[node.start_byte:node.end_byte]
+                module_name = self._text(code, node)
                 imports.append(module_name)
         except (RuntimeError, AttributeError, IndexError) as e:
             logger.error(f"Error extracting imports: {e}")
 
         return imports
 
-    def _extract_calls(self, tree: Tree, code: str, lang: Language, extension: str) -> List[str]:
+    def _extract_calls(self, tree: Tree, code: bytes, extension: str) -> List[str]:
         """Collect callee identifiers from simple call nodes (no dotted methods)."""
         calls = []
         if extension == ".py":
@@ -238,19 +341,19 @@ class CodeParser:
             query_scm = """(call_expression function: (identifier) @name)"""
 
         try:
-            query = Query(lang, query_scm)
+            query = get_query(extension, query_scm)
             cursor = QueryCursor(query)
             captures = cursor.captures(tree.root_node)
 
             for node in captures.get("name", []):
-                call_name = code[node.start_byte:node.end_byte]
+                call_name = self._text(code, node)
                 calls.append(call_name)
         except (RuntimeError, AttributeError) as e:
             logger.error(f"Error extracting calls: {e}")
 
         return calls
 
-    def _extract_env_vars(self, tree: Tree, code: str, lang: Language, extension: str) -> List[Dict[str, Any]]:
+    def _extract_env_vars(self, tree: Tree, code: bytes, extension: str) -> List[Dict[str, Any]]:
         """Detect Python env reads (getenv/get) and ``load_dotenv`` calls for graph hints."""
         env_vars = []
         if extension != '.py': return env_vars
@@ -265,7 +368,7 @@ class CodeParser:
         """
 
         try:
-            query = Query(lang, query_scm_1)
+            query = get_query(extension, query_scm_1)
             cursor = QueryCursor(query)
             matches = cursor.matches(tree.root_node)
 
@@ -273,11 +376,11 @@ class CodeParser:
                 if 'method' not in match_map or 'var_name' not in match_map: continue
 
                 method_node = match_map['method'][0]
-                method_name = code[method_node.start_byte:method_node.end_byte]
+                method_name = self._text(code, method_node)
 
                 if method_name in ["getenv", "get"]:
                     var_node = match_map['var_name'][0]
-                    var_name = code[var_node.start_byte:var_node.end_byte].strip("'\"")
+                    var_name = self._text(code, var_node).strip("'\"")
 
                     env_vars.append({
                         "type": "read",
@@ -295,7 +398,7 @@ class CodeParser:
         """
 
         try:
-            query = Query(lang, query_scm_2)
+            query = get_query(extension, query_scm_2)
             cursor = QueryCursor(query)
             matches = cursor.matches(tree.root_node)
 
@@ -303,7 +406,7 @@ class CodeParser:
                 if 'func' not in match_map: continue
 
                 func_node = match_map['func'][0]
-                func_name = code[func_node.start_byte:func_node.end_byte]
+                func_name = self._text(code, func_node)
 
                 if func_name == "load_dotenv":
                      env_vars.append({
@@ -315,15 +418,20 @@ class CodeParser:
 
         return env_vars
 
-    def _get_name_from_node(self, node: Node, code: str) -> str:
+    @staticmethod
+    def _text(code: bytes, node: Node) -> str:
+        """Decode the source bytes spanned by ``node``."""
+        return code[node.start_byte:node.end_byte].decode("utf8", errors="ignore")
+
+    def _get_name_from_node(self, node: Node, code: bytes) -> str:
         """Return the first child ``identifier`` text slice, or empty string."""
         # Try to find 'identifier' child
         for child in node.children:
             if child.type == 'identifier':
-                return code[child.start_byte:child.end_byte]
+                return self._text(code, child)
         return ""
 
-    def _get_parent_class(self, node: Node, code: str) -> str:
+    def _get_parent_class(self, node: Node, code: bytes) -> str:
         """Walk ancestors for a class_definition/class_declaration and read its name."""
         current = node.parent
         while current:
@@ -18,10 +18,20 @@ from pathlib import Path
 from typing import Optional, Set
 
 import neo4j
+from tree_sitter import QueryCursor
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
-from codememory.ingestion.graph import KnowledgeGraphBuilder
+from codememory.ingestion.graph import (
+    JS_DEFINITION_QUERY,
+    PY_DEFINITION_QUERY,
+    KnowledgeGraphBuilder,
+    _node_text,
+    _parent_class_name,
+    _run_write,
+    get_query,
+)
+from codememory.ingestion.parser import IncrementalParseCache
 
 logging.basicConfig(level=logging.INFO)
 logging.getLogger("neo4j.notifications").setLevel(logging.WARNING)
@@ -48,6 +58,7 @@ class CodeChangeHandler(FileSystemEventHandler):
         self.builder = builder
         self.repo_root = repo_root
         self._debounce_cache: dict[str, float] = {}
+        self._tree_cache = IncrementalParseCache()
         self.supported_extensions = supported_extensions or {".py", ".js", ".ts", ".tsx", ".jsx"}
 
     def _is_ignored_path(self, path: Path) -> bool:
@@ -134,12 +145,13 @@ class CodeChangeHandler(FileSystemEventHandler):
         try:
             rel_path = str(path.relative_to(self.repo_root))
             logger.info(f"🗑️  File deleted: {rel_path}")
+            self._tree_cache.discard(rel_path)
 
             self._delete_file_entities(rel_path)
 
             # Also delete the file node
             with self.builder.driver.session() as session:
-                session.run("MATCH (f:File {path: $path}) DETACH DELETE f", path=rel_path)
+                _run_write(session, "MATCH (f:File {path: $path}) DETACH DELETE f", path=rel_path)
 
             logger.info(f"✅ Removed from graph: {rel_path}")
 
@@ -160,20 +172,20 @@ class CodeChangeHandler(FileSystemEventHandler):
         """
         with self.builder.driver.session() as session:
             # Delete chunks (they have DESCRIBES relationships)
-            session.run("""
+            _run_write(session, """
                 MATCH (f:File {path: $path})-[:DEFINES]->(entity)
                 OPTIONAL MATCH (chunk)-[:DESCRIBES]->(entity)
                 DETACH DELETE chunk
             """, path=rel_path)
 
             # Delete functions and classes defined in this file
-            session.run("""
+            _run_write(session, """
                 MATCH (f:File {path: $path})-[:DEFINES]->(entity)
                 DETACH DELETE entity
             """, path=rel_path)
 
             # Remove import relationships from this file
-            session.run("""
+            _run_write(session, """
                 MATCH (f:File {path: $path})-[r:IMPORTS]->()
                 DELETE r
             """, path=rel_path)
@@ -185,7 +197,7 @@ class CodeChangeHandler(FileSystemEventHandler):
         This is a simplified version of Pass 2 for single files.
         It does NOT update the call graph (requires full repo scan).
         """
-        code_content = full_path.read_text(errors="ignore")
+        code_bytes = full_path.read_bytes()
         extension = full_path.suffix
         parser = self.builder.parsers.get(extension)
 
@@ -197,7 +209,7 @@ class CodeChangeHandler(FileSystemEventHandler):
 
         with self.builder.driver.session() as session:
             # Update File node
-            session.run("""
+            _run_write(session, """
                 MERGE (f:File {path: $path})
                 SET f.name = $name,
                     f.ohash = $ohash,
@@ -205,57 +217,30 @@ class CodeChangeHandler(FileSystemEventHandler):
             """, path=rel_path, name=full_path.name, ohash=new_ohash)
 
             # Parse entities
-            tree = parser.parse(bytes(code_content, "utf8"))
+            tree = self._tree_cache.parse(rel_path, extension, code_bytes)
 
-            # Language-specific query
+            # Language-specific query, compiled once per process
             if extension == ".py":
-                query_scm = """
-                (class_definition
-                    name: (identifier) @name
-                    body: (block) @body) @class
-                (function_definition
-                    name: (identifier) @name
-                    body: (block) @body) @function
-                """
+                query = get_query(".py", PY_DEFINITION_QUERY)
             else:
-                query_scm = """
-                (class_declaration name: (identifier) @name) @class
-                (function_declaration name: (identifier) @name) @function
-                """
-
-            from tree_sitter import Language, Query, QueryCursor
-            import tree_sitter_python
-            import tree_sitter_javascript
-
-            lang = (
-                Language(tree_sitter_python.language())
-                if extension == ".py"
-                else Language(tree_sitter_javascript.language())
-            )
-
-            query = Query(lang, query_scm)
+                query = get_query(".js", JS_DEFINITION_QUERY)
             cursor = QueryCursor(query)
-            captures = cursor.captures(tree.root_node)
 
-            # Process captures
-            for tag, nodes in captures.items():
-                for node in nodes:
-                    node_text = code_content[node.start_byte:node.end_byte]
-                    name = ""
-
-                    for child in node.children:
-                        if child.type == "identifier":
-                            name = code_content[child.start_byte:child.end_byte]
-                            break
-
-                    if not name:
-                        continue
+            # Process matches; each carries its definition's ``@name`` capture
+            for _, match in cursor.matches(tree.root_node):
+                tag = "class" if "class" in match else "function"
+                name_nodes = match.get("name")
+                if not name_nodes:
+                    continue
+                name = _node_text(code_bytes, name_nodes[0])
+                for node in match[tag]:
+                    node_text = _node_text(code_bytes, node)
 
                     signature = f"{rel_path}:{name}"
 
                     if tag == "class":
                         # Create Class Node
-                        session.run("""
+                        _run_write(session, """
                             MATCH (f:File {path: $path})
                             MERGE (c:Class {qualified_name: $sig})
                             SET c.name = $name, c.code = $code
@@ -266,7 +251,7 @@ class CodeChangeHandler(FileSystemEventHandler):
                         enriched_text = f"Context: File {rel_path} > Class {name}\n\n{node_text}"
                         embedding = self.builder.get_embedding(enriched_text)
 
-                        session.run("""
+                        _run_write(session, """
                             MATCH (c:Class {qualified_name: $sig})
                             CREATE (ch:Chunk {id: randomUUID()})
                             SET ch.text = $text,
@@ -277,23 +262,13 @@ class CodeChangeHandler(FileSystemEventHandler):
 
                     elif tag == "function":
                         # Check for parent class
-                        parent_class = ""
-                        current = node.parent
-                        while current:
-                            if current.type == "class_definition":
-                                for child in current.children:
-                                    if child.type == "identifier":
-                                        parent_class = code_content[
-                                            child.start_byte:child.end_byte
-                                        ]
-                                        break
-                            current = current.parent
+                        parent_class = _parent_class_name(code_bytes, node)
 
                         qual_name = f"{parent_class}.{name}" if parent_class else name
                         full_sig = f"{rel_path}:{qual_name}"
 
                         # Create Function Node
-                        session.run("""
+                        _run_write(session, """
                             MATCH (f:File {path: $path})
                             MERGE (fn:Function {signature: $sig})
                             SET fn.name = $name, fn.code = $code
@@ -303,7 +278,7 @@ class CodeChangeHandler(FileSystemEventHandler):
                         # Link to parent class
                         if parent_class:
                             class_sig = f"{rel_path}:{parent_class}"
-                            session.run("""
+                            _run_write(session, """
                                 MATCH (c:Class {qualified_name: $csig})
                                 MATCH (fn:Function {signature: $fsig})
                                 MERGE (c)-[:HAS_METHOD]->(fn)
@@ -319,7 +294,7 @@ class CodeChangeHandler(FileSystemEventHandler):
                         )
                         embedding = self.builder.get_embedding(enriched_text)
 
-                        session.run("""
+                        _run_write(session, """
                             MATCH (fn:Function {signature: $sig})
                             CREATE (ch:Chunk {id: randomUUID()})
                             SET ch.text = $text,
@@ -131,18 +131,13 @@ def test_status_json_success_envelope(monkeypatch, capsys, tmp_path):
 
     mock_cfg = _mock_config(exists=True)
     mock_builder = Mock()
-    session = Mock()
-    session_context = Mock()
-    session_context.__enter__ = Mock(return_value=session)
-    session_context.__exit__ = Mock(return_value=None)
-    mock_builder.driver.session.return_value = session_context
-    session.run.side_effect = [
-        _result({"count": 3}),
-        _result({"count": 7}),
-        _result({"count": 2}),
-        _result({"count": 11}),
-        _result({"last_updated": "2026-02-01T00:00:00Z"}),
-    ]
+    mock_builder.get_index_stats.return_value = {
+        "files": 3,
+        "functions": 7,
+        "classes": 2,
+        "chunks": 11,
+        "last_sync": "2026-02-01T00:00:00Z",
+    }
 
     monkeypatch.setattr(cli, "find_repo_root", Mock(return_value=repo_root))
     monkeypatch.setattr(cli, "Config", Mock(return_value=mock_cfg))
@@ -163,23 +158,7 @@ def test_status_json_success_envelope(monkeypatch, capsys, tmp_path):
         "chunks": 11,
         "last_sync": "2026-02-01T00:00:00Z",
     }
-    expected_repo_id = str(repo_root)
-    session.run.assert_any_call(
-        "MATCH (f:File {repo_id: $repo_id}) RETURN count(f) as count",
-        repo_id=expected_repo_id,
-    )
-    session.run.assert_any_call(
-        "MATCH (fn:Function {repo_id: $repo_id}) RETURN count(fn) as count",
-        repo_id=expected_repo_id,
-    )
-    session.run.assert_any_call(
-        "MATCH (c:Class {repo_id: $repo_id}) RETURN count(c) as count",
-        repo_id=expected_repo_id,
-    )
-    session.run.assert_any_call(
-        "MATCH (ch:Chunk {repo_id: $repo_id}) RETURN count(ch) as count",
-        repo_id=expected_repo_id,
-    )
+    mock_builder.get_index_stats.assert_called_once_with(repo_id=str(repo_root))
 
 
 def test_status_json_missing_config_exits_nonzero(monkeypatch, capsys, tmp_path):
@@ -210,18 +189,13 @@ def test_status_json_global_success_envelope(monkeypatch, capsys, tmp_path):
 
     mock_cfg = _mock_config(exists=True)
     mock_builder = Mock()
-    session = Mock()
-    session_context = Mock()
-    session_context.__enter__ = Mock(return_value=session)
-    session_context.__exit__ = Mock(return_value=None)
-    mock_builder.driver.session.return_value = session_context
-    session.run.side_effect = [
-        _result({"count": 1387}),
-        _result({"count": 6038}),
-        _result({"count": 229}),
-        _result({"count": 7732}),
-        _result({"last_updated": "2026-04-15T01:00:00Z"}),
-    ]
+    mock_builder.get_index_stats.return_value = {
+        "files": 1387,
+        "functions": 6038,
+        "classes": 229,
+        "chunks": 7732,
+        "last_sync": "2026-04-15T01:00:00Z",
+    }
 
     monkeypatch.setattr(cli, "find_repo_root", Mock(return_value=repo_root))
     monkeypatch.setattr(cli, "Config", Mock(return_value=mock_cfg))
@@ -241,10 +215,7 @@ def test_status_json_global_success_envelope(monkeypatch, capsys, tmp_path):
         "chunks": 7732,
         "last_sync": "2026-04-15T01:00:00Z",
     }
-    session.run.assert_any_call("MATCH (f:File) RETURN count(f) as count")
-    session.run.assert_any_call("MATCH (fn:Function) RETURN count(fn) as count")
-    session.run.assert_any_call("MATCH (c:Class) RETURN count(c) as count")
-    session.run.assert_any_call("MATCH (ch:Chunk) RETURN count(ch) as count")
+    mock_builder.get_index_stats.assert_called_once_with(global_scope=True)
 
 
 def test_index_json_success_envelope(monkeypatch, capsys, tmp_path):
@@ -315,6 +286,30 @@ def test_index_full_passes_repo_rebuild_flag(monkeypatch, capsys, tmp_path):
     )
 
 
+def test_index_bulk_requests_deferred_vector_index_build(monkeypatch, capsys, tmp_path):
+    """`index --bulk` should ask the pipeline to rebuild the vector index once."""
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+
+    mock_cfg = _mock_config(exists=True)
+    mock_builder = Mock()
+    mock_builder.run_pipeline.return_value = {"embedding_calls": 0, "cost_usd": 0.0}
+
+    monkeypatch.setattr(cli, "find_repo_root", Mock(return_value=repo_root))
+    monkeypatch.setattr(cli, "Config", Mock(return_value=mock_cfg))
+    monkeypatch.setattr(cli, "KnowledgeGraphBuilder", Mock(return_value=mock_builder))
+
+    cli.cmd_index(argparse.Namespace(json=True, quiet=False, full=False, bulk=True))
+
+    assert _parse_json_stdout(capsys)["ok"] is True
+    mock_builder.run_pipeline.assert_called_once_with(
+        repo_root,
+        supported_extensions={".py"},
+        full_reindex=False,
+        bulk_load=True,
+    )
+
+
 def test_build_calls_json_success(monkeypatch, capsys, tmp_path):
     """build-calls invokes the explicit experimental CALLS path."""
     repo_root = tmp_path / "repo"
@@ -397,6 +392,7 @@ def test_index_loads_gemini_key_from_agentic_memory_dotenv(monkeypatch, tmp_path
         ignore_dirs=set(),
         ignore_files=set(),
         ignore_patterns=set(),
+        query_only=False,
     )
 
 
@@ -480,6 +476,7 @@ def test_search_loads_gemini_key_from_agentic_memory_dotenv(monkeypatch, tmp_pat
         ignore_dirs=None,
         ignore_files=None,
         ignore_patterns=None,
+        query_only=True,
     )
     mock_builder.semantic_search.assert_called_once_with("auth", limit=5)
 
@@ -845,6 +842,52 @@ def test_init_returns_immediately_for_primary_config(monkeypatch, capsys, tmp_pa
     mock_cfg.save.assert_not_called()
 
 
+def test_init_from_json_saves_config_without_prompting(monkeypatch, capsys, tmp_path):
+    """Init --from-json should save the supplied config and skip every prompt."""
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    config_path = tmp_path / "init.json"
+    config_path.write_text(
+        json.dumps({"neo4j": {"uri": "bolt://ci:7687"}, "indexing": {"ignore_dirs": ["dist"]}}),
+        encoding="utf-8",
+    )
+
+    mock_cfg = _mock_config(exists=False, has_primary_config=False, has_legacy_config=True)
+
+    monkeypatch.setattr(cli, "Config", Mock(return_value=mock_cfg))
+    monkeypatch.setattr(cli.Path, "cwd", Mock(return_value=repo_root))
+    monkeypatch.setattr("builtins.input", Mock(side_effect=AssertionError("input not expected")))
+
+    cli.cmd_init(argparse.Namespace(from_json=str(config_path)))
+
+    stdout = capsys.readouterr().out
+    assert "configuration saved" in stdout.lower()
+    mock_cfg.save.assert_called_once_with(
+        {"neo4j": {"uri": "bolt://ci:7687"}, "indexing": {"ignore_dirs": ["dist"]}}
+    )
+    mock_cfg.ensure_graphignore.assert_called_once_with(["dist"])
+
+
+def test_init_from_json_rejects_non_object_sections(monkeypatch, capsys, tmp_path):
+    """Init --from-json should exit cleanly when a config section is not an object."""
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    config_path = tmp_path / "init.json"
+    config_path.write_text(json.dumps({"indexing": ["dist"], "nemotron": None}), encoding="utf-8")
+
+    mock_cfg = _mock_config(exists=False, has_primary_config=False, has_legacy_config=False)
+
+    monkeypatch.setattr(cli, "Config", Mock(return_value=mock_cfg))
+    monkeypatch.setattr(cli.Path, "cwd", Mock(return_value=repo_root))
+
+    with pytest.raises(SystemExit) as exc:
+        cli.cmd_init(argparse.Namespace(from_json=str(config_path)))
+
+    assert exc.value.code == 1
+    assert "'indexing' must be an object" in capsys.readouterr().err
+    mock_cfg.save.assert_not_called()
+
+
 def test_init_uses_legacy_config_when_user_accepts(monkeypatch, capsys, tmp_path):
     """Init should keep using a legacy config when the operator accepts it."""
     repo_root = tmp_path / "repo"
@@ -72,6 +72,28 @@ def test_close_closes_driver():
         mock_driver.return_value.close.assert_called_once()
 
 
+@pytest.mark.unit
+def test_shared_reuses_one_driver_per_credentials(monkeypatch):
+    """ConnectionManager.shared() builds one driver per credential triple and close() keeps it open."""
+    from agentic_memory.core import connection
+
+    monkeypatch.setattr(connection, "_SHARED_MANAGERS", {})
+    with patch("agentic_memory.core.connection.neo4j.GraphDatabase.driver") as mock_driver:
+        first = ConnectionManager.shared("bolt://localhost:7687", "neo4j", "password")
+        second = ConnectionManager.shared("bolt://localhost:7687", "neo4j", "password")
+        other = ConnectionManager.shared("bolt://other:7687", "neo4j", "password")
+
+        assert first is second
+        assert other is not first
+        assert mock_driver.call_count == 2
+
+        first.close()
+        mock_driver.return_value.close.assert_not_called()
+
+        connection._close_shared_managers()
+        assert mock_driver.return_value.close.call_count == 2
+
+
 @pytest.mark.unit
 def test_from_config(monkeypatch):
     """ConnectionManager.from_config reads uri/user/password from config dict."""
@@ -1,7 +1,9 @@
 """Tests for the KnowledgeGraphBuilder module."""
 
+import threading
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from agentic_memory.core.runtime_embedding import EmbeddingRuntimeConfig
 from agentic_memory.ingestion.python_call_analyzer import (
@@ -30,6 +32,11 @@ class TestKnowledgeGraphBuilder:
         """Create a mock Neo4j driver."""
         driver = Mock()
         session = Mock()
+        # Route explicit-transaction writes through the same recorded run().
+        session.begin_transaction.return_value = session
+        session.execute_write.side_effect = lambda work, *args, **kwargs: work(
+            session, *args, **kwargs
+        )
         driver.session.return_value.__enter__ = Mock(return_value=session)
         driver.session.return_value.__exit__ = Mock(return_value=False)
         return driver, session
@@ -56,6 +63,7 @@ class TestKnowledgeGraphBuilder:
         assert builder.EMBEDDING_MODEL == "text-embedding-3-large"
         assert builder.driver is not None
         assert ".claude" in builder.ignore_dirs
+        assert ".agentic-memory" in builder.ignore_dirs
 
     def test_initialization_keeps_builtin_ignore_dirs_when_custom_dirs_are_supplied(
         self,
@@ -249,10 +257,38 @@ class TestKnowledgeGraphBuilder:
         pass_2.assert_called_once_with(repo_root, target_paths=changed_paths)
         pass_3.assert_called_once_with(repo_root, target_paths=changed_paths)
 
+    def test_run_pipeline_shares_one_session_across_passes(
+        self, builder, mock_driver, monkeypatch, tmp_path
+    ):
+        """Every pass in one pipeline run should reuse a single Neo4j session."""
+        driver, session = mock_driver
+        seen = []
+
+        def _pass(*args, **kwargs):
+            with builder._shared_session() as active:
+                seen.append(active)
+            return ["src/changed.py"]
+
+        monkeypatch.setattr(builder, "setup_database", Mock())
+        monkeypatch.setattr(builder, "pass_1_structure_scan", _pass)
+        monkeypatch.setattr(builder, "pass_2_entity_definition", _pass)
+        monkeypatch.setattr(builder, "pass_3_imports", _pass)
+        driver.session.reset_mock()
+
+        builder.run_pipeline(tmp_path)
+
+        assert seen == [session, session, session]
+        driver.session.assert_called_once_with(fetch_size=builder.SESSION_FETCH_SIZE)
+
     def test_run_pipeline_returns_stage_timing_metrics(self, builder, monkeypatch, tmp_path):
         """Pipeline metrics should expose pass-level timings for slow-run diagnosis."""
         repo_root = tmp_path
         changed_paths = ["src/changed.py"]
+        cache_dir = tmp_path / "parse-cache"
+        cache_dir.mkdir()
+        (cache_dir / "stale.json").write_text("{}")
+        (cache_dir / ".gitignore").write_text("*\n")
+        monkeypatch.setenv("AM_PARSE_CACHE_DIR", str(cache_dir))
 
         monkeypatch.setattr(builder, "setup_database", Mock())
         monkeypatch.setattr(builder, "pass_1_structure_scan", Mock(return_value=changed_paths))
@@ -285,6 +321,11 @@ class TestKnowledgeGraphBuilder:
         """Full reindex should clear the repo-scoped code graph before scanning."""
         repo_root = tmp_path
         changed_paths = ["src/changed.py"]
+        cache_dir = tmp_path / "parse-cache"
+        cache_dir.mkdir()
+        (cache_dir / "stale.json").write_text("{}")
+        (cache_dir / ".gitignore").write_text("*\n")
+        monkeypatch.setenv("AM_PARSE_CACHE_DIR", str(cache_dir))
 
         monkeypatch.setattr(builder, "setup_database", Mock())
         clear_repo_code_graph = Mock()
@@ -296,9 +337,41 @@ class TestKnowledgeGraphBuilder:
         metrics = builder.run_pipeline(repo_root, full_reindex=True)
 
         clear_repo_code_graph.assert_called_once_with(repo_root)
+        assert list(cache_dir.glob("*.json")) == []
+        assert (cache_dir / ".gitignore").exists()
         assert metrics["full_reindex"] is True
         assert metrics["full_reindex_seconds"] >= 0
 
+    def test_run_pipeline_bulk_load_rebuilds_vector_index_after_pass_2(
+        self,
+        builder,
+        mock_driver,
+        monkeypatch,
+        tmp_path,
+    ):
+        """Bulk mode should drop the code vector index around Pass 2 only."""
+        _, session = mock_driver
+        repo_root = tmp_path
+        events = []
+
+        monkeypatch.setattr(builder, "setup_database", Mock())
+        monkeypatch.setattr(builder, "pass_1_structure_scan", Mock(return_value=["a.py"]))
+        monkeypatch.setattr(
+            builder, "pass_2_entity_definition", Mock(side_effect=lambda *a, **k: events.append("pass2"))
+        )
+        monkeypatch.setattr(builder, "pass_3_imports", Mock())
+        session.run.side_effect = lambda query, **kwargs: events.append(query.strip().split("\n")[0])
+
+        metrics = builder.run_pipeline(repo_root, bulk_load=True)
+
+        assert events == [
+            "DROP INDEX code_embeddings IF EXISTS",
+            "pass2",
+            "CREATE VECTOR INDEX code_embeddings IF NOT EXISTS",
+            "UNWIND $paths AS path",
+        ]
+        assert metrics["bulk_load"] is True
+
     def test_reindex_file_scopes_entity_and_import_passes_to_one_file(
         self,
         builder,
@@ -329,6 +402,77 @@ class TestKnowledgeGraphBuilder:
         pass_2.assert_called_once_with(repo_root, target_paths={"pkg/a.py"})
         pass_3.assert_called_once_with(repo_root, target_paths={"pkg/a.py"})
 
+    def test_reindex_files_runs_entity_and_import_passes_once_per_batch(
+        self,
+        builder,
+        mock_driver,
+        monkeypatch,
+        tmp_path,
+    ):
+        """Watcher batches should rebuild every changed file in one Pass 2/3 run."""
+        repo_root = tmp_path
+        for name in ("a.py", "b.py"):
+            (repo_root / name).write_text("def foo():\n    return 1\n", encoding="utf8")
+
+        monkeypatch.setattr(builder, "_calculate_ohash", lambda path: "hash")
+        pass_2 = Mock()
+        pass_3 = Mock()
+        monkeypatch.setattr(builder, "pass_2_entity_definition", pass_2)
+        monkeypatch.setattr(builder, "pass_3_imports", pass_3)
+
+        builder.reindex_files(["a.py", "b.py", "a.py"], repo_path=repo_root)
+
+        pass_2.assert_called_once_with(repo_root, target_paths={"a.py", "b.py"})
+        pass_3.assert_called_once_with(repo_root, target_paths={"a.py", "b.py"})
+
+        # Files that vanished mid-burst are skipped rather than failing the batch.
+        builder.reindex_files(["a.py", "missing.py"], repo_path=repo_root)
+        pass_2.assert_called_with(repo_root, target_paths={"a.py"})
+
+        with pytest.raises(FileNotFoundError):
+            builder.reindex_file("missing.py", repo_path=repo_root)
+
+    def test_reindex_files_propagates_unreadable_file_errors(
+        self, builder, monkeypatch, tmp_path
+    ):
+        """A file that exists but cannot be read should not be reported as removed."""
+        (tmp_path / "locked.py").write_text("x = 1\n", encoding="utf8")
+        monkeypatch.setattr(
+            builder, "_hash_file", Mock(side_effect=PermissionError("denied"))
+        )
+        pass_2 = Mock()
+        monkeypatch.setattr(builder, "pass_2_entity_definition", pass_2)
+
+        with pytest.raises(PermissionError):
+            builder.reindex_files(["locked.py"], repo_path=tmp_path)
+        pass_2.assert_not_called()
+
+    def test_reindex_files_can_force_inline_parsing(self, builder, monkeypatch, tmp_path):
+        """parallel_parse=False should keep large batches off the process pool."""
+        repo_root = tmp_path
+        rel_paths = [f"m{index}.py" for index in range(builder.PARALLEL_PARSE_MIN_FILES)]
+        for rel_path in rel_paths:
+            (repo_root / rel_path).write_text("x = 1\n", encoding="utf8")
+
+        monkeypatch.setattr(builder, "_parse_worker_count", lambda: 4)
+        monkeypatch.setattr(builder, "_calculate_ohash", lambda path: "hash")
+        seen_inline = []
+
+        def fake_pass_2(repo_path, target_paths):
+            seen_inline.append(builder._parse_inline)
+            with patch("agentic_memory.ingestion.graph.ProcessPoolExecutor") as pool_cls:
+                list(builder._iter_parsed_files(repo_path, sorted(target_paths)))
+                pool_cls.assert_not_called()
+
+        monkeypatch.setattr(builder, "pass_2_entity_definition", fake_pass_2)
+        monkeypatch.setattr(builder, "pass_3_imports", Mock())
+        monkeypatch.setattr(builder, "_parse_source_file", lambda path: (b"", {}))
+
+        builder.reindex_files(rel_paths, repo_path=repo_root, parallel_parse=False)
+
+        assert seen_inline == [True]
+        assert builder._parse_inline is False
+
     def test_build_calls_delegates_to_explicit_pass_4(self, builder, monkeypatch, tmp_path):
         """Experimental CALLS builds should still route through Pass 4 explicitly."""
         repo_root = tmp_path
@@ -339,6 +483,393 @@ class TestKnowledgeGraphBuilder:
 
         pass_4.assert_called_once_with(repo_root)
 
+    def test_pass_2_batches_chunk_embeddings_across_files(
+        self,
+        builder,
+        mock_driver,
+        monkeypatch,
+        tmp_path,
+    ):
+        """Pass 2 should embed chunks from several files in one provider batch."""
+        _, session = mock_driver
+        repo_root = tmp_path
+        for name in ("a.py", "b.py"):
+            (repo_root / name).write_text("def f():\n    return 1\n", encoding="utf8")
+
+        monkeypatch.setattr(
+            builder,
+            "_parse_source_file",
+            lambda path: (
+                "",
+                {
+                    "classes": [],
+                    "functions": [{"name": "f", "code": "def f():\n    return 1\n"}],
+                },
+            ),
+        )
+        monkeypatch.setattr(builder, "_calculate_ohash", lambda path: "hash")
+        embed_batch = Mock(side_effect=lambda texts: [[0.1] for _ in texts])
+        monkeypatch.setattr(builder, "get_document_embeddings_batch", embed_batch)
+        session.run.return_value = []
+        builder.repo_root = repo_root
+
+        builder.pass_2_entity_definition(repo_root, target_paths={"a.py", "b.py"})
+
+        embed_batch.assert_called_once()
+        assert len(embed_batch.call_args.args[0]) == 2
+        chunk_writes = [
+            call
+            for call in session.run.call_args_list
+            if "UNWIND $rows AS r" in call.args[0] and "CREATE (ch:Chunk" in call.args[0]
+        ]
+        assert len(chunk_writes) == 1
+        assert [row["path"] for row in chunk_writes[0].kwargs["rows"]] == ["a.py", "b.py"]
+
+    def test_pass_2_embeds_next_batch_while_writing_previous(
+        self,
+        builder,
+        mock_driver,
+        monkeypatch,
+        tmp_path,
+    ):
+        """A flush should submit its embeddings before the prior batch is written."""
+        _, session = mock_driver
+        repo_root = tmp_path
+        for name in ("a.py", "b.py"):
+            (repo_root / name).write_text("pass\n", encoding="utf8")
+        monkeypatch.setattr(
+            builder,
+            "_parse_source_file",
+            lambda path: (
+                "",
+                {"classes": [], "functions": [{"name": path.stem, "code": "pass"}]},
+            ),
+        )
+        monkeypatch.setattr(builder, "_calculate_ohash", lambda path: "hash")
+        monkeypatch.setattr(builder, "EMBED_FLUSH_MAX_TEXTS", 1)
+        second_batch_started = threading.Event()
+        overlapped = []
+
+        def embed(texts):
+            if any("b.py" in text for text in texts):
+                second_batch_started.set()
+            return [[0.1] for _ in texts]
+
+        def commit():
+            if not overlapped:
+                overlapped.append(second_batch_started.wait(timeout=5))
+
+        monkeypatch.setattr(builder, "get_document_embeddings_batch", embed)
+        session.commit.side_effect = commit
+        session.run.return_value = []
+
+        builder.pass_2_entity_definition(repo_root, target_paths={"a.py", "b.py"})
+
+        assert overlapped == [True]
+        assert session.commit.call_count == 2
+
+    def test_pass_2_writes_entities_and_chunks_in_one_transaction(
+        self,
+        builder,
+        mock_driver,
+        monkeypatch,
+        tmp_path,
+    ):
+        """Each definition kind should be one UNWIND query inside one committed transaction."""
+        _, session = mock_driver
+        tx = Mock()
+        session.begin_transaction.return_value = tx
+        session.run.return_value = []
+        repo_root = tmp_path
+        (repo_root / "a.py").write_text("pass\n", encoding="utf8")
+        monkeypatch.setattr(
+            builder,
+            "_parse_source_file",
+            lambda path: (
+                "",
+                {
+                    "classes": [{"name": "A", "code": "class A: ..."}],
+                    "functions": [
+                        {"name": "m", "qualified_name": "A.m", "parent_class": "A", "code": "def m(self): ..."},
+                        {"name": "f", "code": "def f(): ..."},
+                    ],
+                },
+            ),
+        )
+        monkeypatch.setattr(builder, "_calculate_ohash", lambda path: "hash")
+        monkeypatch.setattr(
+            builder,
+            "get_document_embeddings_batch",
+            Mock(side_effect=lambda texts: [[0.1] for _ in texts]),
+        )
+
+        builder.pass_2_entity_definition(repo_root, target_paths={"a.py"})
+
+        entity_writes = [call for call in tx.run.call_args_list if "CREATE (ch:Chunk" in call.args[0]]
+        assert len(entity_writes) == 2
+        function_rows = entity_writes[1].kwargs["rows"]
+        assert [row["class_sig"] for row in function_rows] == ["a.py:A", None]
+        assert "HAS_METHOD" in entity_writes[1].args[0]
+        tx.commit.assert_called_once()
+        assert not any("CREATE (ch:Chunk" in call.args[0] for call in session.run.call_args_list)
+
+    def test_pass_2_reuses_stored_and_duplicate_chunk_embeddings(
+        self,
+        builder,
+        mock_driver,
+        monkeypatch,
+        tmp_path,
+    ):
+        """Known content hashes and in-run duplicates should skip the provider."""
+        _, session = mock_driver
+        repo_root = tmp_path
+        (repo_root / "a.py").write_text("pass\n", encoding="utf8")
+        functions = [
+            {"name": "same", "code": "def same(): pass"},
+            {"name": "new", "code": "def new(): pass"},
+        ]
+        classes = [{"name": "Dup", "code": "class Dup: pass"}]
+        monkeypatch.setattr(
+            builder,
+            "_parse_source_file",
+            lambda path: ("", {"classes": classes + classes, "functions": functions}),
+        )
+        monkeypatch.setattr(builder, "_calculate_ohash", lambda path: "hash")
+        stored_hash = builder._embedding_content_hash(
+            "Context: File: a.py > Method: same\n\ndef same(): pass"
+        )
+
+        def run(query, **kwargs):
+            if "content_hash: h" in query:
+                return [{"hash": stored_hash, "embedding": [0.5]}]
+            return []
+
+        session.run.side_effect = run
+        embed_batch = Mock(side_effect=lambda texts: [[0.1] for _ in texts])
+        monkeypatch.setattr(builder, "get_document_embeddings_batch", embed_batch)
+
+        builder.pass_2_entity_definition(repo_root, target_paths={"a.py"})
+
+        embedded = embed_batch.call_args.args[0]
+        assert len(embedded) == 2
+        assert not any("Method: same" in text for text in embedded)
+        function_chunks = [
+            call.kwargs["rows"]
+            for call in session.run.call_args_list
+            if "CREATE (ch:Chunk" in call.args[0] and "signature: r.sig" in call.args[0]
+        ][0]
+        assert function_chunks[0]["embedding"] == [0.5]
+        assert function_chunks[0]["content_hash"] == stored_hash
+
+    def test_pass_1_upserts_changed_files_in_one_unwind(
+        self,
+        builder,
+        mock_driver,
+        tmp_path,
+    ):
+        """Pass 1 should read stored hashes once and MERGE changed files in bulk."""
+        _, session = mock_driver
+        repo_root = tmp_path
+        for name in ("a.py", "b.py", "c.py"):
+            (repo_root / name).write_text(f"# {name}\n", encoding="utf8")
+        unchanged_hash = builder._calculate_ohash(repo_root / "c.py")
+        session.run.return_value = [{"path": "c.py", "hash": unchanged_hash}]
+
+        changed = builder.pass_1_structure_scan(repo_root)
+
+        assert sorted(changed) == ["a.py", "b.py"]
+        file_merges = [
+            call for call in session.run.call_args_list if "MERGE (f:File" in call.args[0]
+        ]
+        assert len(file_merges) == 1
+        assert sorted(row["path"] for row in file_merges[0].kwargs["rows"]) == ["a.py", "b.py"]
+
+    def test_pass_1_applies_glob_ignore_files_and_graphignore_patterns(
+        self,
+        builder,
+        mock_driver,
+        tmp_path,
+    ):
+        """Glob ignore_files and .graphignore patterns should skip files in Pass 1."""
+        _, session = mock_driver
+        repo_root = tmp_path
+        (repo_root / "pkg" / "gen").mkdir(parents=True)
+        for rel in ("keep.py", "old.archived.py", "pkg/a.py", "pkg/gen/b.py", "pkg/c_test.py"):
+            (repo_root / rel).write_text("# x\n", encoding="utf8")
+        builder.ignore_files = {"*.archived.py"}
+        builder.ignore_patterns = {"pkg/gen/", "*_test.py"}
+        session.run.return_value = []
+
+        changed = builder.pass_1_structure_scan(repo_root)
+
+        assert sorted(changed) == ["keep.py", "pkg/a.py"]
+
+    def test_pass_1_rebuilds_files_left_dirty_by_an_unfinished_run(
+        self,
+        builder,
+        mock_driver,
+        tmp_path,
+    ):
+        """A matching ohash should not hide a file an earlier run never finished."""
+        _, session = mock_driver
+        repo_root = tmp_path
+        (repo_root / "a.py").write_text("# a\n", encoding="utf8")
+        stored_hash = builder._calculate_ohash(repo_root / "a.py")
+        session.run.return_value = [{"path": "a.py", "hash": stored_hash, "dirty": True}]
+
+        changed = builder.pass_1_structure_scan(repo_root)
+
+        assert changed == ["a.py"]
+        file_merge = next(
+            call for call in session.run.call_args_list if "MERGE (f:File" in call.args[0]
+        )
+        assert "f.dirty = true" in file_merge.args[0]
+
+    def test_pass_1_prunes_stored_files_missing_from_walk_in_bulk(
+        self,
+        builder,
+        mock_driver,
+        tmp_path,
+    ):
+        """Stored File paths the walk no longer visits should be deleted together."""
+        _, session = mock_driver
+        repo_root = tmp_path
+        (repo_root / "keep.py").write_text("# keep\n", encoding="utf8")
+        session.run.return_value = [
+            {"path": "keep.py", "hash": builder._calculate_ohash(repo_root / "keep.py")},
+            {"path": "gone.py", "hash": "old"},
+            {"path": "notes.md", "hash": "old"},
+        ]
+
+        changed = builder.pass_1_structure_scan(repo_root)
+
+        assert changed == []
+        deletes = [
+            call for call in session.run.call_args_list if "DETACH DELETE f" in call.args[0]
+        ]
+        assert len(deletes) == 1
+        assert deletes[0].kwargs["paths"] == ["gone.py", "notes.md"]
+
+    def test_iter_parsed_files_uses_process_pool_for_large_batches(
+        self,
+        builder,
+        monkeypatch,
+        tmp_path,
+    ):
+        """Large parse batches should fan out to worker processes in input order."""
+        repo_root = tmp_path
+        for name in ("a.py", "b.py"):
+            (repo_root / name).write_text(f"def {name[0]}():\n    pass\n", encoding="utf8")
+        monkeypatch.setenv("AM_PARSE_WORKERS", "2")
+        monkeypatch.setattr(builder, "PARALLEL_PARSE_MIN_FILES", 1)
+        inline_parse = Mock()
+        monkeypatch.setattr(builder, "_parse_source_file", inline_parse)
+
+        results = list(builder._iter_parsed_files(repo_root, ["a.py", "missing.py", "b.py"]))
+
+        inline_parse.assert_not_called()
+        assert [rel_path for rel_path, _, _, _ in results] == ["a.py", "missing.py", "b.py"]
+        assert results[1][2:] == (None, True)
+        assert [fn["name"] for fn in results[0][2]["functions"]] == ["a"]
+        assert [fn["name"] for fn in results[2][2]["functions"]] == ["b"]
+
+    def test_bounded_map_caps_tasks_in_flight(self):
+        """Pool results should stream in order without submitting every item up front."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from agentic_memory.ingestion import graph
+
+        submitted = []
+
+        def _square(value):
+            return value * value
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            real_submit = pool.submit
+
+            def _submit(fn, item):
+                submitted.append(item)
+                return real_submit(fn, item)
+
+            pool.submit = _submit
+            results = graph._bounded_map(pool, _square, range(10), window=3)
+
+            assert next(results) == 0
+            assert submitted == [0, 1, 2]
+            assert list(results) == [value * value for value in range(1, 10)]
+
+    def test_shared_parse_cache_parses_each_file_once_across_passes(
+        self,
+        builder,
+        monkeypatch,
+        tmp_path,
+    ):
+        """Passes inside one shared-cache block should reuse the first parse."""
+        repo_root = tmp_path
+        (repo_root / "a.py").write_text("def a():\n    pass\n", encoding="utf8")
+        parsed = {"classes": [], "functions": [], "imports": []}
+        parse = Mock(return_value=("", parsed))
+        monkeypatch.setattr(builder, "_parse_source_file", parse)
+
+        with builder._shared_parse_cache():
+            first = list(builder._iter_parsed_files(repo_root, ["a.py"]))
+            second = list(builder._iter_parsed_files(repo_root, ["a.py"]))
+
+        parse.assert_called_once()
+        assert first[0][2] is second[0][2] is parsed
+        assert builder._parse_cache is None
+
+    def test_calculate_ohash_streams_blake2b_digest(self, builder, tmp_path):
+        """File hashes should be 128-bit BLAKE2b digests, empty for unreadable files."""
+        import hashlib
+
+        source = tmp_path / "big.py"
+        payload = b"x = 1\n" * (1 << 19)
+        source.write_bytes(payload)
+
+        assert builder._calculate_ohash(source) == hashlib.blake2b(
+            payload, digest_size=16
+        ).hexdigest()
+        assert builder._calculate_ohash(tmp_path / "missing.py") == ""
+
+    def test_setup_database_recreates_code_index_on_dimension_change(
+        self,
+        builder,
+        mock_driver,
+        monkeypatch,
+    ):
+        """Reduced code-embedding dimensions should rebuild a stale vector index."""
+        _, session = mock_driver
+        builder.VECTOR_DIMENSIONS = 1024
+        monkeypatch.setattr(
+            builder._conn,
+            "_existing_vector_index_dims",
+            lambda: {"code_embeddings": 3072},
+        )
+
+        builder.setup_database()
+
+        queries = [call.args[0] for call in session.run.call_args_list]
+        assert queries[0] == "DROP INDEX code_embeddings IF EXISTS"
+        vector_ddl = next(q for q in queries if "CREATE VECTOR INDEX code_embeddings" in q)
+        assert "`vector.dimensions`: 1024" in vector_ddl
+
+    def test_clear_repo_code_graph_uses_label_scoped_matches(
+        self,
+        builder,
+        mock_driver,
+        tmp_path,
+    ):
+        """Repo reset should never fall back to an unlabeled all-node scan."""
+        _, session = mock_driver
+
+        builder.clear_repo_code_graph(tmp_path)
+
+        queries = [" ".join(call.args[0].split()) for call in session.run.call_args_list]
+        assert not any(q.startswith("MATCH (n) ") for q in queries)
+        for label in ("Chunk", "Function", "Class"):
+            assert f"MATCH (n:{label} {{repo_id: $repo_id}}) DETACH DELETE n" in queries
+
     def test_extract_js_ts_import_modules(self, builder):
         """Test JS/TS import extraction supports common import syntaxes."""
         code = """
@@ -369,6 +900,64 @@ const lazy = import("./lazy-module");
         assert "frontend/src/services/heygen_service.tsx" in candidates
         assert "frontend/src/services/heygen_service/index.ts" in candidates
 
+    def test_pass_3_links_src_layout_imports_by_unique_path_suffix(
+        self,
+        builder,
+        mock_driver,
+        monkeypatch,
+        tmp_path,
+    ):
+        """Absolute imports that miss at repo root should resolve by unique suffix."""
+        _, session = mock_driver
+        repo_root = tmp_path
+        (repo_root / "app.py").write_text("import pkg.utils\nimport json\n", encoding="utf8")
+        session.run.return_value = [
+            {"path": "app.py"},
+            {"path": "src/pkg/utils.py"},
+            {"path": "src/pkg/json.py"},
+        ]
+        monkeypatch.setattr(
+            builder,
+            "_parse_source_file",
+            lambda path: ("", {"imports": ["pkg.utils", "json"]}),
+        )
+
+        builder.pass_3_imports(repo_root, target_paths={"app.py"})
+
+        import_writes = [
+            call for call in session.run.call_args_list if "MERGE (source)-[:IMPORTS]" in call.args[0]
+        ]
+        assert len(import_writes) == 1
+        assert import_writes[0].kwargs["rows"] == [{"src": "app.py", "target": "src/pkg/utils.py"}]
+
+    def test_pass_3_deletes_only_missing_files_not_unreadable_ones(
+        self,
+        builder,
+        mock_driver,
+        monkeypatch,
+        tmp_path,
+    ):
+        """A transient read failure must not drop the File node from the graph."""
+        _, session = mock_driver
+        (tmp_path / "locked.py").write_text("import os\n", encoding="utf8")
+        session.run.return_value = [{"path": "locked.py"}, {"path": "gone.py"}]
+
+        def _parse(full_path):
+            if full_path.name == "locked.py":
+                raise PermissionError("denied")
+            raise FileNotFoundError(full_path)
+
+        monkeypatch.setattr(builder, "_parse_source_file", _parse)
+
+        builder.pass_3_imports(tmp_path)
+
+        deletes = [
+            call.kwargs["path"]
+            for call in session.run.call_args_list
+            if "DETACH DELETE f" in call.args[0]
+        ]
+        assert deletes == ["gone.py"]
+
     def test_pass_4_call_graph_prefers_typescript_analyzer_results(
         self,
         builder,
@@ -388,6 +977,7 @@ const lazy = import("./lazy-module");
                 "path": "src/a.ts",
                 "funcs": [
                     {
+                        "id": "4:fn:src/a.ts:foo",
                         "name": "foo",
                         "sig": "src/a.ts:foo",
                         "qualified_name": "foo",
@@ -401,6 +991,7 @@ const lazy = import("./lazy-module");
                 "path": "src/b.ts",
                 "funcs": [
                     {
+                        "id": "4:fn:src/b.ts:bar",
                         "name": "bar",
                         "sig": "src/b.ts:bar",
                         "qualified_name": "bar",
@@ -411,7 +1002,7 @@ const lazy = import("./lazy-module");
                 ],
             },
         ]
-        session.run.side_effect = [initial_records] + [None] * 12
+        session.run.side_effect = [initial_records] + [Mock() for _ in range(12)]
 
         parsed_by_path = {
             "src/a.ts": {
@@ -479,12 +1070,15 @@ const lazy = import("./lazy-module");
         builder.pass_4_call_graph(repo_root)
 
         write_calls = [
-            call for call in session.run.call_args_list if "SET r.source = $source" in call.args[0]
+            call for call in session.run.call_args_list if "SET r.source = row.source" in call.args[0]
         ]
         assert len(write_calls) == 1
-        assert write_calls[0].kwargs["source"] == "typescript_service"
-        assert write_calls[0].kwargs["confidence"] == pytest.approx(0.95)
-        assert write_calls[0].kwargs["callee_sigs"] == ["src/b.ts:bar"]
+        assert len(write_calls[0].kwargs["rows"]) == 1
+        row = write_calls[0].kwargs["rows"][0]
+        assert row["source"] == "typescript_service"
+        assert row["confidence"] == pytest.approx(0.95)
+        assert row["caller_id"] == "4:fn:src/a.ts:foo"
+        assert row["callee_ids"] == ["4:fn:src/b.ts:bar"]
 
     def test_pass_4_call_graph_prefers_python_analyzer_results(
         self,
@@ -507,6 +1101,7 @@ const lazy = import("./lazy-module");
                 "path": "pkg/a.py",
                 "funcs": [
                     {
+                        "id": "4:fn:pkg/a.py:foo",
                         "name": "foo",
                         "sig": "pkg/a.py:foo",
                         "qualified_name": "foo",
@@ -520,6 +1115,7 @@ const lazy = import("./lazy-module");
                 "path": "pkg/b.py",
                 "funcs": [
                     {
+                        "id": "4:fn:pkg/b.py:bar",
                         "name": "bar",
                         "sig": "pkg/b.py:bar",
                         "qualified_name": "bar",
@@ -530,7 +1126,7 @@ const lazy = import("./lazy-module");
                 ],
             },
         ]
-        session.run.side_effect = [initial_records] + [None] * 12
+        session.run.side_effect = [initial_records] + [Mock() for _ in range(12)]
 
         parsed_by_path = {
             "pkg/a.py": {
@@ -599,12 +1195,15 @@ const lazy = import("./lazy-module");
         builder.pass_4_call_graph(repo_root)
 
         write_calls = [
-            call for call in session.run.call_args_list if "SET r.source = $source" in call.args[0]
+            call for call in session.run.call_args_list if "SET r.source = row.source" in call.args[0]
         ]
         assert len(write_calls) == 1
-        assert write_calls[0].kwargs["source"] == "python_service"
-        assert write_calls[0].kwargs["confidence"] == pytest.approx(0.95)
-        assert write_calls[0].kwargs["callee_sigs"] == ["pkg/b.py:bar"]
+        assert len(write_calls[0].kwargs["rows"]) == 1
+        row = write_calls[0].kwargs["rows"][0]
+        assert row["source"] == "python_service"
+        assert row["confidence"] == pytest.approx(0.95)
+        assert row["caller_id"] == "4:fn:pkg/a.py:foo"
+        assert row["callee_ids"] == ["4:fn:pkg/b.py:bar"]
 
     def test_get_call_diagnostics_summarizes_sources_and_coverage(self, builder, mock_driver):
         """CALLS diagnostics should surface coverage and provenance ratios for one repo."""
@@ -684,6 +1283,267 @@ const lazy = import("./lazy-module");
         assert diagnostics["analyzer_issues"][0]["source"] == "typescript_service"
         assert diagnostics["analyzer_issues"][0]["status"] == "failed"
 
+    def test_build_calls_waits_for_indexes_before_pass_4(
+        self,
+        builder,
+        mock_driver,
+        monkeypatch,
+    ):
+        """The explicit CALLS build should not start while indexes are populating."""
+        _, session = mock_driver
+        events = []
+        session.run.side_effect = lambda query, **kwargs: events.append(query)
+        monkeypatch.setattr(
+            builder, "pass_4_call_graph", lambda *args, **kwargs: events.append("pass4")
+        )
+
+        builder.build_calls()
+
+        assert events == ["CALL db.awaitIndexes($timeout)", "pass4"]
+
+    def test_pass_4_batches_call_edges_across_files(
+        self,
+        builder,
+        mock_driver,
+        monkeypatch,
+        tmp_path,
+    ):
+        """Parser-only CALLS from several files should share one UNWIND write."""
+        _, session = mock_driver
+        repo_root = tmp_path
+        for name in ("a.py", "b.py"):
+            (repo_root / name).write_text("pass\n", encoding="utf8")
+        builder.repo_root = repo_root
+        builder.repo_id = str(repo_root)
+        file_records = [
+            {
+                "path": path,
+                "funcs": [
+                    {"id": f"id:{path}:{name}", "sig": f"{path}:{name}"}
+                    for name in ("caller", "callee")
+                ],
+            }
+            for path in ("a.py", "b.py")
+        ]
+
+        def _run_side_effect(*args, **kwargs):
+            if "collect({" in args[0]:
+                return file_records
+            return Mock()
+
+        session.run.side_effect = _run_side_effect
+        functions = [
+            {"qualified_name": "caller", "name": "caller", "calls": ["callee"]},
+            {"qualified_name": "callee", "name": "callee", "calls": []},
+        ]
+        monkeypatch.setattr(
+            builder, "_build_function_signature_indexes", lambda *args, **kwargs: ({}, {}, {})
+        )
+        monkeypatch.setattr(
+            builder,
+            "_prepare_typescript_analysis_requests",
+            lambda **_: ({path: {"functions": functions} for path in ("a.py", "b.py")}, []),
+        )
+        monkeypatch.setattr(builder, "_prepare_python_analysis_requests", lambda **_: [])
+
+        builder.pass_4_call_graph(repo_root)
+
+        write_calls = [
+            call for call in session.run.call_args_list if "MERGE (caller)-[r:CALLS]" in call.args[0]
+        ]
+        assert len(write_calls) == 1
+        assert [
+            (row["caller_id"], row["callee_ids"]) for row in write_calls[0].kwargs["rows"]
+        ] == [
+            ("id:a.py:caller", ["id:a.py:callee"]),
+            ("id:b.py:caller", ["id:b.py:callee"]),
+        ]
+
+    def test_pass_4_flushes_call_edges_on_background_writer(
+        self,
+        builder,
+        mock_driver,
+        monkeypatch,
+        tmp_path,
+    ):
+        """Full CALLS batches should be written off-thread while later files are processed."""
+        _, session = mock_driver
+        for name in ("a.py", "b.py"):
+            (tmp_path / name).write_text("pass\n", encoding="utf8")
+        builder.repo_root = tmp_path
+        builder.repo_id = str(tmp_path)
+        builder.CALL_EDGE_FLUSH_SIZE = 1
+        file_records = [
+            {
+                "path": path,
+                "funcs": [
+                    {"id": f"id:{path}:{name}", "sig": f"{path}:{name}"}
+                    for name in ("caller", "callee")
+                ],
+            }
+            for path in ("a.py", "b.py")
+        ]
+        writer_threads = []
+
+        def _run_side_effect(*args, **kwargs):
+            if "collect({" in args[0]:
+                return file_records
+            if "MERGE (caller)-[r:CALLS]" in args[0]:
+                writer_threads.append(threading.current_thread().name)
+            return Mock()
+
+        session.run.side_effect = _run_side_effect
+        functions = [
+            {"qualified_name": "caller", "name": "caller", "calls": ["callee"]},
+            {"qualified_name": "callee", "name": "callee", "calls": []},
+        ]
+        monkeypatch.setattr(
+            builder, "_build_function_signature_indexes", lambda *args, **kwargs: ({}, {}, {})
+        )
+        monkeypatch.setattr(
+            builder,
+            "_prepare_typescript_analysis_requests",
+            lambda **_: ({path: {"functions": functions} for path in ("a.py", "b.py")}, []),
+        )
+        monkeypatch.setattr(builder, "_prepare_python_analysis_requests", lambda **_: [])
+
+        builder.pass_4_call_graph(tmp_path)
+
+        assert len(writer_threads) == 2
+        assert writer_threads[0].startswith("am-calls")
+        assert writer_threads[1] == threading.current_thread().name
+
+    def test_iter_parsed_files_skips_unreadable_files(self, builder, monkeypatch, tmp_path):
+        """A read failure should skip that file instead of aborting the pass."""
+        for name in ("ok.py", "locked.py"):
+            (tmp_path / name).write_text("def f():\n    pass\n", encoding="utf8")
+        real_parse = builder._parse_source_file
+
+        def _parse(full_path):
+            if full_path.name == "locked.py":
+                raise PermissionError("denied")
+            return real_parse(full_path)
+
+        monkeypatch.setattr(builder, "_parse_source_file", _parse)
+
+        results = list(builder._iter_parsed_files(tmp_path, ["locked.py", "ok.py"]))
+
+        assert [
+            (rel_path, parsed is None, missing) for rel_path, _, parsed, missing in results
+        ] == [
+            ("locked.py", True, False),
+            ("ok.py", False, False),
+        ]
+
+    def test_iter_parsed_files_detects_deleted_files_at_read_time(
+        self, builder, monkeypatch, tmp_path
+    ):
+        """Missing files should come back as None without a stat per path."""
+        from pathlib import Path
+
+        (tmp_path / "ok.py").write_text("def f():\n    pass\n", encoding="utf8")
+        monkeypatch.setattr(Path, "exists", Mock(side_effect=AssertionError("stat")))
+
+        results = list(builder._iter_parsed_files(tmp_path, ["gone.py", "ok.py", "gone.py"]))
+
+        assert [
+            (rel_path, parsed is None, missing) for rel_path, _, parsed, missing in results
+        ] == [
+            ("gone.py", True, True),
+            ("ok.py", False, False),
+            ("gone.py", True, True),
+        ]
+
+    def test_pass_4_propagates_call_edge_write_failures(
+        self,
+        builder,
+        mock_driver,
+        monkeypatch,
+        tmp_path,
+    ):
+        """A CALLS write that fails after driver retries should not be swallowed."""
+        import neo4j
+
+        _, session = mock_driver
+        (tmp_path / "a.py").write_text("pass\n", encoding="utf8")
+        builder.repo_root = tmp_path
+        builder.repo_id = str(tmp_path)
+        file_records = [
+            {
+                "path": "a.py",
+                "funcs": [
+                    {"id": f"id:{name}", "sig": f"a.py:{name}"} for name in ("caller", "callee")
+                ],
+            }
+        ]
+
+        def _run_side_effect(*args, **kwargs):
+            if "collect({" in args[0]:
+                return file_records
+            if "MERGE (caller)-[r:CALLS]" in args[0]:
+                raise neo4j.exceptions.DatabaseError("write failed")
+            return Mock()
+
+        session.run.side_effect = _run_side_effect
+        functions = [
+            {"qualified_name": "caller", "name": "caller", "calls": ["callee"]},
+            {"qualified_name": "callee", "name": "callee", "calls": []},
+        ]
+        monkeypatch.setattr(
+            builder, "_build_function_signature_indexes", lambda *args, **kwargs: ({}, {}, {})
+        )
+        monkeypatch.setattr(
+            builder,
+            "_prepare_typescript_analysis_requests",
+            lambda **_: ({"a.py": {"functions": functions}}, []),
+        )
+        monkeypatch.setattr(builder, "_prepare_python_analysis_requests", lambda **_: [])
+
+        with pytest.raises(neo4j.exceptions.DatabaseError):
+            builder.pass_4_call_graph(tmp_path)
+
+    def test_pass_4_skips_static_calls_to_unknown_functions(
+        self,
+        builder,
+        mock_driver,
+        monkeypatch,
+        tmp_path,
+    ):
+        """Parser-only calls should only target functions already in the graph."""
+        _, session = mock_driver
+        (tmp_path / "a.py").write_text("pass\n", encoding="utf8")
+        builder.repo_root = tmp_path
+        builder.repo_id = str(tmp_path)
+        file_records = [
+            {"path": "a.py", "funcs": [{"id": "id:caller", "sig": "a.py:caller"}]},
+        ]
+
+        def _run_side_effect(*args, **kwargs):
+            if "collect({" in args[0]:
+                return file_records
+            return Mock()
+
+        session.run.side_effect = _run_side_effect
+        functions = [
+            {"qualified_name": "caller", "name": "caller", "calls": ["len", "helper"]},
+            {"qualified_name": "helper", "name": "helper", "calls": []},
+        ]
+        monkeypatch.setattr(
+            builder, "_build_function_signature_indexes", lambda *args, **kwargs: ({}, {}, {})
+        )
+        monkeypatch.setattr(
+            builder,
+            "_prepare_typescript_analysis_requests",
+            lambda **_: ({"a.py": {"functions": functions}}, []),
+        )
+        monkeypatch.setattr(builder, "_prepare_python_analysis_requests", lambda **_: [])
+
+        builder.pass_4_call_graph(tmp_path)
+
+        assert not [
+            call for call in session.run.call_args_list if "MERGE (caller)-[r:CALLS]" in call.args[0]
+        ]
+
     def test_pass_4_records_typescript_analyzer_batch_failures(
         self, builder, mock_driver, monkeypatch, tmp_path
     ):
@@ -769,6 +1629,7 @@ const lazy = import("./lazy-module");
                 "path": "src/a.ts",
                 "funcs": [
                     {
+                        "id": "4:fn:src/a.ts:foo",
                         "name": "foo",
                         "sig": "src/a.ts:foo",
                         "qualified_name": "foo",
@@ -782,6 +1643,7 @@ const lazy = import("./lazy-module");
                 "path": "src/b.ts",
                 "funcs": [
                     {
+                        "id": "4:fn:src/b.ts:bar",
                         "name": "bar",
                         "sig": "src/b.ts:bar",
                         "qualified_name": "bar",
@@ -906,6 +1768,7 @@ const lazy = import("./lazy-module");
                 "path": "pkg/a.py",
                 "funcs": [
                     {
+                        "id": "4:fn:pkg/a.py:foo",
                         "name": "foo",
                         "sig": "pkg/a.py:foo",
                         "qualified_name": "foo",
@@ -919,6 +1782,7 @@ const lazy = import("./lazy-module");
                 "path": "pkg/b.py",
                 "funcs": [
                     {
+                        "id": "4:fn:pkg/b.py:bar",
                         "name": "bar",
                         "sig": "pkg/b.py:bar",
                         "qualified_name": "bar",
@@ -1052,6 +1916,368 @@ const lazy = import("./lazy-module");
         assert session.run.call_args.kwargs["repo_id"] == "repo-beta"
         assert session.run.call_args.kwargs["path"] == "src/shared/helpers.ts"
 
+    def test_get_index_stats_reads_all_counts_in_one_query(self, builder, mock_driver):
+        """Index status should come back from a single repo-scoped round trip."""
+        _, session = mock_driver
+        session.run.return_value.single.return_value = {
+            "files": 3,
+            "functions": 7,
+            "classes": 2,
+            "chunks": 11,
+            "last_updated": "2026-02-01T00:00:00Z",
+        }
+
+        stats = builder.get_index_stats(repo_id="repo-alpha")
+
+        assert stats == {
+            "files": 3,
+            "functions": 7,
+            "classes": 2,
+            "chunks": 11,
+            "last_sync": "2026-02-01T00:00:00Z",
+        }
+        session.run.assert_called_once()
+        assert session.run.call_args.kwargs == {"repo_id": "repo-alpha"}
+        for label in ("File", "Function", "Class", "Chunk"):
+            assert f":{label} {{repo_id: $repo_id}})" in session.run.call_args.args[0]
+
+        builder.get_index_stats(global_scope=True)
+        assert session.run.call_args.kwargs == {}
+        assert "repo_id" not in session.run.call_args.args[0]
+
+    def test_get_index_stats_without_a_record_reports_zero_counts(self, builder, mock_driver):
+        """A query that yields no row should read as an empty index, not raise."""
+        _, session = mock_driver
+        session.run.return_value.single.return_value = None
+
+        assert builder.get_index_stats(repo_id="repo-alpha") == {
+            "files": 0,
+            "functions": 0,
+            "classes": 0,
+            "chunks": 0,
+            "last_sync": None,
+        }
+
+    def test_progress_throttle_limits_updates_but_always_shows_last(self, monkeypatch):
+        """Progress lines should be rate-limited except for the final item."""
+        from agentic_memory.ingestion import pipeline_support
+
+        now = [100.0]
+        monkeypatch.setattr(pipeline_support.time, "monotonic", lambda: now[0])
+        progress = pipeline_support.ProgressThrottle(interval=0.1)
+
+        assert progress.ready()
+        now[0] += 0.05
+        assert not progress.ready()
+        assert progress.ready(final=True)
+        now[0] += 0.2
+        assert progress.ready()
+
+
+
+class TestLegacyKnowledgeGraphBuilder:
+    """Behavior tests for the legacy ``codememory`` KnowledgeGraphBuilder."""
+
+    @pytest.fixture
+    def mock_driver(self):
+        """Create a mock Neo4j driver whose managed writes hit ``session.run``."""
+        driver = Mock()
+        session = Mock()
+        session.execute_write.side_effect = lambda work, *args, **kwargs: work(
+            session, *args, **kwargs
+        )
+        driver.session.return_value.__enter__ = Mock(return_value=session)
+        driver.session.return_value.__exit__ = Mock(return_value=False)
+        return driver, session
+
+    @pytest.fixture
+    def builder(self, mock_driver):
+        """Create a legacy builder with a mocked driver and no OpenAI client."""
+        from codememory.ingestion.graph import KnowledgeGraphBuilder
+
+        driver, _ = mock_driver
+        with patch("neo4j.GraphDatabase.driver", return_value=driver):
+            builder = KnowledgeGraphBuilder(
+                uri="bolt://localhost:7687", user="neo4j", password="test", openai_key=None
+            )
+        builder.driver = driver
+        return builder
+
+    def test_extract_file_definitions_skips_missing_and_unsupported_files(self, tmp_path):
+        """Missing files and extensions without a grammar should yield no rows."""
+        from codememory.ingestion.graph import _extract_file_definitions
+
+        (tmp_path / "notes.md").write_text("# notes\n", encoding="utf8")
+
+        assert _extract_file_definitions(str(tmp_path / "gone.py"), "gone.py") is None
+        assert _extract_file_definitions(str(tmp_path / "notes.md"), "notes.md") is None
+
+    def test_pass_2_parses_files_in_worker_processes(
+        self, builder, mock_driver, monkeypatch, tmp_path
+    ):
+        """Files should parse in a process pool and be written back in order."""
+        from codememory.ingestion import graph as legacy_graph
+
+        _, session = mock_driver
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / name).write_text(f"def {name[0]}():\n    pass\n", encoding="utf8")
+        session.run.return_value = [{"path": name} for name in ("a.py", "b.py", "c.py")]
+        monkeypatch.setattr(builder, "PARALLEL_PARSE_MIN_FILES", 1)
+        monkeypatch.setenv("AM_PARSE_WORKERS", "2")
+        monkeypatch.setenv("AM_WRITE_WORKERS", "1")
+        pools = []
+
+        class _RecordingPool(legacy_graph.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+
+        monkeypatch.setattr(legacy_graph, "ProcessPoolExecutor", _RecordingPool)
+        written = []
+
+        def _write(session, *, rel_path, class_rows, function_rows):
+            written.append((rel_path, [row["name"] for row in function_rows]))
+
+        monkeypatch.setattr(builder, "_write_file_entities", _write)
+
+        builder.pass_2_entity_definition(tmp_path)
+
+        assert len(pools) == 1
+        assert written == [("a.py", ["a"]), ("b.py", ["b"]), ("c.py", ["c"])]
+
+    def test_interrupted_run_rebuilds_files_left_dirty_by_pass_1(
+        self, builder, mock_driver, monkeypatch, tmp_path
+    ):
+        """A file whose hash was stored before Pass 2 died should be rebuilt next run."""
+        _, session = mock_driver
+        (tmp_path / "a.py").write_text("def a():\n    pass\n", encoding="utf8")
+        stored_hash = builder._calculate_ohash(tmp_path / "a.py")
+
+        def _run(cypher, **params):
+            if "f.dirty as dirty" in cypher:
+                # Previous run: hash already current, but Pass 2 never cleared the flag.
+                return [{"path": "a.py", "hash": stored_hash, "dirty": True}]
+            if "WHERE f.dirty" in cypher:
+                return [{"path": "a.py"}]
+            return MagicMock()
+
+        session.run.side_effect = _run
+        monkeypatch.setattr(builder, "get_embeddings", lambda texts: [[0.0]] * len(texts))
+
+        builder.pass_1_structure_scan(tmp_path)
+        builder.pass_2_entity_definition(tmp_path)
+
+        cyphers = [call.args[0] for call in session.run.call_args_list]
+        upserts = [
+            call.kwargs["path"]
+            for call in session.run.call_args_list
+            if "MERGE (f:File {path: $path})" in call.args[0]
+        ]
+        assert upserts == ["a.py"]
+        assert any("f.dirty = true" in cypher for cypher in cyphers)
+        function_writes = [
+            call.kwargs["rows"]
+            for call in session.run.call_args_list
+            if "MERGE (fn:Function {signature: row.sig})" in call.args[0]
+        ]
+        assert [row["sig"] for row in function_writes[0]] == ["a.py:a"]
+        assert any("REMOVE f.dirty" in cypher for cypher in cyphers)
+
+    def test_pass_3_resolves_fuzzy_imports_against_known_paths(
+        self, builder, mock_driver, tmp_path
+    ):
+        """Unresolved modules should fuzzy-match the in-memory path list."""
+        _, session = mock_driver
+        (tmp_path / "app.py").write_text("import pkg.util\nimport os\n", encoding="utf8")
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "pkg" / "util.py").write_text("", encoding="utf8")
+        known = ["app.py", "src/pkg/util.py"]
+
+        def _run(cypher, **params):
+            if "RETURN f.path as path" in cypher:
+                return [{"path": path} for path in known]
+            return Mock()
+
+        session.run.side_effect = _run
+
+        builder.pass_3_imports(tmp_path)
+
+        merges = [
+            call.kwargs
+            for call in session.run.call_args_list
+            if "MERGE (source)-[:IMPORTS]->(target)" in call.args[0]
+        ]
+        assert merges == [{"src": "app.py", "targets": ["src/pkg/util.py"]}]
+        assert not any("CONTAINS" in call.args[0] for call in session.run.call_args_list)
+
+    def test_get_embeddings_restores_input_order_from_response_index(self, builder):
+        """Batched embeddings should come back in input order, per batch."""
+        builder.EMBED_BATCH_SIZE = 2
+
+        def _create(input, model):
+            data = [
+                Mock(index=index, embedding=[float(text[-1])])
+                for index, text in enumerate(input)
+            ]
+            return Mock(data=list(reversed(data)), usage=Mock(total_tokens=5))
+
+        builder.openai_client = Mock()
+        builder.openai_client.embeddings.create.side_effect = _create
+
+        vectors = builder.get_embeddings(["t1", "t2", "t3"])
+
+        assert vectors == [[1.0], [2.0], [3.0]]
+        assert builder.openai_client.embeddings.create.call_count == 2
+        assert builder.token_usage["embedding_calls"] == 2
+        assert builder.token_usage["embedding_tokens"] == 10
+
+    def test_get_embeddings_without_client_returns_zero_vectors(self, builder):
+        """No OpenAI key should degrade to one zero vector per input."""
+        vectors = builder.get_embeddings(["a", "b"])
+
+        assert vectors == [[0.0] * builder.VECTOR_DIMENSIONS] * 2
+        assert builder.get_embeddings([]) == []
+
+    def test_extract_file_definitions_reads_docstrings_and_methods(self, tmp_path):
+        """Definition rows should carry names, docstrings and class context."""
+        from codememory.ingestion.graph import _extract_file_definitions
+
+        source = tmp_path / "mod.py"
+        source.write_text(
+            'class Greeter:\n'
+            '    """Says hello."""\n'
+            '    def greet(self):\n'
+            '        """Return a greeting."""\n'
+            '        return "hi"\n'
+            '\n'
+            'def helper():\n'
+            '    return 1\n',
+            encoding="utf8",
+        )
+
+        class_rows, function_rows = _extract_file_definitions(str(source), "mod.py")
+
+        assert [(row["sig"], row["docstring"]) for row in class_rows] == [
+            ("mod.py:Greeter", "Says hello.")
+        ]
+        assert [
+            (row["sig"], row["name"], row["docstring"], row["class_sig"])
+            for row in function_rows
+        ] == [
+            ("mod.py:Greeter.greet", "greet", "Return a greeting.", "mod.py:Greeter"),
+            ("mod.py:helper", "helper", None, None),
+        ]
+        assert function_rows[0]["enriched_text"].startswith(
+            "Context: File: mod.py > Class: Greeter > Method: greet\n\n"
+        )
+
+    def test_pass_2_writes_files_on_writer_threads(
+        self, builder, mock_driver, monkeypatch, tmp_path
+    ):
+        """Parsed files should be written concurrently on the writer pool."""
+        _, session = mock_driver
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / name).write_text(f"def {name[0]}():\n    pass\n", encoding="utf8")
+        session.run.return_value = [{"path": name} for name in ("a.py", "b.py", "c.py")]
+        monkeypatch.setenv("AM_PARSE_WORKERS", "1")
+        monkeypatch.setenv("AM_WRITE_WORKERS", "2")
+        written = {}
+
+        def _write(session, *, rel_path, class_rows, function_rows):
+            written[rel_path] = (
+                threading.current_thread().name,
+                [row["name"] for row in function_rows],
+            )
+
+        monkeypatch.setattr(builder, "_write_file_entities", _write)
+
+        builder.pass_2_entity_definition(tmp_path)
+
+        assert {path: names for path, (_, names) in written.items()} == {
+            "a.py": ["a"],
+            "b.py": ["b"],
+            "c.py": ["c"],
+        }
+        assert all(thread.startswith("cm-write") for thread, _ in written.values())
+
+    def test_pass_4_stages_callees_then_joins_once(self, builder, mock_driver, tmp_path):
+        """Call names should be staged per function and linked in one join."""
+        _, session = mock_driver
+        (tmp_path / "m.py").write_text(
+            "def a():\n    b()\n\ndef b():\n    pass\n", encoding="utf8"
+        )
+
+        def _run(cypher, **params):
+            if "RETURN DISTINCT f.path as path" in cypher:
+                return [{"path": "m.py"}]
+            return Mock()
+
+        session.run.side_effect = _run
+
+        builder.pass_4_call_graph(tmp_path)
+
+        staged = [
+            call.kwargs["rows"]
+            for call in session.run.call_args_list
+            if "SET fn.callees = row.callees" in call.args[0]
+        ]
+        joins = [
+            call
+            for call in session.run.call_args_list
+            if "MERGE (caller)-[:CALLS]->(callee)" in call.args[0]
+        ]
+        assert staged == [[{"sig": "m.py:a", "callees": ["b"]}]]
+        assert len(joins) == 1
+        assert "IN TRANSACTIONS" in joins[0].args[0]
+
+    def test_bounded_map_zips_iterables_in_order_with_capped_window(self):
+        """Results should stream in input order with at most ``window`` in flight."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from codememory.ingestion.graph import _bounded_map
+
+        submitted = []
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            original_submit = pool.submit
+
+            def _submit(fn, *args):
+                submitted.append(args)
+                return original_submit(fn, *args)
+
+            pool.submit = _submit
+            results = _bounded_map(
+                pool, lambda a, b: a + b, [1, 2, 3, 4], [10, 20, 30, 40], window=2
+            )
+
+            assert next(results) == 11
+            assert submitted == [(1, 10), (2, 20)]
+            assert list(results) == [22, 33, 44]
+
+    def test_calls_by_function_attributes_calls_to_innermost_def(self):
+        """Each call should belong to the innermost function around it."""
+        from codememory.ingestion.graph import _calls_by_function
+        from codememory.ingestion.parser import get_parser
+
+        code = (
+            b"setup()\n"
+            b"def outer():\n"
+            b"    first()\n"
+            b"    def inner():\n"
+            b"        nested()\n"
+            b"    second()\n"
+            b"    first()\n"
+            b"class Box:\n"
+            b"    def open(self):\n"
+            b"        unlock()\n"
+        )
+        tree = get_parser(".py").parse(code)
+
+        assert _calls_by_function(code, tree, "m.py") == {
+            "m.py:outer": ["first", "second"],
+            "m.py:inner": ["nested"],
+            "m.py:Box.open": ["unlock"],
+        }
+
 
 class TestCypherQueries:
     """Test Cypher query generation and execution."""
@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+import os
+import threading
+
 import pytest
 
-from agentic_memory.ingestion.parser import CodeParser
+from agentic_memory.ingestion.parser import (
+    CodeParser,
+    get_worker_parser,
+    parse_source_cached,
+    parse_source_path,
+    prune_parse_cache,
+)
+from codememory.ingestion import parser as legacy_parser
 
 
 @pytest.fixture()
@@ -220,3 +230,184 @@ def print_banner() -> None:
 
     assert qualified_names[:2] == ["_command_example", "print_banner"]
     assert result["functions"][0]["name"] == "_command_example"
+
+
+def test_parse_source_path_matches_parse_file(parser: CodeParser, tmp_path) -> None:
+    """The process-pool entry point should return the same rows as parse_file."""
+    code = "import os\n\ndef helper():\n    return os.getcwd()\n"
+    source = tmp_path / "mod.py"
+    source.write_text(code, encoding="utf8")
+
+    path, result = parse_source_path(str(source))
+
+    assert path == str(source)
+    assert result == parser.parse_file(code, ".py")
+
+
+def test_parsers_share_cached_grammars() -> None:
+    """Separate parser instances should reuse one Language per grammar."""
+    first = CodeParser()
+    second = CodeParser()
+
+    assert first.languages[".py"] is second.languages[".py"]
+    assert first.languages[".ts"] is second.languages[".js"]
+    assert first.parsers[".ts"] is first.parsers[".jsx"]
+
+
+def test_each_definition_keeps_its_own_name() -> None:
+    """Sibling definitions should each be named from their own name node."""
+    parser = CodeParser()
+    code = (
+        "@decorator\n"
+        "def first():\n"
+        "    pass\n\n"
+        "def second():\n"
+        "    pass\n\n"
+        "class Third:\n"
+        "    def method(self):\n"
+        "        pass\n"
+    )
+
+    result = parser.parse_file(code, ".py")
+
+    assert [fn["name"] for fn in result["functions"]] == ["first", "second", "method"]
+    assert [cls["name"] for cls in result["classes"]] == ["Third"]
+
+
+def test_parse_file_accepts_raw_utf8_bytes() -> None:
+    """Raw bytes should parse exactly like decoded text, including non-ASCII."""
+    parser = CodeParser()
+    code = '"""Café ☕ banner."""\n\ndef résumé():\n    return naïve()\n'
+
+    from_bytes = parser.parse_file(code.encode("utf8"), ".py")
+
+    assert from_bytes == parser.parse_file(code, ".py")
+    assert from_bytes["functions"][0]["name"] == "résumé"
+    assert from_bytes["functions"][0]["calls"] == ["naïve"]
+
+
+def test_worker_parser_is_reused_per_thread_and_not_shared() -> None:
+    """Each thread should keep its own parser while reusing the grammars."""
+    main_parser = get_worker_parser()
+    other: list[CodeParser] = []
+    thread = threading.Thread(target=lambda: other.append(get_worker_parser()))
+    thread.start()
+    thread.join()
+
+    assert get_worker_parser() is main_parser
+    assert other[0] is not main_parser
+    assert other[0].languages[".py"] is main_parser.languages[".py"]
+
+
+def test_file_level_calls_are_deduplicated() -> None:
+    """A callee used by several functions should appear once per file."""
+    parser = CodeParser()
+    code = "def a():\n    len(x)\n    len(y)\n\ndef b():\n    len(z)\n    print(z)\n"
+
+    result = parser.parse_file(code, ".py")
+
+    assert result["calls"] == ["len", "print"]
+
+
+def test_parse_source_cached_reuses_result_for_same_bytes(tmp_path, monkeypatch) -> None:
+    """A warm cache entry should skip Tree-sitter for unchanged file bytes."""
+    parser = CodeParser()
+    code = b"def a():\n    b()\n"
+
+    first = parse_source_cached(code, ".py", tmp_path, parser=parser)
+    monkeypatch.setattr(parser, "parse_file", lambda *args: pytest.fail("cache miss"))
+    second = parse_source_cached(code, ".py", tmp_path, parser=parser)
+
+    assert second == first
+    assert len(list(tmp_path.glob("*.json"))) == 1
+    assert (tmp_path / ".gitignore").read_text().splitlines()[-1] == "*"
+
+
+def test_parse_cache_key_changes_with_package_version(tmp_path, monkeypatch) -> None:
+    """Upgrading agent-memory-labs should not serve parses from the old extractors."""
+    import importlib.metadata
+
+    from agentic_memory.ingestion import parser as parser_module
+
+    code = b"def a():\n    b()\n"
+    real_version = importlib.metadata.version
+
+    def _version(dist: str) -> str:
+        return "99.0" if dist == "agent-memory-labs" else real_version(dist)
+
+    parse_source_cached(code, ".py", tmp_path)
+    parser_module._parse_cache_salt.cache_clear()
+    monkeypatch.setattr(importlib.metadata, "version", _version)
+    try:
+        parse_source_cached(code, ".py", tmp_path)
+    finally:
+        parser_module._parse_cache_salt.cache_clear()
+
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+
+def test_prune_parse_cache_drops_least_recently_used_entries(tmp_path) -> None:
+    """Pruning should keep the newest entries and leave non-entry files alone."""
+    for index in range(5):
+        entry = tmp_path / f"{index}.json"
+        entry.write_text("{}")
+        os.utime(entry, ns=(index * 10**9, index * 10**9))
+    (tmp_path / ".gitignore").write_text("*\n")
+
+    removed = prune_parse_cache(tmp_path, max_entries=2)
+
+    assert removed == 3
+    assert sorted(path.name for path in tmp_path.glob("*.json")) == ["3.json", "4.json"]
+    assert (tmp_path / ".gitignore").exists()
+
+
+def test_legacy_code_parser_extracts_definitions_and_calls() -> None:
+    """The legacy parser should share grammars and keep its result shape."""
+    code = "import os\n\nclass A:\n    def f(self):\n        g(os.getenv('KEY'))\n"
+
+    result = legacy_parser.get_code_parser().parse_file(code, ".py")
+
+    assert legacy_parser.get_code_parser() is legacy_parser.get_code_parser()
+    assert [cls["name"] for cls in result["classes"]] == ["A"]
+    assert [(fn["name"], fn["parent_class"]) for fn in result["functions"]] == [("f", "A")]
+    assert result["imports"] == ["os"]
+    assert result["calls"] == ["g"]
+    assert result["env_vars"] == [{"type": "read", "name": "KEY", "line": 5}]
+    assert legacy_parser.CodeParser().parse_file(code, ".rb")["classes"] == []
+
+
+@pytest.mark.parametrize(
+    "edited",
+    [
+        "def a():\n    return b() + c()\n\ndef z():\n    pass\n",
+        "def a():\n    return 1\n",
+        "class Café:\n    pass\n\ndef a():\n    return b()\n\ndef z():\n    pass\n",
+        "",
+    ],
+)
+def test_incremental_reparse_matches_fresh_parse(edited: str) -> None:
+    """Reparsing an edited file from its cached tree should match a fresh parse."""
+    cache = legacy_parser.IncrementalParseCache()
+    original = "def a():\n    return b()\n\ndef z():\n    pass\n".encode("utf8")
+    cache.parse("m.py", ".py", original)
+
+    tree = cache.parse("m.py", ".py", edited.encode("utf8"))
+
+    fresh = legacy_parser.get_parser(".py").parse(edited.encode("utf8"))
+    assert str(tree.root_node) == str(fresh.root_node)
+    assert tree.root_node.end_byte == len(edited.encode("utf8"))
+
+
+def test_incremental_parse_cache_is_bounded_and_reuses_unchanged_trees() -> None:
+    """Unchanged bytes should reuse the cached tree; old entries are evicted."""
+    cache = legacy_parser.IncrementalParseCache(max_entries=2)
+    first = cache.parse("a.py", ".py", b"x = 1\n")
+
+    assert cache.parse("a.py", ".py", b"x = 1\n") is first
+
+    cache.parse("b.py", ".py", b"y = 2\n")
+    cache.parse("c.py", ".py", b"z = 3\n")
+    assert cache.parse("a.py", ".py", b"x = 1\n") is not first
+
+    cache.discard("a.py")
+    assert "a.py" not in cache._entries